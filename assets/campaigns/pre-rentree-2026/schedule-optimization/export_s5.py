@@ -22,26 +22,27 @@ PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
 if str(PDF_GENERATOR_DIR) not in sys.path:
     sys.path.insert(0, str(PDF_GENERATOR_DIR))
 
-from itinerary import assign_itinerary, enumerate_selections, MAX_STUDENT_IDLE_MINUTES  # noqa: E402
-from pre_rentree_data import PreRentreeData  # noqa: E402
+from itinerary import ItineraryIndex, enumerate_selections, MAX_STUDENT_IDLE_MINUTES  # noqa: E402
+from pre_rentree_data import shared_data  # noqa: E402
 
 OUT_DIR = Path(__file__).parent
 LEVELS = ("TROISIEME", "SECONDE", "PREMIERE", "TERMINALE")
 
 
 def main() -> None:
-    data = PreRentreeData(REPO_ROOT)
+    data = shared_data(REPO_ROOT)
     all_sessions = [s for level in LEVELS for s in data.dated_slots_for_level(level)]
+    index = ItineraryIndex(all_sessions)
 
     # ── selection-matrix-s5.csv : every non-empty subject subset up to 4 (the
-    # Premium pack ceiling), per level, scored via assign_itinerary. ──────────
+    # Premium pack ceiling), per level, scored via the itinerary index. ──────────
     with (OUT_DIR / "selection-matrix-s5.csv").open("w", newline="", encoding="utf-8") as fh:
         writer = csv.writer(fh)
         writer.writerow(["level", "subjects", "status", "maxIdleMinutes", "totalIdleMinutes", "daysPresent"])
         for level in LEVELS:
             subjects = data.subjects_for_level(level)
             for selection in enumerate_selections(subjects, 4):
-                result = assign_itinerary(level, list(selection), all_sessions).itinerary
+                result = index.assign(level, selection).itinerary
                 writer.writerow([
                     level, "+".join(selection), result.status,
                     result.max_idle_minutes, result.total_idle_minutes, result.days_present,
@@ -56,7 +57,7 @@ def main() -> None:
             subjects = list(data.subjects_for_level(level))
             for i in range(len(subjects)):
                 for j in range(i + 1, len(subjects)):
-                    result = assign_itinerary(level, [subjects[i], subjects[j]], all_sessions).itinerary
+                    result = index.assign(level, (subjects[i], subjects[j])).itinerary
                     writer.writerow([level, subjects[i], subjects[j], result.status, result.max_idle_minutes])
 
     # ── teacher-load-s5.csv : hours per teacher role per window, from the raw
@@ -136,7 +137,7 @@ def main() -> None:
     verification = {"level": "TERMINALE", "maxStudentIdleMinutes": MAX_STUDENT_IDLE_MINUTES, "combos": []}
     all_compliant = True
     for combo in required_combos_by_level["TERMINALE"]:
-        result = assign_itinerary("TERMINALE", list(combo), all_sessions).itinerary
+        result = index.assign("TERMINALE", combo).itinerary
         compliant = result.status != "SIMULTANEOUS" and result.max_idle_minutes <= MAX_STUDENT_IDLE_MINUTES
         all_compliant = all_compliant and compliant
         verification["combos"].append({
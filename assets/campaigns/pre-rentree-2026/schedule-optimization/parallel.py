@@ -0,0 +1,34 @@
+"""Process-pool fan-out for the schedule solvers.
+
+The solvers split their search space into independent chunks (one duplicated
+subset, or one first-teacher-role block permutation inside it). Chunks run on
+a ProcessPoolExecutor and their results always come back in submission order,
+so merging them with the same strict `<` the serial loop uses keeps the first
+optimum and the output JSON is byte-identical to a --jobs 1 run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Sequence
+
+
+def add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes (default: all cores; 1 runs serially in-process)",
+    )
+
+
+def map_ordered(function: Callable, argument_tuples: Iterable[Sequence], jobs: int) -> list:
+    """function(*arguments) for every tuple, in submission order."""
+    argument_tuples = list(argument_tuples)
+    if jobs <= 1 or len(argument_tuples) <= 1:
+        return [function(*arguments) for arguments in argument_tuples]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(argument_tuples))) as pool:
+        futures = [pool.submit(function, *arguments) for arguments in argument_tuples]
+        return [future.result() for future in futures]
@@ -0,0 +1,128 @@
+"""Declarative what-if scenario models for scenario_solver.py.
+
+A model file (scenario-*.model.json) declares everything the old per-scenario
+solver scripts hard-coded as module constants: the day's blocks, which rooms
+are open on which block, the (level, subject, teacherRole) entries to place,
+the subjects allowed a duplicate cohort and the subject combinations that
+must stay compact. Loading validates every cross-reference so a typo fails
+here, explicitly, instead of silently shrinking the search space.
+
+    {
+      "scenarioId": "S5-TERMINALE",
+      "description": "...",
+      "representativeDate": "2026-08-24",
+      "blocks": [{"id": "A", "startTime": "09:00", "endTime": "11:00"}, ...],
+      "rooms": [{"id": "salle-1", "blocks": ["A", "B", "C", "D"]},
+                {"id": "salle-3", "blocks": ["C"], "extra": true}],
+      "entries": [{"level": "TERMINALE", "subject": "NSI", "teacherRole": "TEACHER_A_MATHS_NSI"}, ...],
+      "duplicationCandidates": [{"level": "TERMINALE", "subject": "NSI"}, ...],
+      "requiredCombos": [{"level": "TERMINALE", "subjects": ["MATHEMATIQUES", "NSI"]}, ...]
+    }
+
+Rooms flagged "extra" are last-resort resources: the solver ranks candidates
+by how many entries they host, after the itinerary score.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class Entry:
+    level: str
+    subject: str
+    teacher_role: str
+    cohort: int  # 0 for the declared cohort, 1 for its duplicate
+
+
+@dataclass(frozen=True)
+class Room:
+    room_id: str
+    blocks: tuple
+    extra: bool
+
+
+@dataclass(frozen=True)
+class ScenarioModel:
+    scenario_id: str
+    description: str
+    representative_date: str
+    blocks: tuple  # block ids, chronological
+    block_times: tuple  # ((block id, (start, end)), ...) — hashable for per-model caches
+    rooms: tuple  # tuple[Room, ...], declaration order = room preference order
+    base_entries: tuple  # ((level, subject, teacherRole), ...)
+    duplication_candidates: tuple  # ((level, subject), ...)
+    required_combos: tuple  # ((level, (subject, ...)), ...)
+
+    @property
+    def times(self) -> dict:
+        return dict(self.block_times)
+
+    def rooms_for(self, block: str) -> tuple:
+        """Room ids open on `block`, in preference order (extra rooms last)."""
+        ordinary = [room.room_id for room in self.rooms if block in room.blocks and not room.extra]
+        extra = [room.room_id for room in self.rooms if block in room.blocks and room.extra]
+        return tuple(ordinary + extra)
+
+    @property
+    def extra_rooms(self) -> frozenset:
+        return frozenset(room.room_id for room in self.rooms if room.extra)
+
+    def entries(self, duplicated: tuple = ()) -> list:
+        """Declared entries, each immediately followed by its duplicate cohort
+        when its (level, subject) is in `duplicated`."""
+        result = []
+        for level, subject, role in self.base_entries:
+            result.append(Entry(level, subject, role, 0))
+            if (level, subject) in duplicated:
+                result.append(Entry(level, subject, role, 1))
+        return result
+
+    def duplication_subsets(self, size: int) -> list:
+        return list(itertools.combinations(self.duplication_candidates, size))
+
+
+def load_model(path: Path) -> ScenarioModel:
+    return model_from_dict(json.loads(Path(path).read_text(encoding="utf-8")), source=str(path))
+
+
+def model_from_dict(raw: dict, source: str = "<model>") -> ScenarioModel:
+    blocks = tuple(block["id"] for block in raw["blocks"])
+    block_times = tuple((block["id"], (block["startTime"], block["endTime"])) for block in raw["blocks"])
+    if len(set(blocks)) != len(blocks):
+        raise ValueError(f"{source}: duplicate block ids {blocks}")
+
+    rooms = tuple(
+        Room(room["id"], tuple(room.get("blocks", blocks)), bool(room.get("extra", False))) for room in raw["rooms"]
+    )
+    for room in rooms:
+        unknown = set(room.blocks) - set(blocks)
+        if unknown:
+            raise ValueError(f"{source}: room {room.room_id} opens on unknown blocks {sorted(unknown)}")
+
+    base_entries = tuple((e["level"], e["subject"], e["teacherRole"]) for e in raw["entries"])
+    scheduled = [(level, subject) for level, subject, _ in base_entries]
+    if len(set(scheduled)) != len(scheduled):
+        raise ValueError(f"{source}: each (level, subject) must be declared once; use duplicationCandidates for cohorts")
+
+    candidates = tuple((c["level"], c["subject"]) for c in raw.get("duplicationCandidates", ()))
+    combos = tuple((c["level"], tuple(c["subjects"])) for c in raw["requiredCombos"])
+    for level, subject in [*candidates, *((level, s) for level, subjects in combos for s in subjects)]:
+        if (level, subject) not in scheduled:
+            raise ValueError(f"{source}: {level}/{subject} is referenced but has no entry")
+
+    return ScenarioModel(
+        scenario_id=raw["scenarioId"],
+        description=raw.get("description", ""),
+        representative_date=raw["representativeDate"],
+        blocks=blocks,
+        block_times=block_times,
+        rooms=rooms,
+        base_entries=base_entries,
+        duplication_candidates=candidates,
+        required_combos=combos,
+    )
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""Generic what-if schedule solver driven by a declarative scenario model.
+
+    python scenario_solver.py scenario-s5-terminale.model.json [--search branch-and-bound] [--jobs N]
+
+For every subset of the model's duplication candidates, smallest first, it
+searches every teacher-conflict-free (block, room) placement of the model's
+entries and keeps the first one minimizing, in this lexicographic order:
+  1. required combinations left SIMULTANEOUS
+  2. required combinations left LONG_IDLE (> MAX_STUDENT_IDLE_MINUTES)
+  3. idle minutes of those long-idle combinations
+  4. entries hosted by rooms the model flags as "extra"
+Each required combination is scored on its BEST cohort pick, mirroring what
+the real itinerary-assignment engine does for a family.
+
+This is the single search core behind solver_s5.py and
+solver_s5_premiere.py: ScoringEngine lookup tables (scoring.py), optional
+branch-and-bound (search.py) and process-pool chunking (parallel.py). A new
+scenario is a scenario-*.model.json file (see scenario_model.py) and this
+one command.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import itertools
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
+if str(PDF_GENERATOR_DIR) not in sys.path:
+    sys.path.insert(0, str(PDF_GENERATOR_DIR))
+
+from itinerary import MAX_STUDENT_IDLE_MINUTES  # noqa: E402
+from parallel import add_jobs_argument, map_ordered  # noqa: E402
+from pre_rentree_data import ScheduledSlot  # noqa: E402
+from scenario_model import ScenarioModel, load_model  # noqa: E402
+from scoring import ScoringEngine  # noqa: E402
+from search import SEARCH_MODES, branch_and_bound  # noqa: E402
+
+
+@functools.lru_cache(maxsize=None)
+def engine_for(model: ScenarioModel) -> ScoringEngine:
+    return ScoringEngine(model.times, model.blocks)
+
+
+def teacher_groups(entries) -> list[list[int]]:
+    """Entry indices per teacher role, roles in first-appearance order."""
+    by_teacher = defaultdict(list)
+    for index, entry in enumerate(entries):
+        by_teacher[entry.teacher_role].append(index)
+    return list(by_teacher.values())
+
+
+def first_role_block_choices(model: ScenarioModel, entries) -> list[tuple]:
+    """Block permutations of the first teacher role — the chunk boundary the
+    parallel driver splits one subset's search space on."""
+    return list(itertools.permutations(model.blocks, len(teacher_groups(entries)[0])))
+
+
+def enumerate_assignments(model: ScenarioModel, entries, first_role_blocks=None):
+    """Yields every (entry -> (block, room)) mapping where a teacher role
+    occupies at most one room per block and every entry sits in a room open
+    on its block, with the number of entries hosted by extra rooms.
+    `first_role_blocks` pins the first teacher role to one block permutation."""
+    groups = teacher_groups(entries)
+    block_choices = [list(itertools.permutations(model.blocks, len(group))) for group in groups]
+    if first_role_blocks is not None:
+        block_choices[0] = [tuple(first_role_blocks)]
+    extra_rooms = model.extra_rooms
+    rooms_by_block = {block: model.rooms_for(block) for block in model.blocks}
+
+    for block_combo in itertools.product(*block_choices):
+        block_usage = defaultdict(list)
+        for group, blocks_for_role in zip(groups, block_combo):
+            for index, block in zip(group, blocks_for_role):
+                block_usage[block].append(entries[index])
+        if any(len(entries_in_block) > len(rooms_by_block[block]) for block, entries_in_block in block_usage.items()):
+            continue
+
+        blocks_with_entries = list(block_usage.keys())
+        room_options = [
+            list(itertools.permutations(rooms_by_block[block], len(block_usage[block])))
+            for block in blocks_with_entries
+        ]
+        for room_combo in itertools.product(*room_options):
+            assignment = {}
+            extra_room_uses = 0
+            for block, rooms_for_block in zip(blocks_with_entries, room_combo):
+                for entry, room in zip(block_usage[block], rooms_for_block):
+                    assignment[entry] = (block, room)
+                    if room in extra_rooms:
+                        extra_room_uses += 1
+            yield assignment, extra_room_uses
+
+
+def sessions_from_assignment(model: ScenarioModel, entries, assignment) -> dict:
+    """{entry: ScheduledSlot} on the model's representative date — the input
+    compute_itinerary() would need, kept to cross-check the lookup tables."""
+    times = model.times
+    result = {}
+    for entry in entries:
+        block, room = assignment[entry]
+        start, end = times[block]
+        result[entry] = ScheduledSlot(
+            level=entry.level, subject=entry.subject, block=block, room=room,
+            window_id="w", window_label="w", start_time=start, end_time=end, date=model.representative_date,
+        )
+    return result
+
+
+def combo_plan(model: ScenarioModel, entries) -> list[tuple]:
+    """For every required combination, every cohort pick as a tuple of entry
+    indices — in cohort order, so ties keep the declared cohort."""
+    indices_by_key = defaultdict(list)
+    for index, entry in enumerate(entries):
+        indices_by_key[(entry.level, entry.subject)].append(index)
+    return [
+        (level, combo, tuple(itertools.product(*(indices_by_key[(level, s)] for s in combo))))
+        for level, combo in model.required_combos
+    ]
+
+
+def score_blocks(engine: ScoringEngine, plan, bits):
+    simultaneous_count = 0
+    long_idle_count = 0
+    total_idle = 0
+    combo_results = []
+    for level, combo, picks in plan:
+        best = engine.best_outcome(picks, bits)
+        combo_results.append({"level": level, "combo": combo, "status": best.status, "maxIdleMinutes": best.max_idle_minutes})
+        if best.status == "SIMULTANEOUS":
+            simultaneous_count += 1
+        elif best.status == "LONG_IDLE":
+            long_idle_count += 1
+            total_idle += best.max_idle_minutes
+    return (simultaneous_count, long_idle_count, total_idle), combo_results
+
+
+def extra_room_lower_bound(model: ScenarioModel, engine: ScoringEngine, bits) -> int:
+    """Extra rooms are only needed once a block holds more entries than its
+    ordinary rooms — the minimum over every room layout of a block pattern."""
+    uses = 0
+    extra_rooms = model.extra_rooms
+    for block in model.blocks:
+        ordinary = sum(1 for room in model.rooms_for(block) if room not in extra_rooms)
+        uses += max(0, bits.count(engine.block_bit[block]) - ordinary)
+    return uses
+
+
+def search_chunk(model: ScenarioModel, duplicated: tuple, first_role_blocks=None) -> dict:
+    """Exhaustive search of one duplicated subset, optionally restricted to
+    one block permutation of the first teacher role."""
+    engine = engine_for(model)
+    entries = model.entries(duplicated)
+    plan = combo_plan(model, entries)
+    best = None
+    candidates = 0
+    for assignment, extra_room_uses in enumerate_assignments(model, entries, first_role_blocks):
+        candidates += 1
+        score, combo_results = score_blocks(engine, plan, [engine.block_bit[assignment[e][0]] for e in entries])
+        ranked = (*score, extra_room_uses)
+        if best is None or ranked < best["score"]:
+            best = {"score": ranked, "assignment": dict(assignment), "comboResults": combo_results}
+    return {"duplicated": duplicated, "candidates": candidates, **(best or {"score": None})}
+
+
+def merge_chunks(duplicated: tuple, chunks: list[dict]) -> dict:
+    """Chunks must be in enumeration order: keeping the first strictly better
+    one reproduces the serial loop's choice among tied optima."""
+    best = None
+    for chunk in chunks:
+        if chunk["score"] is not None and (best is None or chunk["score"] < best["score"]):
+            best = chunk
+    if best is None:
+        raise ValueError(f"No teacher-conflict-free assignment for duplicated subset {duplicated}")
+    return {**best, "candidates": sum(chunk["candidates"] for chunk in chunks)}
+
+
+def solve_branch_and_bound(model: ScenarioModel, duplicated: tuple) -> dict:
+    """Same optimum as search_chunk(), found by search.branch_and_bound().
+    Rooms are not branched on: each block's entries take its open rooms in
+    preference order, the first room permutation with the fewest extra-room
+    uses — the one the exhaustive loop keeps."""
+    engine = engine_for(model)
+    entries = model.entries(duplicated)
+    plan = combo_plan(model, entries)
+    pick_sets = [picks for _, _, picks in plan]
+    groups = teacher_groups(entries)
+    result = branch_and_bound(
+        groups,
+        [len(model.rooms_for(block)) for block in model.blocks],
+        lambda bits: (*engine.total_lower_bound(pick_sets, bits), extra_room_lower_bound(model, engine, bits)),
+        lambda bits: (*score_blocks(engine, plan, bits)[0], extra_room_lower_bound(model, engine, bits)),
+    )
+    if result.bits is None:
+        raise ValueError(f"No teacher-conflict-free assignment for duplicated subset {duplicated}")
+
+    block_usage = defaultdict(list)
+    for group in groups:
+        for index in group:
+            block_usage[model.blocks[result.bits[index].bit_length() - 1]].append(entries[index])
+    assignment = {}
+    for block, entries_in_block in block_usage.items():
+        for entry, room in zip(entries_in_block, model.rooms_for(block)):
+            assignment[entry] = (block, room)
+
+    _, combo_results = score_blocks(engine, plan, list(result.bits))
+    return {
+        "duplicated": duplicated,
+        "candidates": result.leaves_scored,
+        "score": result.rank,
+        "assignment": assignment,
+        "comboResults": combo_results,
+        "search": {"nodesExplored": result.nodes_explored, "subtreesPruned": result.subtrees_pruned},
+    }
+
+
+def solve_subset(model: ScenarioModel, duplicated: tuple, search: str = "exhaustive") -> dict:
+    if search == "branch-and-bound":
+        return solve_branch_and_bound(model, duplicated)
+    return merge_chunks(duplicated, [search_chunk(model, duplicated)])
+
+
+def solve_subsets(model: ScenarioModel, subsets: list, search: str = "exhaustive", jobs: int = 1) -> list[dict]:
+    """Every subset's result, in `subsets` order. Exhaustive search fans out
+    one chunk per (subset, first-role block permutation); branch-and-bound
+    fans out per subset only, because its node counters depend on the
+    incumbent a subset's search carries from one chunk to the next."""
+    if search == "branch-and-bound":
+        return map_ordered(solve_subset, [(model, subset, search) for subset in subsets], jobs)
+    tasks = [
+        (model, subset, blocks)
+        for subset in subsets
+        for blocks in first_role_block_choices(model, model.entries(subset))
+    ]
+    chunks = map_ordered(search_chunk, tasks, jobs)
+    return [
+        merge_chunks(subset, [chunk for chunk in chunks if chunk["duplicated"] == subset])
+        for subset in subsets
+    ]
+
+
+def sweep(model: ScenarioModel, search: str = "exhaustive", jobs: int = 1) -> list[tuple]:
+    """[(k, [result per k-subset of the duplication candidates]), ...] for
+    k = 0..len(candidates), every size searched in one parallel batch."""
+    subsets_by_size = [model.duplication_subsets(k) for k in range(len(model.duplication_candidates) + 1)]
+    results = iter(solve_subsets(model, [s for subsets in subsets_by_size for s in subsets], search, jobs))
+    return [(k, [next(results) for _ in subsets]) for k, subsets in enumerate(subsets_by_size)]
+
+
+def is_compliant(result: dict) -> bool:
+    return result["score"][0] == 0 and result["score"][1] == 0
+
+
+def result_json(result: dict) -> dict:
+    score = result["score"]
+    payload = {
+        "duplicated": [{"level": level, "subject": subject} for level, subject in result["duplicated"]],
+        "candidatesChecked": result["candidates"],
+        "bestScore": {
+            "simultaneousCombos": score[0],
+            "longIdleCombos": score[1],
+            "totalIdleMinutes": score[2],
+            "extraRoomUses": score[3],
+        },
+        "isFullyCompliant": is_compliant(result),
+        "assignment": [
+            {"level": e.level, "subject": e.subject, "cohort": e.cohort, "teacherRole": e.teacher_role, "block": a[0], "room": a[1]}
+            for e, a in result["assignment"].items()
+        ],
+        "comboResults": result["comboResults"],
+    }
+    if "search" in result:
+        payload.update({"search": "branch-and-bound", **result["search"]})
+    return payload
+
+
+def build_report(model: ScenarioModel, swept: list[tuple]) -> dict:
+    report = {
+        "scenarioId": model.scenario_id,
+        "maxStudentIdleMinutes": MAX_STUDENT_IDLE_MINUTES,
+        "searchedSubsetsBySize": {k: [result_json(r) for r in results] for k, results in swept},
+    }
+    for k, results in swept:
+        if any(is_compliant(r) for r in results):
+            report["provenMinimumAdditionalCohorts"] = k
+            report["compliantSubsetsAtMinimum"] = [
+                [{"level": level, "subject": subject} for level, subject in r["duplicated"]]
+                for r in results if is_compliant(r)
+            ]
+            break
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a declarative pré-rentrée schedule scenario model.")
+    parser.add_argument("model", type=Path, help="scenario-*.model.json file")
+    parser.add_argument("--search", choices=SEARCH_MODES, default="exhaustive")
+    add_jobs_argument(parser)
+    parser.add_argument("--output", type=Path, help="report path (default: <model>.solver-output.json next to the model)")
+    return parser.parse_args(argv)
+
+
+def default_output_path(model_path: Path) -> Path:
+    name = model_path.name.removesuffix(".json").removesuffix(".model")
+    return model_path.with_name(f"{name}.solver-output.json")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    model = load_model(args.model)
+    report = build_report(model, sweep(model, args.search, args.jobs))
+    out_path = args.output or default_output_path(args.model)
+    out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(json.dumps({
+        "provenMinimumAdditionalCohorts": report.get("provenMinimumAdditionalCohorts"),
+        "compliantSubsetsAtMinimum": report.get("compliantSubsetsAtMinimum"),
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
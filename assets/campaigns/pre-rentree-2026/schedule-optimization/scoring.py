@@ -0,0 +1,186 @@
+"""Table-driven itinerary scoring shared by the schedule solvers.
+
+Every solver candidate is scored on one representative day, where a student's
+itinerary depends only on WHICH blocks the chosen sessions occupy — never on
+the room. Each block is therefore encoded once as an integer interval and a
+bit, and the outcome itinerary.compute_itinerary() would give for every set
+of blocks is precomputed when the engine is built. Scoring a candidate is a
+mask fold plus a table lookup instead of building ScheduledSlot objects and
+re-sorting them for every subject combination.
+
+The tables are filled by the same gap rules as compute_itinerary() (sort by
+start, negative gap = simultaneous, gap > MAX_STUDENT_IDLE_MINUTES = long
+idle); scripts/pre-rentree/tests/test_schedule_scoring.py checks that both
+agree on every block multiset of the campaign grid.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
+if str(PDF_GENERATOR_DIR) not in sys.path:
+    sys.path.insert(0, str(PDF_GENERATOR_DIR))
+
+from itinerary import MAX_STUDENT_IDLE_MINUTES  # noqa: E402
+
+
+def _to_minutes(time: str) -> int:
+    h, m = time.split(":")
+    return int(h) * 60 + int(m)
+
+
+@dataclass(frozen=True)
+class ComboOutcome:
+    """The scoring-relevant part of an ItineraryReport for one set of sessions."""
+    status: str
+    max_idle_minutes: int
+    total_idle_minutes: int
+    # (simultaneous, long idle, max idle) — the per-combination ranking every
+    # solver uses to pick the best cohort choice.
+    rank: tuple
+
+
+class ScoringEngine:
+    """Precomputed gap, simultaneity and outcome tables for one block grid.
+
+    A set of sessions on the same day is described by `mask` (one bit per
+    distinct block used) and `count` (number of sessions). Two sessions in the
+    same block are always simultaneous, so `count > popcount(mask)` selects
+    the "repeated block" table.
+    """
+
+    def __init__(self, block_times: Mapping[str, tuple], blocks: Optional[Sequence[str]] = None):
+        self.blocks = tuple(blocks if blocks is not None else block_times)
+        self.block_index = {block: i for i, block in enumerate(self.blocks)}
+        self.block_bit = {block: 1 << i for i, block in enumerate(self.blocks)}
+        self.intervals = tuple(
+            (_to_minutes(block_times[block][0]), _to_minutes(block_times[block][1])) for block in self.blocks
+        )
+        starts = [start for start, _ in self.intervals]
+        if len(set(starts)) != len(starts):
+            # compute_itinerary() orders same-start sessions by input order,
+            # which a mask cannot encode — refuse rather than diverge silently.
+            raise ValueError(f"Blocks must have distinct start times: {dict(zip(self.blocks, self.intervals))}")
+
+        size = 1 << len(self.blocks)
+        self._popcount = tuple(mask.bit_count() for mask in range(size))
+        self._distinct = tuple(self._evaluate(mask, repeated=False) for mask in range(size))
+        self._repeated = tuple(self._evaluate(mask, repeated=True) for mask in range(size))
+
+        n = len(self.blocks)
+        # pair_gaps[i][j]: signed minutes from the earlier block's end to the
+        # later one's start (negative = overlap); simultaneous_pairs[i][j]
+        # is True when a student cannot attend both.
+        self.pair_gaps = tuple(
+            tuple(self._signed_gap(i, j) for j in range(n)) for i in range(n)
+        )
+        self.simultaneous_pairs = tuple(
+            tuple(i == j or self.pair_gaps[i][j] < 0 for j in range(n)) for i in range(n)
+        )
+        self.pair_outcomes = tuple(
+            tuple(self.outcome((1 << i) | (1 << j), 2) for j in range(n)) for i in range(n)
+        )
+
+    def _signed_gap(self, i: int, j: int) -> int:
+        first, second = sorted((self.intervals[i], self.intervals[j]))
+        return second[0] - first[1]
+
+    def _evaluate(self, mask: int, repeated: bool) -> ComboOutcome:
+        ordered = sorted(self.intervals[i] for i in range(len(self.blocks)) if mask & (1 << i))
+        session_count = len(ordered) + (1 if repeated and ordered else 0)
+        simultaneous = repeated and bool(ordered)
+        long_idle = False
+        max_idle = 0
+        total_idle = 0
+        for (_, current_end), (next_start, _) in zip(ordered, ordered[1:]):
+            gap = next_start - current_end
+            if gap < 0:
+                simultaneous = True
+                continue
+            total_idle += gap
+            max_idle = max(max_idle, gap)
+            if gap > MAX_STUDENT_IDLE_MINUTES:
+                long_idle = True
+
+        if simultaneous:
+            status = "SIMULTANEOUS"
+        elif long_idle:
+            status = "LONG_IDLE"
+        elif session_count >= 2:
+            status = "COMPACT"
+        else:
+            status = "NO_SHARED_DAY"
+        rank = (1 if status == "SIMULTANEOUS" else 0, 1 if status == "LONG_IDLE" else 0, max_idle)
+        return ComboOutcome(status, max_idle, total_idle, rank)
+
+    def outcome(self, mask: int, count: int) -> ComboOutcome:
+        if count > self._popcount[mask]:
+            return self._repeated[mask]
+        return self._distinct[mask]
+
+    def outcome_for_blocks(self, blocks: Iterable[str]) -> ComboOutcome:
+        mask = 0
+        count = 0
+        for block in blocks:
+            mask |= self.block_bit[block]
+            count += 1
+        return self.outcome(mask, count)
+
+    def best_outcome(self, picks: Iterable[Sequence[int]], bits: Sequence[int]) -> ComboOutcome:
+        """Lowest-ranked outcome over alternative cohort picks, each pick being
+        a tuple of entry indices into `bits` (the block bit of every entry).
+        Ties keep the first pick, like the solvers' strict `<` comparisons."""
+        best = None
+        for pick in picks:
+            mask = 0
+            for entry_index in pick:
+                mask |= bits[entry_index]
+            candidate = self.outcome(mask, len(pick))
+            if best is None or candidate.rank < best.rank:
+                best = candidate
+        return best
+
+    def lower_bound(self, picks: Iterable[Sequence[int]], bits: Sequence[int]) -> tuple:
+        """Admissible (simultaneous, long idle, idle minutes) contribution of
+        one combination while some entries are still unplaced (bit 0).
+
+        A complete pick contributes its exact rank; a partial pick whose placed
+        sessions already overlap stays SIMULTANEOUS whatever comes next (extra
+        sessions never remove an overlap); any other partial pick may still
+        end up compact, so it bounds at zero. Summed over combinations, the
+        result never exceeds, lexicographically, the score of any completion.
+        """
+        best = None
+        for pick in picks:
+            mask = 0
+            placed = 0
+            for entry_index in pick:
+                bit = bits[entry_index]
+                if bit:
+                    mask |= bit
+                    placed += 1
+            outcome = self.outcome(mask, placed)
+            if placed == len(pick):
+                rank = outcome.rank
+            elif outcome.status == "SIMULTANEOUS":
+                rank = (1, 0, 0)
+            else:
+                return (0, 0, 0)
+            if best is None or rank < best:
+                best = rank
+        simultaneous, long_idle, idle = best
+        return (simultaneous, long_idle, idle if long_idle else 0)
+
+    def total_lower_bound(self, pick_sets: Iterable[Sequence[Sequence[int]]], bits: Sequence[int]) -> tuple:
+        simultaneous = long_idle = idle = 0
+        for picks in pick_sets:
+            s, l, i = self.lower_bound(picks, bits)
+            simultaneous += s
+            long_idle += l
+            idle += i
+        return (simultaneous, long_idle, idle)
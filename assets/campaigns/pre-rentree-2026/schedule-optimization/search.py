@@ -0,0 +1,77 @@
+"""Depth-first branch-and-bound over teacher-role block permutations.
+
+The exhaustive solvers enumerate the full itertools.product of every teacher
+role's block permutations, then every room permutation, and score each leaf.
+This search assigns one teacher role at a time, in the same order, and asks
+the caller for an admissible lower bound on the score of the partial
+assignment: a subtree whose bound is not strictly better than the incumbent
+is skipped. Rooms are not branched on at all — swapping two rooms inside a
+block never changes a student's itinerary, so callers pick one canonical room
+layout per block pattern once the search is over.
+
+Because leaves are visited in the exhaustive product order and only subtrees
+that cannot strictly improve are pruned, the first optimum found is the same
+one the exhaustive search keeps.
+"""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+SEARCH_MODES = ("exhaustive", "branch-and-bound")
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    rank: Optional[tuple]
+    bits: Optional[tuple]  # block bit (1 << block index) of every entry, None when infeasible
+    nodes_explored: int
+    leaves_scored: int
+    subtrees_pruned: int
+
+
+def branch_and_bound(
+    role_entries: Sequence[Sequence[int]],
+    capacity: Sequence[int],
+    lower_bound: Callable[[list], tuple],
+    leaf_rank: Callable[[list], tuple],
+) -> SearchResult:
+    """`role_entries[r]` lists the entry indices taught by teacher role r (a
+    role gets distinct blocks); `capacity[b]` is the number of rooms open on
+    block b. Both callbacks receive the per-entry bit list, 0 when unplaced."""
+    entry_count = sum(len(entries) for entries in role_entries)
+    bits = [0] * entry_count
+    usage = [0] * len(capacity)
+    last_depth = len(role_entries) - 1
+    best_rank: Optional[tuple] = None
+    best_bits: Optional[tuple] = None
+    nodes = leaves = pruned = 0
+
+    def visit(depth: int) -> None:
+        nonlocal best_rank, best_bits, nodes, leaves, pruned
+        entries = role_entries[depth]
+        for blocks in itertools.permutations(range(len(capacity)), len(entries)):
+            if any(usage[b] >= capacity[b] for b in blocks):
+                continue
+            for entry_index, b in zip(entries, blocks):
+                bits[entry_index] = 1 << b
+                usage[b] += 1
+            nodes += 1
+            if depth == last_depth:
+                leaves += 1
+                rank = leaf_rank(bits)
+                if best_rank is None or rank < best_rank:
+                    best_rank, best_bits = rank, tuple(bits)
+            elif best_rank is not None and lower_bound(bits) >= best_rank:
+                pruned += 1
+            else:
+                visit(depth + 1)
+            for entry_index, b in zip(entries, blocks):
+                bits[entry_index] = 0
+                usage[b] -= 1
+
+    if role_entries:
+        visit(0)
+    return SearchResult(best_rank, best_bits, nodes, leaves, pruned)
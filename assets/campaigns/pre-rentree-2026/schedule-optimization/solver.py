@@ -22,6 +22,7 @@ mission's "no heavy new runtime dependency" instruction.
 
 from __future__ import annotations
 
+import argparse
 import itertools
 import json
 import sys
@@ -34,8 +35,10 @@ PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
 if str(PDF_GENERATOR_DIR) not in sys.path:
     sys.path.insert(0, str(PDF_GENERATOR_DIR))
 
-from itinerary import MAX_STUDENT_IDLE_MINUTES, compute_itinerary  # noqa: E402
+from itinerary import MAX_STUDENT_IDLE_MINUTES  # noqa: E402
 from pre_rentree_data import ScheduledSlot  # noqa: E402
+from scoring import ScoringEngine  # noqa: E402
+from search import SEARCH_MODES, branch_and_bound  # noqa: E402
 
 BLOCKS = ("A", "B", "C", "D")
 ROOMS = ("salle-1", "salle-2")
@@ -91,30 +94,55 @@ def build_sessions(entries: list[Entry], assignment: dict[Entry, tuple[str, str]
     return sessions
 
 
-def score_assignment(entries: list[Entry], assignment: dict[Entry, tuple[str, str]], times: dict[str, tuple[str, str]]):
-    sessions = build_sessions(entries, assignment, times)
-    simultaneous_count = 0
-    long_idle_count = 0
-    total_idle = 0
-    details = []
+def pair_plan(entries: list[Entry]) -> list[tuple]:
+    """Every same-level subject pair, with the indices (into `entries`) of the
+    sessions a student taking that pair attends — computed once per window."""
+    plan = []
     for level in levels_in(entries):
-        level_subjects = sorted({e.subject for e in entries if e.level == level})
+        indices_by_subject: dict[str, list[int]] = defaultdict(list)
+        for index, e in enumerate(entries):
+            if e.level == level:
+                indices_by_subject[e.subject].append(index)
+        level_subjects = sorted(indices_by_subject)
         for i in range(len(level_subjects)):
             for j in range(i + 1, len(level_subjects)):
                 pair = (level_subjects[i], level_subjects[j])
-                report = compute_itinerary(level, pair, sessions)
-                if report.status == "SIMULTANEOUS":
-                    simultaneous_count += 1
-                elif report.status == "LONG_IDLE":
-                    long_idle_count += 1
-                    total_idle += report.max_idle_minutes
-                details.append((level, pair, report.status, report.max_idle_minutes))
+                plan.append((level, pair, tuple(indices_by_subject[pair[0]] + indices_by_subject[pair[1]])))
+    return plan
+
+
+def score_blocks(engine: ScoringEngine, plan: list[tuple], bits: list[int]):
+    """Scores one candidate given the block bit of every entry — table lookups
+    only, identical to running compute_itinerary() on build_sessions()."""
+    simultaneous_count = 0
+    long_idle_count = 0
+    total_idle = 0
+    details = []
+    for level, pair, indices in plan:
+        mask = 0
+        for index in indices:
+            mask |= bits[index]
+        outcome = engine.outcome(mask, len(indices))
+        if outcome.status == "SIMULTANEOUS":
+            simultaneous_count += 1
+        elif outcome.status == "LONG_IDLE":
+            long_idle_count += 1
+            total_idle += outcome.max_idle_minutes
+        details.append((level, pair, outcome.status, outcome.max_idle_minutes))
     return (simultaneous_count, long_idle_count, total_idle), details
 
 
-def solve_window(campaign: dict, window_id: str, teacher_disjoint: bool = True):
+def score_assignment(entries: list[Entry], assignment: dict[Entry, tuple[str, str]], times: dict[str, tuple[str, str]]):
+    engine = ScoringEngine(times, BLOCKS)
+    bits = [engine.block_bit[assignment[e][0]] for e in entries]
+    return score_blocks(engine, pair_plan(entries), bits)
+
+
+def solve_window(campaign: dict, window_id: str, teacher_disjoint: bool = True, search: str = "exhaustive"):
     entries = window_entries(campaign, window_id)
     times = block_times(campaign)
+    engine = ScoringEngine(times, BLOCKS)
+    plan = pair_plan(entries)
     by_teacher: dict[str, list[Entry]] = defaultdict(list)
     for e in entries:
         by_teacher[e.teacher_role].append(e)
@@ -132,6 +160,8 @@ def solve_window(campaign: dict, window_id: str, teacher_disjoint: bool = True):
     # rooms exist) — this factorization keeps the search space small without
     # looping over the full slot-permutation space naively.
     teacher_roles = list(by_teacher.keys())
+    if search == "branch-and-bound":
+        return solve_window_branch_and_bound(window_id, entries, engine, plan, teacher_roles)
 
     def block_choices_for(role_entries: list[Entry]):
         return itertools.permutations(BLOCKS, len(role_entries))
@@ -160,12 +190,51 @@ def solve_window(campaign: dict, window_id: str, teacher_disjoint: bool = True):
                     assignment[entry] = (block_for_entry[entry], room)
 
             candidates_checked += 1
-            score, details = score_assignment(entries, assignment, times)
+            score, details = score_blocks(engine, plan, [engine.block_bit[assignment[e][0]] for e in entries])
             if best_score is None or score < best_score:
                 best_score = score
                 best_assignment = dict(assignment)
                 best_details = details
 
+    return window_result(window_id, entries, candidates_checked, best_score, best_assignment, best_details)
+
+
+def solve_window_branch_and_bound(window_id: str, entries: list[Entry], engine: ScoringEngine, plan: list[tuple], teacher_roles: list[str]):
+    """Same optimum as the exhaustive loop in solve_window(), found by
+    search.branch_and_bound(): roles are placed one at a time and a subtree is
+    dropped as soon as ScoringEngine.total_lower_bound() shows it cannot beat
+    the incumbent. Rooms are never branched on — each block's entries take
+    ROOMS in order, the first room permutation the exhaustive loop would keep."""
+    role_entries = [[i for i, e in enumerate(entries) if e.teacher_role == role] for role in teacher_roles]
+    pick_sets = [(indices,) for _, _, indices in plan]
+    result = branch_and_bound(
+        role_entries,
+        [len(ROOMS)] * len(BLOCKS),
+        lambda bits: engine.total_lower_bound(pick_sets, bits),
+        lambda bits: score_blocks(engine, plan, bits)[0],
+    )
+    if result.bits is None:
+        raise ValueError(f"No teacher-conflict-free assignment fits {window_id} in {len(ROOMS)} rooms")
+
+    block_usage: dict[str, list[Entry]] = defaultdict(list)
+    for indices in role_entries:
+        for i in indices:
+            block_usage[BLOCKS[result.bits[i].bit_length() - 1]].append(entries[i])
+    assignment: dict[Entry, tuple[str, str]] = {}
+    for block in BLOCKS:
+        for entry, room in zip(block_usage[block], ROOMS):
+            assignment[entry] = (block, room)
+
+    best_score, best_details = score_blocks(engine, plan, list(result.bits))
+    return {
+        **window_result(window_id, entries, result.leaves_scored, best_score, assignment, best_details),
+        "search": "branch-and-bound",
+        "nodesExplored": result.nodes_explored,
+        "subtreesPruned": result.subtrees_pruned,
+    }
+
+
+def window_result(window_id: str, entries: list[Entry], candidates_checked: int, best_score: tuple, best_assignment: dict, best_details: list) -> dict:
     return {
         "window": window_id,
         "entries": len(entries),
@@ -207,14 +276,26 @@ def baseline_score(campaign: dict, window_id: str):
     }
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="S0/S1 exhaustive schedule solver (pré-rentrée 2026).")
+    parser.add_argument(
+        "--search",
+        choices=SEARCH_MODES,
+        default="exhaustive",
+        help="exhaustive enumeration (default) or depth-first branch-and-bound with the same optimum",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     campaign = load_campaign()
     windows = ["fenetre-1", "weekend-debut-fenetre-2", "fenetre-2"]
 
     result = {"maxStudentIdleMinutes": MAX_STUDENT_IDLE_MINUTES, "s0_baseline": {}, "s1_optimum": {}}
     for window_id in windows:
         result["s0_baseline"][window_id] = baseline_score(campaign, window_id)
-        result["s1_optimum"][window_id] = solve_window(campaign, window_id)
+        result["s1_optimum"][window_id] = solve_window(campaign, window_id, search=args.search)
 
     out_path = Path(__file__).parent / "s0-s1-solver-output.json"
     out_path.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
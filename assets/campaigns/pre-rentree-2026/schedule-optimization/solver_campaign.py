@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""Joint multi-window, multi-day block optimization of the live campaign grid.
+
+solver.py and the S5 solvers score every window on ONE representative date,
+which assumes windows never share a day. They do: weekend-debut-fenetre-2
+(22-26 août) and fenetre-2 (24-28 août) overlap on 24-26, so a teacher role
+teaching in both cannot hold the same block in each, two entries of the same
+level may share a day across windows, and rooms are shared on those dates.
+This solver reads every window of data/campaigns/pre-rentree-2026.json with
+its real `days` list and re-chooses the block of every slot jointly:
+
+- dates are grouped into classes with the same set of active windows (every
+  date of a class yields the same itineraries), and windows are split into
+  independent components — windows sharing a date, plus windows linked by a
+  subject combination that could interact — each solved on its own;
+- a teacher role never holds one block twice on a date, in any window;
+- on every date and block, entries never outnumber the rooms open that
+  day (by default the rooms the live grid already uses that date);
+- each same-level subject combination (2 to --max-combo-size subjects) is
+  scored on its BEST cohort pick, like itinerary.assign_itinerary(), and the
+  grid minimizes (simultaneous combos, long-idle combos, their idle minutes).
+
+Search is depth-first branch-and-bound over (window, teacher role) groups,
+seeded with the live grid as incumbent so a block only moves for a strict
+improvement. Scores are maintained incrementally: placing or removing an
+entry only re-evaluates the (pick, date class) cells that contain it, each
+through ScoringEngine lookup tables. Final combination results are
+re-derived with assign_itinerary() on the dated sessions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
+if str(PDF_GENERATOR_DIR) not in sys.path:
+    sys.path.insert(0, str(PDF_GENERATOR_DIR))
+
+from itinerary import MAX_STUDENT_IDLE_MINUTES, assign_itinerary, enumerate_selections  # noqa: E402
+from pre_rentree_data import ScheduledSlot  # noqa: E402
+from scoring import ScoringEngine  # noqa: E402
+
+
+@dataclass(frozen=True)
+class CampaignEntry:
+    window_id: str
+    level: str
+    subject: str
+    teacher_role: str
+    cohort_id: Optional[str]
+    is_primary: Optional[bool]
+    block: str  # live block, used as the starting incumbent
+    room: str
+
+
+@dataclass(frozen=True)
+class DateClass:
+    dates: tuple
+    windows: frozenset
+    rooms: tuple
+
+
+class CampaignProblem:
+    """Entries, date classes, components and combination picks of one campaign."""
+
+    def __init__(self, campaign: dict, max_combo_size: int = 2, rooms: Optional[tuple] = None):
+        self.campaign = campaign
+        self.times = {b["id"]: (b["startTime"], b["endTime"]) for b in campaign["blocks"]}
+        self.blocks = tuple(b["id"] for b in campaign["blocks"])
+        self.engine = ScoringEngine(self.times, self.blocks)
+        self.window_days = {w["windowId"]: tuple(w["days"]) for w in campaign["schedule"]}
+        self.window_labels = {w["windowId"]: w["windowLabel"] for w in campaign["schedule"]}
+        self.entries = tuple(
+            CampaignEntry(
+                window["windowId"], s["level"], s["subject"], s["teacherRole"], s.get("cohortId"),
+                s.get("isPrimary"), s["block"], s["room"],
+            )
+            for window in campaign["schedule"] for s in window["slots"]
+        )
+        self.date_classes = self._date_classes(rooms)
+        self.entry_classes = tuple(
+            tuple(c for c, date_class in enumerate(self.date_classes) if e.window_id in date_class.windows)
+            for e in self.entries
+        )
+        self.combos = self._combos(max_combo_size)
+        self.components = self._components()
+
+    def _date_classes(self, rooms: Optional[tuple]) -> tuple:
+        rooms_by_window = defaultdict(set)
+        for e in self.entries:
+            rooms_by_window[e.window_id].add(e.room)
+        by_windows = defaultdict(list)
+        for date in sorted({d for days in self.window_days.values() for d in days}):
+            active = frozenset(w for w, days in self.window_days.items() if date in days)
+            by_windows[active].append(date)
+        return tuple(
+            DateClass(
+                tuple(dates),
+                active,
+                tuple(rooms) if rooms else tuple(sorted(set().union(*(rooms_by_window[w] for w in active)))),
+            )
+            for active, dates in by_windows.items()
+        )
+
+    def _combos(self, max_combo_size: int) -> tuple:
+        """(level, subjects, picks) for every same-level combination; a pick
+        is one cohort per subject (entries sharing a cohortId, or every
+        entry without one), as itinerary.ItineraryIndex groups them."""
+        combos = []
+        levels = list(dict.fromkeys(e.level for e in self.entries))
+        for level in levels:
+            options_by_subject = {}
+            for index, e in enumerate(self.entries):
+                if e.level == level:
+                    options_by_subject.setdefault(e.subject, {}).setdefault(e.cohort_id, []).append(index)
+            for subjects in enumerate_selections(tuple(options_by_subject), max_combo_size):
+                if len(subjects) < 2:
+                    continue
+                options = [list(options_by_subject[s].values()) for s in subjects]
+                picks = tuple(tuple(i for option in pick for i in option) for pick in itertools.product(*options))
+                combos.append((level, subjects, picks))
+        return tuple(combos)
+
+    def _components(self) -> list[tuple]:
+        """Window sets that can be optimized independently. Two windows are
+        joined when they share a date, or when some cohort pick puts 2+
+        sessions in each — only then can one window's blocks change the
+        other's combination outcome."""
+        parent = {w: w for w in self.window_days}
+
+        def find(w):
+            while parent[w] != w:
+                parent[w] = parent[parent[w]]
+                w = parent[w]
+            return w
+
+        def union(windows) -> bool:
+            roots = {find(w) for w in windows}
+            first = roots.pop() if roots else None
+            for other in roots:
+                parent[other] = first
+            return bool(roots)
+
+        for date_class in self.date_classes:
+            union(date_class.windows)
+        # A combo union can merge components an earlier combo spans, and that
+        # merge can enable another: repeat until a whole pass joins nothing.
+        changed = True
+        while changed:
+            changed = False
+            for _, _, picks in self.combos:
+                live = set()
+                for pick in picks:
+                    per_root = defaultdict(int)
+                    for i in pick:
+                        per_root[find(self.entries[i].window_id)] += 1
+                    live.update(root for root, n in per_root.items() if n >= 2)
+                changed |= union(live)
+        groups = defaultdict(list)
+        for w in self.window_days:
+            groups[find(w)].append(w)
+        return [tuple(ws) for ws in groups.values()]
+
+
+class IncrementalScore:
+    """Running (simultaneous, long idle, idle minutes) lower bound of one
+    component. Every (pick, date class) cell keeps per-block session counts;
+    placing or removing an entry only touches its cells, then re-evaluates
+    the combinations owning them. Once every entry is placed the bound is the
+    exact score."""
+
+    def __init__(self, problem: CampaignProblem, entry_indices: list[int], combos: list[tuple]):
+        self.engine = problem.engine
+        block_count = len(problem.blocks)
+        local = set(entry_indices)
+        self.cells_of_entry = defaultdict(list)  # entry -> [(combo, pick, cell)]
+        self.combo_picks = []  # per combo: per pick: [total entries, placed entries, [cell ids]]
+        self.cell_counts = []  # cell -> per-block counts
+        self.cell_masks = []
+        self.cell_sizes = []
+        for combo_id, (_, _, picks) in enumerate(combos):
+            pick_states = []
+            for pick_id, pick in enumerate(picks):
+                members = [i for i in pick if i in local]
+                cells = []
+                for c in sorted({c for i in members for c in problem.entry_classes[i]}):
+                    cell = len(self.cell_counts)
+                    self.cell_counts.append([0] * block_count)
+                    self.cell_masks.append(0)
+                    self.cell_sizes.append(0)
+                    cells.append(cell)
+                    for i in members:
+                        if c in problem.entry_classes[i]:
+                            self.cells_of_entry[i].append((combo_id, pick_id, cell))
+                pick_states.append([len(members), 0, cells])
+            self.combo_picks.append(pick_states)
+        self.contributions = [self._combo_bound(combo_id) for combo_id in range(len(combos))]
+        self.totals = [sum(c[k] for c in self.contributions) for k in range(3)]
+
+    def _pick_bound(self, state) -> tuple:
+        total, placed, cells = state
+        simultaneous = long_idle = False
+        max_idle = 0
+        for cell in cells:
+            outcome = self.engine.outcome(self.cell_masks[cell], self.cell_sizes[cell])
+            if outcome.status == "SIMULTANEOUS":
+                simultaneous = True
+            elif outcome.status == "LONG_IDLE":
+                long_idle = True
+            max_idle = max(max_idle, outcome.max_idle_minutes)
+        if placed < total:
+            # Overlaps survive any later placement; nothing else is certain.
+            return (1, 0, 0) if simultaneous else (0, 0, 0)
+        return (1 if simultaneous else 0, 1 if long_idle and not simultaneous else 0, max_idle)
+
+    def _combo_bound(self, combo_id: int) -> tuple:
+        best = min(self._pick_bound(state) for state in self.combo_picks[combo_id])
+        return (best[0], best[1], best[2] if best[1] else 0)
+
+    def _move(self, entry: int, bit_index: int, delta: int) -> None:
+        touched = set()
+        for combo_id, pick_id, cell in self.cells_of_entry[entry]:
+            counts = self.cell_counts[cell]
+            counts[bit_index] += delta
+            if counts[bit_index] == 0:
+                self.cell_masks[cell] &= ~(1 << bit_index)
+            else:
+                self.cell_masks[cell] |= 1 << bit_index
+            self.cell_sizes[cell] += delta
+            touched.add((combo_id, pick_id))
+        for combo_id, pick_id in touched:
+            self.combo_picks[combo_id][pick_id][1] += delta
+        for combo_id in {combo_id for combo_id, _ in touched}:
+            old = self.contributions[combo_id]
+            new = self._combo_bound(combo_id)
+            if new != old:
+                self.contributions[combo_id] = new
+                for k in range(3):
+                    self.totals[k] += new[k] - old[k]
+
+    def place(self, entry: int, bit_index: int) -> None:
+        self._move(entry, bit_index, 1)
+
+    def remove(self, entry: int, bit_index: int) -> None:
+        self._move(entry, bit_index, -1)
+
+    @property
+    def score(self) -> tuple:
+        return tuple(self.totals)
+
+
+def solve_component(problem: CampaignProblem, windows: tuple) -> dict:
+    entry_indices = [i for i, e in enumerate(problem.entries) if e.window_id in windows]
+    combos = [
+        combo for combo in problem.combos
+        if any(sum(1 for i in pick if problem.entries[i].window_id in windows) >= 2 for pick in combo[2])
+    ]
+    state = IncrementalScore(problem, entry_indices, combos)
+    block_index = {b: k for k, b in enumerate(problem.blocks)}
+
+    groups = defaultdict(list)  # (window, teacher role) -> entries, first-appearance order
+    for i in entry_indices:
+        e = problem.entries[i]
+        groups[(e.window_id, e.teacher_role)].append(i)
+    group_keys = list(groups)
+    shares_date = {
+        (a, b): bool(set(problem.window_days[a]) & set(problem.window_days[b])) for a in windows for b in windows
+    }
+    conflicts = [
+        [g for g in range(depth) if group_keys[g][1] == key[1] and shares_date[(group_keys[g][0], key[0])]]
+        for depth, key in enumerate(group_keys)
+    ]
+    capacity = [len(date_class.rooms) for date_class in problem.date_classes]
+    usage = [[0] * len(problem.blocks) for _ in problem.date_classes]
+    chosen: list[Optional[tuple]] = [None] * len(group_keys)
+
+    def feasible(depth: int, blocks: tuple) -> bool:
+        for g in conflicts[depth]:
+            if set(blocks) & set(chosen[g]):
+                return False
+        for i, b in zip(groups[group_keys[depth]], blocks):
+            for c in problem.entry_classes[i]:
+                if usage[c][b] >= capacity[c]:
+                    return False
+        return True
+
+    def apply(depth: int, blocks: tuple, delta: int) -> None:
+        for i, b in zip(groups[group_keys[depth]], blocks):
+            for c in problem.entry_classes[i]:
+                usage[c][b] += delta
+            if delta > 0:
+                state.place(i, b)
+            else:
+                state.remove(i, b)
+        chosen[depth] = blocks if delta > 0 else None
+
+    # Seed the incumbent with the live grid (when it is feasible under the
+    # same constraints): a block only moves for a strict improvement.
+    live = [tuple(block_index[problem.entries[i].block] for i in groups[key]) for key in group_keys]
+    best_score, best_blocks = None, None
+    live_feasible = True
+    for depth, blocks in enumerate(live):
+        if not feasible(depth, blocks):
+            live_feasible = False
+            break
+        apply(depth, blocks, 1)
+    if live_feasible:
+        best_score, best_blocks = state.score, list(live)
+    baseline_score = state.score if live_feasible else None
+    for depth in reversed(range(len(group_keys))):
+        if chosen[depth] is not None:
+            apply(depth, chosen[depth], -1)
+
+    nodes = leaves = pruned = 0
+
+    def visit(depth: int) -> None:
+        nonlocal best_score, best_blocks, nodes, leaves, pruned
+        size = len(groups[group_keys[depth]])
+        for blocks in itertools.permutations(range(len(problem.blocks)), size):
+            if not feasible(depth, blocks):
+                continue
+            apply(depth, blocks, 1)
+            nodes += 1
+            if depth == len(group_keys) - 1:
+                leaves += 1
+                if best_score is None or state.score < best_score:
+                    best_score, best_blocks = state.score, list(chosen)
+            elif best_score is not None and state.score >= best_score:
+                pruned += 1
+            else:
+                visit(depth + 1)
+            apply(depth, blocks, -1)
+
+    if group_keys:
+        visit(0)
+    if best_blocks is None:
+        raise ValueError(f"No teacher- and room-feasible grid for windows {windows}")
+
+    block_of = {}
+    for key, blocks in zip(group_keys, best_blocks):
+        for i, b in zip(groups[key], blocks):
+            block_of[i] = problem.blocks[b]
+    return {
+        "windows": windows,
+        "entries": entry_indices,
+        "blocks": block_of,
+        "score": best_score,
+        "baselineScore": baseline_score,
+        "nodesExplored": nodes,
+        "leavesScored": leaves,
+        "subtreesPruned": pruned,
+    }
+
+
+def assign_rooms(problem: CampaignProblem, block_of: dict) -> dict:
+    """Rooms per entry: the live room when still free on every date of the
+    window, else the first open room free on all of them. Counting capacity
+    per (date, block) during the search guarantees this interval colouring
+    exists for rooms open on every date; anything else fails loudly."""
+    rooms_of = {}
+    taken = defaultdict(set)  # (date class, block) -> rooms
+    order = sorted(block_of, key=lambda i: (problem.window_days[problem.entries[i].window_id][0], i))
+    for i in order:
+        entry = problem.entries[i]
+        classes = problem.entry_classes[i]
+        open_rooms = set.intersection(*(set(problem.date_classes[c].rooms) for c in classes))
+        free = [r for r in sorted(open_rooms) if all(r not in taken[(c, block_of[i])] for c in classes)]
+        if not free:
+            raise ValueError(f"No free room for {entry} on block {block_of[i]}")
+        room = entry.room if entry.room in free else free[0]
+        rooms_of[i] = room
+        for c in classes:
+            taken[(c, block_of[i])].add(room)
+    return rooms_of
+
+
+def dated_sessions(problem: CampaignProblem, block_of: dict, rooms_of: dict) -> list[ScheduledSlot]:
+    sessions = []
+    for i, e in enumerate(problem.entries):
+        start, end = problem.times[block_of[i]]
+        for day in problem.window_days[e.window_id]:
+            sessions.append(ScheduledSlot(
+                level=e.level, subject=e.subject, block=block_of[i], room=rooms_of[i],
+                window_id=e.window_id, window_label=problem.window_labels[e.window_id],
+                start_time=start, end_time=end, date=day, cohort_id=e.cohort_id, is_primary=e.is_primary,
+            ))
+    return sessions
+
+
+def teacher_load(problem: CampaignProblem) -> list[dict]:
+    blocks_per_date = defaultdict(lambda: defaultdict(int))
+    for e in problem.entries:
+        for day in problem.window_days[e.window_id]:
+            blocks_per_date[e.teacher_role][day] += 1
+    return [
+        {
+            "teacherRole": role,
+            "maxBlocksPerDay": max(per_date.values()),
+            "busiestDates": sorted(d for d, n in per_date.items() if n == max(per_date.values())),
+            "totalBlocks": sum(per_date.values()),
+        }
+        for role, per_date in sorted(blocks_per_date.items())
+    ]
+
+
+def score_json(score: Optional[tuple]) -> Optional[dict]:
+    if score is None:
+        return None
+    return {"simultaneousCombos": score[0], "longIdleCombos": score[1], "totalIdleMinutes": score[2]}
+
+
+def solve_campaign(campaign: dict, max_combo_size: int = 2, rooms: Optional[tuple] = None) -> dict:
+    problem = CampaignProblem(campaign, max_combo_size, rooms)
+    components = [solve_component(problem, windows) for windows in problem.components]
+    block_of = {i: b for component in components for i, b in component["blocks"].items()}
+    rooms_of = assign_rooms(problem, block_of)
+    sessions = dated_sessions(problem, block_of, rooms_of)
+
+    combo_results = []
+    for level, subjects, _ in problem.combos:
+        report = assign_itinerary(level, subjects, sessions).itinerary
+        combo_results.append({
+            "level": level, "subjects": list(subjects), "status": report.status,
+            "maxIdleMinutes": report.max_idle_minutes, "daysPresent": report.days_present,
+        })
+
+    return {
+        "maxStudentIdleMinutes": MAX_STUDENT_IDLE_MINUTES,
+        "maxComboSize": max_combo_size,
+        "dateClasses": [
+            {"dates": list(dc.dates), "windows": sorted(dc.windows), "rooms": list(dc.rooms)}
+            for dc in problem.date_classes
+        ],
+        "components": [
+            {
+                "windows": list(component["windows"]),
+                "baselineScore": score_json(component["baselineScore"]),
+                "bestScore": score_json(component["score"]),
+                "nodesExplored": component["nodesExplored"],
+                "leavesScored": component["leavesScored"],
+                "subtreesPruned": component["subtreesPruned"],
+            }
+            for component in components
+        ],
+        "totalScore": score_json(tuple(sum(c["score"][k] for c in components) for k in range(3))),
+        "assignment": [
+            {
+                "windowId": e.window_id, "level": e.level, "subject": e.subject, "cohortId": e.cohort_id,
+                "teacherRole": e.teacher_role, "block": block_of[i], "room": rooms_of[i],
+                "moved": block_of[i] != e.block or rooms_of[i] != e.room,
+            }
+            for i, e in enumerate(problem.entries)
+        ],
+        "teacherLoad": teacher_load(problem),
+        "comboResults": combo_results,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Joint multi-window block optimization of the live pré-rentrée campaign.")
+    parser.add_argument("--max-combo-size", type=int, default=2, help="largest same-level subject combination scored (default: 2)")
+    parser.add_argument("--rooms", nargs="+", help="rooms open on every date (default: the rooms the live grid uses that date)")
+    parser.add_argument("--output", type=Path, default=Path(__file__).parent / "campaign-joint-solver-output.json")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    campaign = json.loads((REPO_ROOT / "data" / "campaigns" / "pre-rentree-2026.json").read_text(encoding="utf-8"))
+    result = solve_campaign(campaign, args.max_combo_size, tuple(args.rooms) if args.rooms else None)
+    args.output.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(json.dumps({"components": result["components"], "totalScore": result["totalScore"]}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
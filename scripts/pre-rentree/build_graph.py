@@ -0,0 +1,246 @@
+"""Incremental stage graph for the owner-review document build.
+
+generate_documents declares each build step as a Stage: the stages it runs
+after, the package-relative files it reads (inputs) and writes (outputs), the
+repository files it reads (sources, such as committed logos and fonts), and
+the JSON-serializable non-file values it reads (params, usually the slice of
+the snapshot it uses). A stage's fingerprint hashes its name, the generator
+code, its params and the bytes of its sources and inputs, the inputs as they
+stand once its predecessors have run. A StageCache under .artifacts keeps the outputs and
+result of recent fingerprints, so a rebuild restores unchanged stages into the
+new staging directory instead of re-running them; publication stays atomic
+because everything still lands in staging first. Independent stages can run
+concurrently on a thread pool, within a budget of jobs busy workers: a stage
+that starts its own worker processes (the PDF render) declares how many.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from file_digests import sha256_many
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[1]
+DEFAULT_STAGE_CACHE_DIR = REPO_ROOT / ".artifacts/pre-rentree-2026/stage-cache"
+CODE_PATTERNS = ("*.py", "*.mjs", "requirements.lock", "templates/*", "schemas/*")
+# Shared modules the stages import from tools/pdf-generator: render_cache
+# (pdf), pdf_fonts (pdf-audit:*) and page_rasters (visual:*).
+PDF_GENERATOR_DIR = REPO_ROOT / "tools/pdf-generator"
+PDF_GENERATOR_MODULES = ("render_cache.py", "pdf_fonts.py", "page_rasters.py")
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    run: Callable[[dict[str, Any]], Any]  # called with the results of the stages run so far
+    after: tuple[str, ...] = ()
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    sources: tuple[str, ...] = ()  # relative to the repository root
+    params: Any = None
+    cached: bool = True
+    workers: int = 1  # processes or threads the stage keeps busy, counted against jobs
+
+
+def _files(root: Path, relative: str) -> list[Path]:
+    path = root / relative
+    if path.is_dir():
+        return sorted(item for item in path.rglob("*") if item.is_file())
+    return [path] if path.is_file() else []
+
+
+def code_fingerprint(script_dir: Path = SCRIPT_DIR, pdf_generator_dir: Path = PDF_GENERATOR_DIR) -> str:
+    """Digest of the generator sources and the shared pdf-generator modules:
+    editing any of them invalidates every stage."""
+    digest = hashlib.sha256()
+    paths = sorted({path for pattern in CODE_PATTERNS for path in script_dir.glob(pattern) if path.is_file()})
+    shared = [pdf_generator_dir / name for name in PDF_GENERATOR_MODULES]
+    missing = [path.name for path in shared if not path.is_file()]
+    if missing:
+        raise FileNotFoundError(f"Shared pdf-generator modules are missing: {missing}")
+    named = [(path.relative_to(script_dir).as_posix(), path) for path in paths]
+    named += [(f"tools/pdf-generator/{path.name}", path) for path in shared]
+    for (name, _), file_digest in zip(named, sha256_many([path for _, path in named])):
+        digest.update(f"{name}\0{file_digest}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def stage_fingerprint(stage: Stage, package_root: Path, code: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(json.dumps([stage.name, code, stage.params], sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    for kind, root, paths in (("source", REPO_ROOT, stage.sources), ("input", package_root, stage.inputs)):
+        for relative in paths:
+            files = _files(root, relative)
+            if not files:
+                raise FileNotFoundError(f"Stage {stage.name} {kind} is missing: {relative}")
+            for path, file_digest in zip(files, sha256_many(files)):
+                digest.update(f"\n{kind}:{path.relative_to(root).as_posix()}\0{file_digest}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def ordered_stages(stages: Iterable[Stage]) -> list[Stage]:
+    """Dependency order, keeping declaration order among ready stages."""
+    pending = list(stages)
+    names = [stage.name for stage in pending]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate stage names: {sorted({n for n in names if names.count(n) > 1})}")
+    for stage in pending:
+        unknown = set(stage.after) - set(names)
+        if unknown:
+            raise ValueError(f"Stage {stage.name} runs after unknown stages: {sorted(unknown)}")
+    done: set[str] = set()
+    order: list[Stage] = []
+    while pending:
+        ready = next((stage for stage in pending if set(stage.after) <= done), None)
+        if ready is None:
+            raise ValueError(f"Stage dependency cycle among: {[stage.name for stage in pending]}")
+        pending.remove(ready)
+        done.add(ready.name)
+        order.append(ready)
+    return order
+
+
+class StageCache:
+    """Outputs and results of the last `keep` fingerprints of each stage."""
+
+    def __init__(self, root: Path = DEFAULT_STAGE_CACHE_DIR, keep: int = 4):
+        self.root = Path(root)
+        self.keep = keep
+
+    def _entry(self, stage: Stage, fingerprint: str) -> Path:
+        return self.root / stage.name.replace(":", "-") / fingerprint
+
+    def restore(self, stage: Stage, fingerprint: str, package_root: Path) -> tuple[bool, Any]:
+        entry = self._entry(stage, fingerprint)
+        try:
+            result = json.loads((entry / "result.json").read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return False, None
+        files = entry / "files"
+        for relative in stage.outputs:
+            source = files / relative
+            destination = package_root / relative
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            if source.is_dir():
+                shutil.copytree(source, destination, dirs_exist_ok=True)
+            elif source.is_file():
+                shutil.copyfile(source, destination)
+        os.utime(entry)
+        return True, result
+
+    def save(self, stage: Stage, fingerprint: str, package_root: Path, result: Any) -> None:
+        entry = self._entry(stage, fingerprint)
+        temporary = entry.with_name(f".{entry.name}.tmp-{uuid.uuid4().hex}")
+        for relative in stage.outputs:
+            source = package_root / relative
+            destination = temporary / "files" / relative
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            if source.is_dir():
+                shutil.copytree(source, destination)
+            elif source.is_file():
+                shutil.copyfile(source, destination)
+            else:
+                raise FileNotFoundError(f"Stage {stage.name} did not write its output: {relative}")
+        temporary.mkdir(parents=True, exist_ok=True)
+        (temporary / "result.json").write_text(json.dumps(result, ensure_ascii=False) + "\n", encoding="utf-8")
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(temporary, entry)
+        self._prune(entry.parent)
+
+    def _prune(self, stage_dir: Path) -> None:
+        entries = sorted(
+            (path for path in stage_dir.iterdir() if not path.name.startswith(".")),
+            key=lambda path: path.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in entries[self.keep:]:
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def _execute(
+    stage: Stage, package_root: Path, cache: StageCache | None, code: str | None, results: dict[str, Any],
+) -> tuple[bool, Any]:
+    """(executed, result) for one stage, restoring it from the cache when possible."""
+    fingerprint = stage_fingerprint(stage, package_root, code) if cache is not None and stage.cached else None
+    if fingerprint is not None:
+        hit, result = cache.restore(stage, fingerprint, package_root)
+        if hit:
+            return False, result
+    result = stage.run(results)
+    if fingerprint is not None:
+        cache.save(stage, fingerprint, package_root, result)
+    return True, result
+
+
+def run_stages(
+    stages: Iterable[Stage],
+    package_root: Path,
+    cache: StageCache | None = None,
+    code: str | None = None,
+    jobs: int = 1,
+) -> tuple[dict[str, Any], list[str]]:
+    """Run every stage in dependency order, restoring unchanged ones from the
+    cache. Returns the results by stage name and the names actually executed,
+    in dependency order.
+
+    With jobs > 1 every stage whose predecessors are done is started on a
+    thread pool, so a build only waits on its critical path, as long as the
+    workers of the running stages stay within jobs. Ready stages start in
+    dependency order: a wide stage waiting for workers is not overtaken. After
+    a failure no new stage starts; the running ones finish and the first
+    failure (in dependency order) is raised, as a serial run would have raised
+    it.
+    """
+    package_root = Path(package_root)
+    order = ordered_stages(stages)
+    if cache is not None and code is None:
+        code = code_fingerprint()
+    results: dict[str, Any] = {}
+    ran: set[str] = set()
+    if jobs <= 1:
+        for stage in order:
+            executed, results[stage.name] = _execute(stage, package_root, cache, code, results)
+            if executed:
+                ran.add(stage.name)
+        return results, [stage.name for stage in order if stage.name in ran]
+
+    pending = list(order)
+    failures: dict[str, BaseException] = {}
+    busy = 0
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        running: dict[Future, Stage] = {}
+        while pending or running:
+            if not failures:
+                ready = [stage for stage in pending if set(stage.after) <= results.keys()]
+                for stage in ready:
+                    workers = min(max(1, stage.workers), jobs)
+                    if running and busy + workers > jobs:
+                        break
+                    pending.remove(stage)
+                    busy += workers
+                    running[pool.submit(_execute, stage, package_root, cache, code, dict(results))] = stage
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                busy -= min(max(1, stage.workers), jobs)
+                try:
+                    executed, results[stage.name] = future.result()
+                except BaseException as error:  # re-raised below once running stages are done
+                    failures[stage.name] = error
+                    continue
+                if executed:
+                    ran.add(stage.name)
+    if failures:
+        raise next(failures[stage.name] for stage in order if stage.name in failures)
+    return {stage.name: results[stage.name] for stage in order}, [stage.name for stage in order if stage.name in ran]
@@ -15,6 +15,8 @@ from PIL import Image, ImageDraw, ImageFont
 from pypdf import PdfWriter
 from pypdf.generic import ArrayObject, ByteStringObject
 
+from file_digests import sha256
+
 
 LAUNCH_DATE = "2026-07-26"
 CAMPAIGN_DATES = "17–28 août 2026"
@@ -32,10 +34,6 @@ SECONDE_PHYSICS = re.compile(
 )
 
 
-def sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
 def copy(source: Path, target: Path) -> None:
     target.parent.mkdir(parents=True, exist_ok=True)
     shutil.copyfile(source, target)
@@ -10,16 +10,52 @@ import os
 import subprocess
 from pathlib import Path
 
+from file_digests import sha256_many
+
 
 PUBLIC_EXCLUDED_PARTS = {"sources", "internal", "visual-review", "rendered"}
 PUBLIC_EXCLUDED_NAMES = {"qa-report.json", "qa-report.md", "frames.concat.txt"}
+# Content digests of tracked files by git blob ID, for --incremental. A blob
+# ID names exact content, so an entry never goes stale; it is a local cache.
+BLOB_INDEX = Path(".artifacts/pre-rentree-2026/release-inventory-blobs.json")
+BLOB_INDEX_MAX_ENTRIES = 100_000
+
+def clean_tracked_blobs(root: Path, targets: list[str]) -> dict[str, str]:
+    """Blob ID of every tracked regular file under targets whose working copy
+    git knows to match the index; one git ls-files and one git diff-files."""
+    listed = subprocess.check_output(["git", "ls-files", "-s", "-z", "--", *targets], cwd=root)
+    blobs = {}
+    for record in listed.split(b"\0"):
+        if not record:
+            continue
+        meta, _, path = record.partition(b"\t")
+        mode, blob, stage = meta.split()
+        if stage == b"0" and mode in (b"100644", b"100755"):
+            blobs[os.fsdecode(path)] = blob.decode("ascii")
+    modified = subprocess.check_output(
+        ["git", "diff-files", "--name-only", "--relative", "-z", "--", *targets], cwd=root,
+    )
+    for path in modified.split(b"\0"):
+        blobs.pop(os.fsdecode(path), None)
+    return blobs
+
 
-def digest(path: Path) -> str:
-    value = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            value.update(chunk)
-    return value.hexdigest()
+def load_blob_index(path: Path) -> dict[str, list]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_blob_index(path: Path, index: dict[str, list]) -> None:
+    entries = list(index.items())[-BLOB_INDEX_MAX_ENTRIES:]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    try:
+        temporary.write_text(json.dumps(dict(entries), separators=(",", ":")), encoding="utf-8")
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
 
 
 def release_commits(root: Path, baseline_sha: str, head_sha: str) -> list[dict]:
@@ -56,7 +92,13 @@ def files_for(
     targets: list[str],
     *,
     public_candidate: bool,
+    blobs: dict[str, str] | None = None,
+    blob_index: dict[str, list] | None = None,
 ) -> list[dict]:
+    """Inventory records of the files under targets. With blobs (from
+    clean_tracked_blobs) and a blob_index, a clean tracked file whose blob is
+    indexed at its current size is not read; every file hashed here that has
+    a blob is added to blob_index."""
     found: set[Path] = set()
     for target in targets:
         path = root / target
@@ -72,10 +114,26 @@ def files_for(
             if not PUBLIC_EXCLUDED_PARTS.intersection(path.relative_to(root).parts)
             and path.name not in PUBLIC_EXCLUDED_NAMES
         }
-    return [
-        {"path": path.relative_to(root).as_posix(), "bytes": path.stat().st_size, "sha256": digest(path)}
-        for path in sorted(found)
-    ]
+    blobs = blobs or {}
+    blob_index = blob_index if blob_index is not None else {}
+    records = []
+    unknown = []
+    for path in sorted(found):
+        relative = path.relative_to(root).as_posix()
+        record = {"path": relative, "bytes": path.stat().st_size, "sha256": None}
+        # A size check guards against checkout filters (LFS, eol conversion)
+        # that make the working copy differ from the blob.
+        indexed = blob_index.get(blobs.get(relative, ""))
+        if indexed is not None and indexed[0] == record["bytes"]:
+            record["sha256"] = indexed[1]
+        else:
+            unknown.append((path, record))
+        records.append(record)
+    for (path, record), digest in zip(unknown, sha256_many(path for path, _ in unknown)):
+        record["sha256"] = digest
+        if record["path"] in blobs:
+            blob_index[blobs[record["path"]]] = [record["bytes"], digest]
+    return records
 
 
 def public_document_targets(root: Path) -> list[str]:
@@ -106,6 +164,17 @@ def main() -> None:
     parser.add_argument("--pull-request", type=int)
     parser.add_argument("--baseline-sha")
     parser.add_argument("--repository-commit-sha", required=True)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="reuse the digests of clean tracked files from a local index keyed by git blob ID",
+    )
+    parser.add_argument(
+        "--blob-index",
+        type=Path,
+        default=BLOB_INDEX,
+        help="blob digest index read and written by --incremental, relative to --repo-root unless absolute",
+    )
     args = parser.parse_args()
     pull_request = args.pull_request
     if pull_request is None:
@@ -129,16 +198,18 @@ def main() -> None:
         )
     root = args.repo_root.resolve()
     output = args.output if args.output.is_absolute() else root / args.output
-    subprocess.run(
-        ["git", "cat-file", "-e", f"{args.repository_commit_sha}^{{commit}}"],
+    blob_index_path = args.blob_index if args.blob_index.is_absolute() else root / args.blob_index
+    checked = subprocess.run(
+        ["git", "cat-file", "--batch-check=%(objecttype)"],
         cwd=root,
+        input=f"{args.repository_commit_sha}^{{commit}}\n{baseline_sha}^{{commit}}\n",
         check=True,
-    )
-    subprocess.run(
-        ["git", "cat-file", "-e", f"{baseline_sha}^{{commit}}"],
-        cwd=root,
-        check=True,
-    )
+        capture_output=True,
+        text=True,
+    ).stdout.splitlines()
+    for sha, objecttype in zip((args.repository_commit_sha, baseline_sha), checked):
+        if objecttype != "commit":
+            raise RuntimeError(f"Not a commit in this repository: {sha}")
     groups_spec = [
         ("commercial-contract", ["content/pre-rentree-2026/commercial-contract.fr.json", "content/pre-rentree-2026/proofs.registry.json"], "INTERNAL_SOURCE"),
         ("week-one", ["assets/campaigns/pre-rentree-2026/week-one"], "INTERNAL_REVIEW"),
@@ -167,6 +238,11 @@ def main() -> None:
         ("economic-simulation", ["assets/operations/pre-rentree-2026/economic-simulation"], "INTERNAL_REVIEW"),
         ("release-governance", ["content/pre-rentree-2026/residual-debt.fr.json", "content/pre-rentree-2026/release-gates.json"], "INTERNAL_SOURCE"),
     ]
+    blobs: dict[str, str] = {}
+    blob_index: dict[str, list] = {}
+    if args.incremental:
+        blobs = clean_tracked_blobs(root, [target for _, targets, _ in groups_spec for target in targets])
+        blob_index = load_blob_index(blob_index_path)
     groups = [
         {
             "id": identifier,
@@ -175,10 +251,14 @@ def main() -> None:
                 root,
                 targets,
                 public_candidate=visibility == "PUBLIC_CANDIDATE",
+                blobs=blobs,
+                blob_index=blob_index,
             ),
         }
         for identifier, targets, visibility in groups_spec
     ]
+    if args.incremental:
+        save_blob_index(blob_index_path, blob_index)
     public_files = sorted(
         (
             item
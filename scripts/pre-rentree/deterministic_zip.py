@@ -0,0 +1,253 @@
+"""Deterministic ZIP archives whose entries are compressed on a process pool.
+
+zipfile deflates entry after entry on one core. ParallelZipWriter deflates
+entries independently in worker processes and lays out the local headers,
+the data and the central directory itself, in the order the entries are
+given. The bytes equal those zipfile.ZipFile.writestr() would write for the
+same ZipInfo, compression and level (see compression_for()), whatever the
+worker count. Memory stays bounded: entries compressed in this process are
+written chunk by chunk, and only entries up to PARALLEL_ENTRY_MAX_BYTES go to
+a worker, whose whole compressed stream comes back at once, with at most
+PARALLEL_WINDOW_BYTES of them in flight.
+
+Entries that are already compressed (PNG, JPEG, PDF, ZIP and everything
+built on it: XLSX, nested packages) are detected from their first bytes and
+stored: deflating them at any level costs as much CPU as the rest of the
+archive for a 1-2 % gain. ZIP64 is not written; the packages stay far below
+its limits and the writer refuses to go near them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import struct
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+CHUNK_BYTES = 1024 * 1024
+DEFAULT_LEVEL = 9
+# Below this much data to deflate, starting worker processes costs more than it saves.
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+PARALLEL_ENTRY_MAX_BYTES = 8 * 1024 * 1024
+# Bounds the compressed entries queued from the workers by their uncompressed
+# size: deflate never grows data by more than a few bytes per block.
+PARALLEL_WINDOW_BYTES = 64 * 1024 * 1024
+STORED_SIGNATURES = (
+    b"\x89PNG\r\n\x1a\n",
+    b"\xff\xd8\xff",  # JPEG
+    b"%PDF-",
+    b"PK\x03\x04",  # ZIP, XLSX
+)
+# zipfile switches to ZIP64 headers above ZIP64_LIMIT, for an entry as soon as
+# its announced size * 1.05 crosses it.
+_ENTRY_LIMIT = int(zipfile.ZIP64_LIMIT / 1.05)
+_UTF8_FILENAME = 0x800
+
+Source = Path | bytes
+
+
+@dataclass(frozen=True)
+class WrittenEntry:
+    name: str
+    file_size: int
+    compress_size: int
+    crc: int
+    sha256: str
+    compress_type: int
+
+
+def _chunks(source: Source) -> Iterator[bytes]:
+    if isinstance(source, bytes):
+        yield source
+        return
+    with Path(source).open("rb") as handle:
+        while chunk := handle.read(CHUNK_BYTES):
+            yield chunk
+
+
+def _head(source: Source) -> bytes:
+    if isinstance(source, bytes):
+        return source[:8]
+    with Path(source).open("rb") as handle:
+        return handle.read(8)
+
+
+def compression_for(info: zipfile.ZipInfo, head: bytes, level: int = DEFAULT_LEVEL) -> tuple[int, Optional[int]]:
+    """(compress_type, compresslevel) for an entry whose content starts with head."""
+    if info.compress_type == zipfile.ZIP_STORED or head.startswith(STORED_SIGNATURES):
+        return zipfile.ZIP_STORED, None
+    if info.compress_type != zipfile.ZIP_DEFLATED:
+        raise ValueError(f"Unsupported ZIP compression for {info.filename}: {info.compress_type}")
+    return zipfile.ZIP_DEFLATED, level
+
+
+def _deflate(source: Source, level: int) -> tuple[bytes, int, int, str]:
+    """Raw DEFLATE stream, CRC-32, size and SHA-256 of source, read once, in a
+    worker process."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    digest = hashlib.sha256()
+    crc = size = 0
+    pieces = []
+    for chunk in _chunks(source):
+        digest.update(chunk)
+        crc = zlib.crc32(chunk, crc)
+        size += len(chunk)
+        pieces.append(compressor.compress(chunk))
+    pieces.append(compressor.flush())
+    return b"".join(pieces), crc, size, digest.hexdigest()
+
+
+class ParallelZipWriter:
+    """Write a ZIP archive to a seekable binary file.
+
+    write() may be called several times, for instance to add a manifest of
+    the entries already written; close() (or leaving the with block) writes
+    the central directory. jobs=1 compresses in this process.
+    """
+
+    def __init__(self, file: BinaryIO, *, jobs: Optional[int] = None, level: int = DEFAULT_LEVEL):
+        self.file = file
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.level = level
+        self._infos: list[zipfile.ZipInfo] = []
+        self._names: set[str] = set()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelZipWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._shutdown()
+
+    def _shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def write(self, entries: Iterable[tuple[zipfile.ZipInfo, Source]]) -> list[WrittenEntry]:
+        """Add the entries in the given order; one WrittenEntry each."""
+        planned = []
+        deflated_bytes = 0
+        for info, source in entries:
+            if info.filename in self._names:
+                raise ValueError(f"Duplicate ZIP entry: {info.filename}")
+            self._names.add(info.filename)
+            size = len(source) if isinstance(source, bytes) else Path(source).stat().st_size
+            if size > _ENTRY_LIMIT:
+                raise ValueError(f"ZIP entry too large without ZIP64: {info.filename}")
+            compress_type, level = compression_for(info, _head(source), self.level)
+            if compress_type == zipfile.ZIP_DEFLATED:
+                deflated_bytes += size
+            planned.append((info, source, compress_type, level, size))
+
+        parallel = self.jobs > 1 and deflated_bytes >= PARALLEL_MIN_BYTES
+        if parallel and self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.jobs, mp_context=multiprocessing.get_context("spawn"))
+        # Entries waiting to be written in order, with the bytes each holds
+        # in flight on the pool.
+        pending: deque[tuple[zipfile.ZipInfo, Source, int, Optional[int], Optional[Future], int]] = deque()
+        queued_bytes = 0
+        written = []
+        for info, source, compress_type, level, size in planned:
+            future, queued = None, 0
+            if parallel and compress_type == zipfile.ZIP_DEFLATED and size <= PARALLEL_ENTRY_MAX_BYTES:
+                future, queued = self._pool.submit(_deflate, source, level), size
+            pending.append((info, source, compress_type, level, future, queued))
+            queued_bytes += queued
+            while pending and (not parallel or queued_bytes > PARALLEL_WINDOW_BYTES):
+                *entry, queued = pending.popleft()
+                written.append(self._write_entry(*entry))
+                queued_bytes -= queued
+        while pending:
+            *entry, _ = pending.popleft()
+            written.append(self._write_entry(*entry))
+        return written
+
+    def _write_entry(
+        self,
+        info: zipfile.ZipInfo,
+        source: Source,
+        compress_type: int,
+        level: Optional[int],
+        future: Optional[Future],
+    ) -> WrittenEntry:
+        info.compress_type = compress_type
+        info.flag_bits = 0
+        if not info.external_attr:
+            info.external_attr = 0o600 << 16
+        info.header_offset = self.file.tell()
+        if info.header_offset > zipfile.ZIP64_LIMIT:
+            raise ValueError(f"ZIP archive too large without ZIP64 at {info.filename}")
+        if future is None:
+            digest = self._stream(info, source, compress_type, level)
+        else:
+            data, info.CRC, info.file_size, digest = future.result()
+            info.compress_size = len(data)
+            self.file.write(info.FileHeader(False))
+            self.file.write(data)
+        self._infos.append(info)
+        return WrittenEntry(info.filename, info.file_size, info.compress_size, info.CRC, digest, compress_type)
+
+    def _stream(self, info: zipfile.ZipInfo, source: Source, compress_type: int, level: Optional[int]) -> str:
+        """Copy or deflate source in chunks after a provisional header, then
+        rewrite the header with the CRC and sizes, as zipfile does on a
+        seekable file."""
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15) if compress_type == zipfile.ZIP_DEFLATED else None
+        info.CRC = info.file_size = info.compress_size = 0
+        self.file.write(info.FileHeader(False))
+        digest = hashlib.sha256()
+        for chunk in _chunks(source):
+            digest.update(chunk)
+            info.CRC = zlib.crc32(chunk, info.CRC)
+            info.file_size += len(chunk)
+            data = compressor.compress(chunk) if compressor else chunk
+            info.compress_size += len(data)
+            self.file.write(data)
+        if compressor:
+            data = compressor.flush()
+            info.compress_size += len(data)
+            self.file.write(data)
+        end = self.file.tell()
+        self.file.seek(info.header_offset)
+        self.file.write(info.FileHeader(False))
+        self.file.seek(end)
+        return digest.hexdigest()
+
+    def close(self) -> None:
+        """Write the central directory and end record, as ZipFile.close() does."""
+        self._shutdown()
+        start = self.file.tell()
+        for info in self._infos:
+            year, month, day, hour, minute, second = info.date_time
+            dosdate = (year - 1980) << 9 | month << 5 | day
+            dostime = hour << 11 | minute << 5 | (second // 2)
+            try:
+                filename, flag_bits = info.filename.encode("ascii"), info.flag_bits
+            except UnicodeEncodeError:
+                filename, flag_bits = info.filename.encode("utf-8"), info.flag_bits | _UTF8_FILENAME
+            self.file.write(struct.pack(
+                zipfile.structCentralDir, zipfile.stringCentralDir,
+                info.create_version, info.create_system, info.extract_version, info.reserved,
+                flag_bits, info.compress_type, dostime, dosdate, info.CRC,
+                info.compress_size, info.file_size, len(filename), len(info.extra), len(info.comment),
+                0, info.internal_attr, info.external_attr, info.header_offset,
+            ))
+            self.file.write(filename + info.extra + info.comment)
+        size = self.file.tell() - start
+        if len(self._infos) > zipfile.ZIP_FILECOUNT_LIMIT or max(start, size) > zipfile.ZIP64_LIMIT:
+            raise ValueError("ZIP archive too large without ZIP64")
+        self.file.write(struct.pack(
+            zipfile.structEndArchive, zipfile.stringEndArchive,
+            0, 0, len(self._infos), len(self._infos), size, start, 0,
+        ))
+        self.file.flush()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 import shutil
@@ -16,6 +15,8 @@ import qrcode
 from fontTools.ttLib import TTFont
 from PIL import Image, ImageDraw, ImageFont
 
+from file_digests import sha256
+
 
 OUTPUT_NAME_BY_ASSET_ID = {
     "logo-slogan": "logo-slogan.png",
@@ -23,14 +24,6 @@ OUTPUT_NAME_BY_ASSET_ID = {
 }
 
 
-def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
-
-
 def _atomic_copy(source: Path, destination: Path) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
     temporary = destination.with_name(f".{destination.name}.tmp-{os.getpid()}")
@@ -47,7 +40,7 @@ def prepare_assets(snapshot: dict[str, Any], repo_root: Path, output_dir: Path)
         source = (repo_root / item["path"]).resolve()
         if not source.is_relative_to(repo_root) or not source.is_file():
             raise ValueError(f"Invalid project asset path: {item['path']}")
-        actual_hash = _sha256(source)
+        actual_hash = sha256(source)
         if actual_hash != item["sha256"]:
             raise ValueError(f"Asset hash mismatch: {item['id']}")
         filename = OUTPUT_NAME_BY_ASSET_ID.get(item["id"], source.name)
@@ -3,22 +3,34 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
-import math
+import queue
 import re
 import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from urllib.parse import urlparse
 
+import fitz
+import numpy as np
 import weasyprint
 from bs4 import BeautifulSoup
-from PIL import Image, ImageChops, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageFont
 from pypdf import PdfReader
 
 from document_assets import decode_qr
 from document_model import format_amount
+from file_digests import sha256
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools" / "pdf-generator"))
+from page_rasters import THUMBNAILS, SheetLayout, Thumbnail, contact_sheet, make_thumbnail  # noqa: E402
+from pdf_fonts import PdfFont, font_inventory, font_names  # noqa: E402
 
 
 BLOCKED_PUBLIC_PATTERNS = (
@@ -40,10 +52,6 @@ PRIVATE_KEY_PATTERN = "".join((
 ))
 
 
-def _sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
 def _normalized(value: str) -> str:
     return re.sub(r"\s+", " ", value).strip()
 
@@ -59,21 +67,84 @@ def _pdf_links(reader: PdfReader) -> list[str]:
     return sorted(targets)
 
 
-def _font_identifiers(path: Path) -> list[str]:
-    output = subprocess.run(["pdffonts", str(path)], check=True, capture_output=True, text=True).stdout
-    lines = output.splitlines()[2:]
-    return sorted({line.split()[0] for line in lines if line.split()})
+@dataclass(frozen=True)
+class PdfAnalysis:
+    """Everything the audits read from one PDF, parsed in a single pass. Fonts
+    come from pdf_fonts.font_inventory(), not a pdffonts process."""
+
+    sha256: str
+    size: int
+    page_texts: tuple[str, ...]
+    mediaboxes: tuple[tuple[float, float], ...]
+    links: tuple[str, ...]
+    title: str
+    author: str
+    language: str
+    tagged_pdf: bool
+    xmp: str
+    fonts: tuple[PdfFont, ...]
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_texts)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.page_texts)
+
+    @property
+    def font_identifiers(self) -> list[str]:
+        return font_names(self.fonts)
+
+
+_ANALYSIS_CACHE: OrderedDict[str, PdfAnalysis] = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 64
+_ANALYSIS_LOCK = threading.Lock()
+
+
+def analyze_pdf(path: Path) -> PdfAnalysis:
+    """Parse a PDF once per content hash; audit_pdf, build_visual_qa and the
+    blocked-term scan all read the same analysis."""
+    path = Path(path)
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    with _ANALYSIS_LOCK:
+        if digest in _ANALYSIS_CACHE:
+            _ANALYSIS_CACHE.move_to_end(digest)
+            return _ANALYSIS_CACHE[digest]
+
+    reader = PdfReader(io.BytesIO(data))
+    catalog = reader.trailer["/Root"]
+    metadata = reader.metadata
+    mark_info = catalog.get("/MarkInfo") or {}
+    xmp_stream = catalog.get("/Metadata")
+    analysis = PdfAnalysis(
+        sha256=digest,
+        size=len(data),
+        page_texts=tuple(page.extract_text() or "" for page in reader.pages),
+        mediaboxes=tuple((float(page.mediabox.width), float(page.mediabox.height)) for page in reader.pages),
+        links=tuple(_pdf_links(reader)),
+        title=(metadata.title if metadata else None) or "",
+        author=(metadata.author if metadata else None) or "",
+        language=str(catalog.get("/Lang", "")),
+        tagged_pdf=bool(catalog.get("/StructTreeRoot") and mark_info.get("/Marked")),
+        xmp=xmp_stream.get_object().get_data().decode("utf-8", errors="replace") if xmp_stream else "",
+        fonts=tuple(font_inventory(reader)),
+    )
+    with _ANALYSIS_LOCK:
+        _ANALYSIS_CACHE[digest] = analysis
+        while len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+    return analysis
 
 
 def audit_pdf(path: Path, snapshot: dict[str, Any]) -> dict[str, Any]:
     path = Path(path).resolve()
-    reader = PdfReader(str(path))
-    text = "\n".join(page.extract_text() or "" for page in reader.pages)
-    language = str(reader.trailer["/Root"].get("/Lang", ""))
+    analysis = analyze_pdf(path)
+    text = analysis.text
     a4_pages = sum(
-        abs(float(page.mediabox.width) - 595.276) < 1
-        and abs(float(page.mediabox.height) - 841.89) < 1
-        for page in reader.pages
+        abs(width - 595.276) < 1 and abs(height - 841.89) < 1
+        for width, height in analysis.mediaboxes
     )
     secret_patterns = (
         PRIVATE_KEY_PATTERN,
@@ -91,33 +162,25 @@ def audit_pdf(path: Path, snapshot: dict[str, Any]) -> dict[str, Any]:
         r"\bplani\s+cation\b",
         r"\bspéci\s+que\b",
     )
-    metadata = reader.metadata
-    catalog = reader.trailer["/Root"]
-    mark_info = catalog.get("/MarkInfo") or {}
-    tagged_pdf = bool(catalog.get("/StructTreeRoot") and mark_info.get("/Marked"))
-    xmp_stream = catalog.get("/Metadata")
-    xmp = ""
-    if xmp_stream:
-        xmp = xmp_stream.get_object().get_data().decode("utf-8", errors="replace")
     return {
         "PDF_FILE": path.name,
-        "PDF_SHA256": _sha256(path),
-        "PAGE_COUNT": len(reader.pages),
-        "FILE_SIZE": path.stat().st_size,
-        "TITLE": metadata.title or "",
-        "AUTHOR": metadata.author or "",
-        "LANGUAGE": language,
+        "PDF_SHA256": analysis.sha256,
+        "PAGE_COUNT": analysis.page_count,
+        "FILE_SIZE": analysis.size,
+        "TITLE": analysis.title,
+        "AUTHOR": analysis.author,
+        "LANGUAGE": analysis.language,
         "A4_PAGE_COUNT": a4_pages,
         "TEXT_EXTRACTABLE": bool(_normalized(text)),
-        "TAGGED_PDF": tagged_pdf,
-        "PDF_UA_IDENTIFIER_PRESENT": "pdfuaid:part" in xmp,
+        "TAGGED_PDF": analysis.tagged_pdf,
+        "PDF_UA_IDENTIFIER_PRESENT": "pdfuaid:part" in analysis.xmp,
         "BROKEN_GLYPH_COUNT": text.count("\ufffd"),
         "LIGATURE_CORRUPTION_COUNT": sum(
             len(re.findall(pattern, text, re.IGNORECASE))
             for pattern in ligature_corruption_patterns
         ),
-        "FONT_IDENTIFIERS": _font_identifiers(path),
-        "LINK_TARGETS": _pdf_links(reader),
+        "FONT_IDENTIFIERS": analysis.font_identifiers,
+        "LINK_TARGETS": list(analysis.links),
         "SECRET_FINDING_COUNT": sum(bool(re.search(pattern, text)) for pattern in secret_patterns),
         "PII_TEST_FINDING_COUNT": sum(bool(re.search(pattern, text, re.IGNORECASE)) for pattern in pii_test_patterns),
         "DOCUMENT_EDITION_DATE": snapshot["document"]["documentEditionDate"],
@@ -216,7 +279,7 @@ def audit_social_visuals(snapshot: dict[str, Any], social_root: Path) -> dict[st
         record = {
             "IMAGE_KEY": key,
             "IMAGE_FILE": path.name,
-            "SHA256": _sha256(path),
+            "SHA256": sha256(path),
             "WIDTH": image.width,
             "HEIGHT": image.height,
             "DARK_INK_BOUNDING_BOX": list(ink_box) if ink_box else None,
@@ -251,8 +314,7 @@ def _public_text_files(root: Path):
         soup = BeautifulSoup(html_path.read_text(encoding="utf-8"), "html.parser")
         yield html_path, soup.get_text(" ")
     for pdf in sorted(root.glob("*.pdf")):
-        reader = PdfReader(str(pdf))
-        yield pdf, "\n".join(page.extract_text() or "" for page in reader.pages)
+        yield pdf, analyze_pdf(pdf).text
 
 
 def scan_blocked_public_terms(public_root: Path) -> list[dict[str, str]]:
@@ -542,8 +604,8 @@ def build_document_manifest(
         "SOURCE_ANCHOR_SHA": snapshot["sourceAnchorSha"],
         "REPOSITORY_COMMIT_SHA": snapshot["repositoryCommitSha"],
         "SOURCE_SET_SHA256": snapshot["sourceSetSha256"],
-        "SNAPSHOT_SHA256": _sha256(snapshot_path),
-        "GENERATOR_SHA256": _sha256(generator_path),
+        "SNAPSHOT_SHA256": sha256(snapshot_path),
+        "GENERATOR_SHA256": sha256(generator_path),
         "FONT_IDENTIFIERS": sorted({font for record in pdf_records for font in record["FONT_IDENTIFIERS"]}),
         **tool_versions,
         "QR_TARGET": snapshot["document"]["qrTarget"],
@@ -569,152 +631,200 @@ def build_document_manifest(
     return manifest
 
 
-def _rasterize_pdf(pdf_path: Path, destination: Path, dpi: int) -> list[Path]:
-    destination.mkdir(parents=True, exist_ok=True)
-    prefix = destination / pdf_path.stem
-    subprocess.run(
-        [
-            "pdftoppm",
-            "-png",
-            "-r",
-            str(dpi),
-            str(pdf_path),
-            str(prefix),
-        ],
-        check=True,
-        capture_output=True,
-    )
-    pages = sorted(destination.glob(f"{pdf_path.stem}-*.png"))
-    if not pages:
-        raise ValueError(f"No raster page produced for {pdf_path.name}")
-    return pages
-
-
-def _ink_geometry(path: Path) -> dict[str, Any]:
-    with Image.open(path) as source:
-        image = source.convert("RGB")
-        grayscale = image.convert("L")
-        dark_mask = grayscale.point(lambda value: 255 if value < 235 else 0)
-        bbox = dark_mask.getbbox()
-        histogram = dark_mask.histogram()
-        dark_pixels = histogram[255]
-        total_pixels = image.width * image.height
-        footer_top = int(image.height * 0.91)
-        footer_band = dark_mask.crop((0, footer_top, image.width, image.height))
-        footer_ink = footer_band.histogram()[255]
-        edge = max(2, round(min(image.size) * 0.0025))
-        edge_regions = (
-            dark_mask.crop((0, 0, image.width, edge)),
-            dark_mask.crop((0, image.height - edge, image.width, image.height)),
-            dark_mask.crop((0, 0, edge, image.height)),
-            dark_mask.crop((image.width - edge, 0, image.width, image.height)),
+_RASTER_QUEUE_DEPTH = 2
+_GEOMETRY_BATCH = 4
+_CONTACT_SHEET_LAYOUT = SheetLayout(
+    columns=4,
+    cell=(248 + 12, 350 + 42 + 12),
+    thumbnail=Thumbnail((248, 350), "pad"),
+    label_offset=(0, 350 + 4),
+    background="#e8e8e8",
+    margin=12,
+)
+
+
+def _stream_rasters(pdf_path: Path, dpi: int, depth: int = _RASTER_QUEUE_DEPTH) -> Iterator[Image.Image]:
+    """Yield each page as an in-memory RGB image. A background thread renders
+    ahead through a bounded queue, so at most `depth` pages are held whatever
+    the page count; closing the generator stops the renderer."""
+    pages: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    finished = object()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def render() -> None:
+        try:
+            with fitz.open(pdf_path) as document:
+                matrix = fitz.Matrix(dpi / 72, dpi / 72)
+                for page in document:
+                    pixmap = page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB, alpha=False)
+                    image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+                    if not put(image):
+                        return
+        except BaseException as error:  # re-raised by the consumer
+            put(error)
+            return
+        put(finished)
+
+    renderer = threading.Thread(target=render, name=f"rasterize-{pdf_path.name}", daemon=True)
+    renderer.start()
+    try:
+        while (item := pages.get()) is not finished:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        renderer.join()
+
+
+def _encode_png(image: Image.Image, destination: Path) -> str:
+    """Write the page PNG once and return the SHA-256 of the written bytes."""
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=False, compress_level=6)
+    data = buffer.getvalue()
+    destination.write_bytes(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def _grayscale(image: Image.Image) -> np.ndarray:
+    """The page as a uint8 luma array, converted exactly as PIL's "L" mode."""
+    return np.asarray(image.convert("RGB").convert("L"))
+
+
+def _ink_geometries(pages: list[np.ndarray]) -> list[dict[str, Any]]:
+    """Ink geometry of uint8 grayscale pages. Pages of the same size are
+    stacked and measured together: one dark mask, reduced once to per-row and
+    per-column counts, gives the bounding box, the dark ratio, the footer band
+    and the edge strips without cropping or histogramming any region."""
+    geometries: list[dict[str, Any] | None] = [None] * len(pages)
+    by_shape: dict[tuple[int, int], list[int]] = {}
+    for index, page in enumerate(pages):
+        if page.ndim != 2 or page.dtype != np.uint8:
+            raise ValueError(f"Ink geometry needs 2-D uint8 pages, got {page.dtype} {page.shape}")
+        by_shape.setdefault(page.shape, []).append(index)
+    for (height, width), indices in by_shape.items():
+        dark = np.stack([pages[index] for index in indices]) < 235
+        row_ink = dark.sum(axis=2, dtype=np.int32)
+        column_ink = dark.sum(axis=1, dtype=np.int32)
+        dark_pixels = row_ink.sum(axis=1, dtype=np.int64)
+        footer_ink = row_ink[:, int(height * 0.91):].sum(axis=1)
+        edge = max(2, round(min(width, height) * 0.0025))
+        # The four strips overlap at the corners; corner ink counts in both, as it always has.
+        edge_ink = (
+            row_ink[:, :edge].sum(axis=1) + row_ink[:, height - edge:].sum(axis=1)
+            + column_ink[:, :edge].sum(axis=1) + column_ink[:, width - edge:].sum(axis=1)
         )
-        edge_ink = sum(region.histogram()[255] for region in edge_regions)
-        return {
-            "WIDTH": image.width,
-            "HEIGHT": image.height,
-            "INK_BOUNDING_BOX": list(bbox) if bbox else None,
-            "DARK_PIXEL_RATIO": round(dark_pixels / total_pixels, 8),
-            "FOOTER_INK_PIXEL_COUNT": footer_ink,
-            "EDGE_INK_PIXEL_COUNT": edge_ink,
-            "BLANK_PAGE_SCORE": round(1 - (dark_pixels / total_pixels), 8),
-        }
+        inked_rows = row_ink > 0
+        inked_columns = column_ink > 0
+        total_pixels = width * height
+        for position, index in enumerate(indices):
+            bbox = None
+            if dark_pixels[position]:
+                rows = inked_rows[position]
+                columns = inked_columns[position]
+                # PIL getbbox() convention: right and bottom are exclusive.
+                bbox = [
+                    int(columns.argmax()),
+                    int(rows.argmax()),
+                    width - int(columns[::-1].argmax()),
+                    height - int(rows[::-1].argmax()),
+                ]
+            ratio = int(dark_pixels[position]) / total_pixels
+            geometries[index] = {
+                "WIDTH": width,
+                "HEIGHT": height,
+                "INK_BOUNDING_BOX": bbox,
+                "DARK_PIXEL_RATIO": round(ratio, 8),
+                "FOOTER_INK_PIXEL_COUNT": int(footer_ink[position]),
+                "EDGE_INK_PIXEL_COUNT": int(edge_ink[position]),
+                "BLANK_PAGE_SCORE": round(1 - ratio, 8),
+            }
+    return geometries
 
 
-def _thumbnail(path: Path, size: tuple[int, int]) -> Image.Image:
-    with Image.open(path) as source:
-        image = source.convert("RGB")
-    image.thumbnail(size, Image.Resampling.LANCZOS)
-    canvas = Image.new("RGB", size, "white")
-    canvas.paste(image, ((size[0] - image.width) // 2, (size[1] - image.height) // 2))
-    return canvas
-
-
-def _contact_sheet(
-    entries: list[tuple[str, Path]], destination: Path, columns: int = 4,
-) -> Path:
-    thumb_size = (248, 350)
-    label_height = 42
-    gap = 12
-    rows = max(1, math.ceil(len(entries) / columns))
-    sheet = Image.new(
-        "RGB",
-        (
-            columns * (thumb_size[0] + gap) + gap,
-            rows * (thumb_size[1] + label_height + gap) + gap,
-        ),
-        "#e8e8e8",
+def _ink_geometry(image: Image.Image) -> dict[str, Any]:
+    return _ink_geometries([_grayscale(image)])[0]
+
+
+def _contact_sheet(entries: list[tuple[str, Path, str | None]], destination: Path) -> Path:
+    """entries: (label, page PNG, its SHA-256 when its thumbnail may be cached)."""
+    sheet = contact_sheet(
+        [(label[:74], path, sha256) for label, path, sha256 in entries],
+        _CONTACT_SHEET_LAYOUT,
+        ImageFont.load_default(),
     )
-    draw = ImageDraw.Draw(sheet)
-    font = ImageFont.load_default()
-    for index, (label, path) in enumerate(entries):
-        row, column = divmod(index, columns)
-        left = gap + column * (thumb_size[0] + gap)
-        top = gap + row * (thumb_size[1] + label_height + gap)
-        sheet.paste(_thumbnail(path, thumb_size), (left, top))
-        draw.multiline_text(
-            (left, top + thumb_size[1] + 4),
-            label[:74],
-            fill="black",
-            font=font,
-            spacing=2,
-        )
     destination.parent.mkdir(parents=True, exist_ok=True)
     sheet.save(destination, format="PNG", optimize=False, compress_level=9)
     return destination
 
 
-def build_visual_qa(
+def visual_qa_inputs(snapshot: dict[str, Any]) -> dict[str, Any]:
+    """The part of the snapshot visual QA reads; an incremental build keys the
+    per-document raster stages on it, so other edits leave them untouched."""
+    return {
+        "document": {"outputs": {"publicPdf": snapshot["document"]["outputs"]["publicPdf"]}},
+        "campaign": {
+            "startDate": snapshot["campaign"]["startDate"],
+            "venue": {"neighborhood": snapshot["campaign"]["venue"]["neighborhood"]},
+        },
+        "contact": {"phone": snapshot["contact"]["phone"], "domain": snapshot["contact"]["domain"]},
+    }
+
+
+def visual_qa_document(
     snapshot: dict[str, Any],
+    key: str,
     public_root: Path,
     output_root: Path,
     dpi: int = 200,
 ) -> dict[str, Any]:
-    """Rasterize every public page and build deterministic visual evidence.
-
-    Automated findings are deliberately conservative. Subjective polish remains a
-    mandatory page-by-page owner review recorded separately from defect counters.
-    """
+    """Rasterize one public PDF and check its pages; build_visual_qa() runs it
+    for every document and assembles the results."""
 
     if dpi < 72:
         raise ValueError("Visual QA requires at least 72 DPI")
     public_root = Path(public_root).resolve()
     output_root = Path(output_root).resolve()
-    raster_root = output_root / "RASTERS_200_DPI"
-    output_root.mkdir(parents=True, exist_ok=True)
+    filename = snapshot["document"]["outputs"]["publicPdf"][key]
+    pdf_path = public_root / filename
+    if not pdf_path.is_file():
+        raise FileNotFoundError(f"Missing public PDF for visual QA: {pdf_path}")
 
     evidence: list[dict[str, Any]] = []
-    contact_entries: list[tuple[str, Path]] = []
     defects: list[dict[str, Any]] = []
-    for key, filename in snapshot["document"]["outputs"]["publicPdf"].items():
-        pdf_path = public_root / filename
-        if not pdf_path.is_file():
-            raise FileNotFoundError(f"Missing public PDF for visual QA: {pdf_path}")
-        reader = PdfReader(str(pdf_path))
-        raster_pages = _rasterize_pdf(pdf_path, raster_root / key, dpi)
-        if len(raster_pages) != len(reader.pages):
-            defects.append({
-                "CODE": "RASTER_PAGE_COUNT_MISMATCH",
-                "PDF_FILE": filename,
-                "EXPECTED": len(reader.pages),
-                "ACTUAL": len(raster_pages),
-            })
-        for page_number, image_path in enumerate(raster_pages, start=1):
-            geometry = _ink_geometry(image_path)
-            page_text = reader.pages[page_number - 1].extract_text() or ""
+    analysis = analyze_pdf(pdf_path)
+    raster_dir = output_root / "RASTERS_200_DPI" / key
+    raster_dir.mkdir(parents=True, exist_ok=True)
+    digits = len(str(analysis.page_count))
+    raster_count = 0
+    # Grayscale pages waiting for their ink geometry, measured _GEOMETRY_BATCH at a time.
+    pending: list[tuple[int, Path, str, np.ndarray]] = []
+
+    def check_pending() -> None:
+        geometries = _ink_geometries([gray for *_, gray in pending])
+        for (page_number, image_path, image_sha256, _), geometry in zip(pending, geometries):
+            page_text = analysis.page_texts[page_number - 1]
             relative_path = image_path.relative_to(output_root).as_posix()
             contact_label = f"{key} · page {page_number}"
             record = {
                 "PDF_FILE": filename,
                 "PAGE": page_number,
                 "IMAGE_PATH": relative_path,
-                "SHA256": _sha256(image_path),
+                "SHA256": image_sha256,
                 "TEXT_SHA256": hashlib.sha256(_normalized(page_text).encode("utf-8")).hexdigest(),
                 "CONTACT_SHEET_LABEL": contact_label,
                 **geometry,
             }
             evidence.append(record)
-            contact_entries.append((contact_label, image_path))
             expected_width = round(8.2677 * dpi)
             expected_height = round(11.6929 * dpi)
             if abs(geometry["WIDTH"] - expected_width) > 4 or abs(geometry["HEIGHT"] - expected_height) > 4:
@@ -748,7 +858,39 @@ def build_visual_qa(
                     "COUNTERS": page_counters,
                     **record,
                 })
-
+        pending.clear()
+
+    for page_number, image in enumerate(_stream_rasters(pdf_path, dpi), start=1):
+        raster_count = page_number
+        # Named as pdftoppm named them: page numbers padded to the page count's width.
+        image_path = raster_dir / f"{pdf_path.stem}-{page_number:0{digits}d}.png"
+        image_sha256 = _encode_png(image, image_path)
+        THUMBNAILS.put(image_sha256, _CONTACT_SHEET_LAYOUT.thumbnail, make_thumbnail(image, _CONTACT_SHEET_LAYOUT.thumbnail))
+        pending.append((page_number, image_path, image_sha256, _grayscale(image)))
+        if len(pending) >= _GEOMETRY_BATCH:
+            check_pending()
+    check_pending()
+    if not raster_count:
+        raise ValueError(f"No raster page produced for {pdf_path.name}")
+    if raster_count != analysis.page_count:
+        defects.insert(0, {
+            "CODE": "RASTER_PAGE_COUNT_MISMATCH",
+            "PDF_FILE": filename,
+            "EXPECTED": analysis.page_count,
+            "ACTUAL": raster_count,
+        })
+    return {"PAGE_EVIDENCE": evidence, "AUTOMATED_DEFECTS": defects}
+
+
+def assemble_visual_qa(documents: list[dict[str, Any]], output_root: Path, dpi: int = 200) -> dict[str, Any]:
+    """Contact sheet and report over visual_qa_document() results, in document order."""
+    output_root = Path(output_root).resolve()
+    output_root.mkdir(parents=True, exist_ok=True)
+    evidence = [record for document in documents for record in document["PAGE_EVIDENCE"]]
+    defects = [defect for document in documents for defect in document["AUTOMATED_DEFECTS"]]
+    contact_entries = [
+        (record["CONTACT_SHEET_LABEL"], output_root / record["IMAGE_PATH"], record["SHA256"]) for record in evidence
+    ]
     contact_sheet = _contact_sheet(contact_entries, output_root / "visual-contact-sheet.png")
 
     report = {
@@ -765,3 +907,24 @@ def build_visual_qa(
     diff_path = output_root / report["VISUAL_REPORT"]
     diff_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
     return report
+
+
+def build_visual_qa(
+    snapshot: dict[str, Any],
+    public_root: Path,
+    output_root: Path,
+    dpi: int = 200,
+) -> dict[str, Any]:
+    """Rasterize every public page and build deterministic visual evidence.
+
+    Automated findings are deliberately conservative. Subjective polish remains a
+    mandatory page-by-page owner review recorded separately from defect counters.
+    """
+
+    if dpi < 72:
+        raise ValueError("Visual QA requires at least 72 DPI")
+    documents = [
+        visual_qa_document(snapshot, key, public_root, output_root, dpi)
+        for key in snapshot["document"]["outputs"]["publicPdf"]
+    ]
+    return assemble_visual_qa(documents, output_root, dpi)
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import mimetypes
+import multiprocessing
 import os
 import re
 import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -19,6 +22,16 @@ from weasyprint.urls import URLFetcherResponse
 
 from document_templates import render_public_documents
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools" / "pdf-generator"))
+from render_cache import (  # noqa: E402
+    RenderCache,
+    qpdf_version,
+    referenced_asset_parts,
+    render_key,
+    source_digest,
+    weasyprint_version,
+)
+
 
 def _atomic_text(path: Path, value: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -133,32 +146,47 @@ def _canonicalize_tagged_pdf(source: Path, destination: Path) -> None:
         canonical_pdf.unlink(missing_ok=True)
 
 
-def render_public_pdfs(
-    snapshot: dict[str, Any], html_dir: Path, output_dir: Path,
-) -> dict[str, Path]:
-    html_dir = Path(html_dir).resolve()
-    output_dir = Path(output_dir).resolve()
-    output_dir.mkdir(parents=True, exist_ok=True)
-    html_names = snapshot["document"]["outputs"]["publicHtml"]
-    pdf_names = snapshot["document"]["outputs"]["publicPdf"]
-    font_config = FontConfiguration()
-    rendered: dict[str, Path] = {}
-    package_root = html_dir.parent
+_WORKER_FONT_CONFIGURATION: FontConfiguration | None = None
+
+
+def _init_render_worker() -> None:
+    global _WORKER_FONT_CONFIGURATION
+    _WORKER_FONT_CONFIGURATION = FontConfiguration()
+
+
+def _render_key(stable_html: str, package_root: Path, identifier: bytes, edition_date: str) -> str:
+    assets_dir = package_root / "ASSETS"
 
-    with _source_date_epoch(snapshot["document"]["documentEditionDate"]):
-        for key, pdf_name in pdf_names.items():
-            html_path = html_dir / html_names[key]
-            if not html_path.is_file():
-                raise FileNotFoundError(f"Missing accessible HTML source: {html_path}")
-            destination = output_dir / pdf_name
-            temporary = destination.with_name(f".{destination.name}.tmp-{os.getpid()}")
-            identifier = hashlib.sha256(
-                f'{snapshot["repositoryCommitSha"]}:{snapshot["document"]["documentPackageVersion"]}:{pdf_name}'.encode("utf-8"),
-            ).digest()
-            stable_html, fetcher = _stable_pdf_html(html_path, package_root)
+    def resolve(name: str) -> Path | None:
+        asset_path = (assets_dir / name).resolve()
+        return asset_path if asset_path.is_relative_to(assets_dir) else None
+
+    return render_key(
+        source_digest(Path(__file__)), weasyprint_version(), qpdf_version(), stable_html, identifier, edition_date,
+        *referenced_asset_parts(stable_html, "nexus-asset:", resolve),
+    )
+
+
+def _render_pdf(
+    html_path: Path,
+    package_root: Path,
+    destination: Path,
+    identifier: bytes,
+    edition_date: str,
+    font_config: FontConfiguration | None = None,
+    cache: RenderCache | None = None,
+) -> Path:
+    """Render and canonicalize one document, in-process or in a pool worker
+    (which then uses its own FontConfiguration). With a cache, an unchanged
+    document is copied from it instead of rendered."""
+    temporary = destination.with_name(f".{destination.name}.tmp-{os.getpid()}")
+    with _source_date_epoch(edition_date):
+        stable_html, fetcher = _stable_pdf_html(html_path, package_root)
+        key = _render_key(stable_html, package_root, identifier, edition_date) if cache is not None else None
+        if key is None or not cache.fetch(key, destination):
             HTML(string=stable_html, base_url="nexus-document:", url_fetcher=fetcher).write_pdf(
                 str(temporary),
-                font_config=font_config,
+                font_config=font_config or _WORKER_FONT_CONFIGURATION,
                 pdf_identifier=identifier,
                 custom_metadata=True,
                 presentational_hints=True,
@@ -167,7 +195,47 @@ def render_public_pdfs(
                 optimize_images=False,
             )
             _canonicalize_tagged_pdf(temporary, destination)
-            with destination.open("rb") as handle:
-                os.fsync(handle.fileno())
-            rendered[key] = destination
-    return rendered
+            if key is not None:
+                cache.store(key, destination)
+    with destination.open("rb") as handle:
+        os.fsync(handle.fileno())
+    return destination
+
+
+def render_public_pdfs(
+    snapshot: dict[str, Any], html_dir: Path, output_dir: Path, *, jobs: int = 1, cache: RenderCache | None = None,
+) -> dict[str, Path]:
+    """Render every public PDF. With jobs > 1 documents are rendered in a
+    process pool; each job carries its own pdf_identifier and edition date,
+    so the bytes match a serial build. A cache skips documents whose inputs
+    are unchanged since a previous build."""
+    html_dir = Path(html_dir).resolve()
+    output_dir = Path(output_dir).resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    html_names = snapshot["document"]["outputs"]["publicHtml"]
+    pdf_names = snapshot["document"]["outputs"]["publicPdf"]
+    edition_date = snapshot["document"]["documentEditionDate"]
+    package_root = html_dir.parent
+
+    tasks: dict[str, tuple] = {}
+    for key, pdf_name in pdf_names.items():
+        html_path = html_dir / html_names[key]
+        if not html_path.is_file():
+            raise FileNotFoundError(f"Missing accessible HTML source: {html_path}")
+        identifier = hashlib.sha256(
+            f'{snapshot["repositoryCommitSha"]}:{snapshot["document"]["documentPackageVersion"]}:{pdf_name}'.encode("utf-8"),
+        ).digest()
+        tasks[key] = (html_path, package_root, output_dir / pdf_name, identifier, edition_date)
+
+    if jobs <= 1 or len(tasks) <= 1:
+        font_config = FontConfiguration()
+        return {key: _render_pdf(*task, font_config, cache) for key, task in tasks.items()}
+    # Spawned, not forked: the build graph calls this from a thread while
+    # other stages run, and a forked child could inherit a lock held by one.
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(tasks)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_render_worker,
+    ) as pool:
+        futures = {key: pool.submit(_render_pdf, *task, None, cache) for key, task in tasks.items()}
+        return {key: future.result() for key, future in futures.items()}
@@ -0,0 +1,159 @@
+"""SHA-256 of files, shared by every build and verification script.
+
+Each script used to hash with its own path.read_bytes() helper, so a release
+verification read every artifact several times and held whole videos in
+memory. Files are now read in 1 MiB chunks (memory-mapped above 64 MiB), and
+a DigestCache remembers each digest under the file's (device, inode, size,
+mtime_ns, ctime_ns). ctime cannot be set back by a tool that normalizes
+mtimes, so any rewrite of the file misses the cache. sha256_many() hashes on
+a thread pool: hashlib releases the GIL on large buffers.
+
+The cache lives in .artifacts (clean_artifacts.py empties it) and is written
+back when the process exits. PRE_RENTREE_DIGEST_CACHE overrides its path; set
+to an empty string, it keeps the cache in memory, as tests running scripts
+against the checkout do. A digest taken less than RACY_SECONDS after
+the file's last change is used but not remembered, because a write in the
+same timestamp tick would go unnoticed on a coarse-grained filesystem.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_PATH = REPO_ROOT / ".artifacts/pre-rentree-2026/digest-cache.json"
+CACHE_PATH_ENV = "PRE_RENTREE_DIGEST_CACHE"
+DEFAULT_MAX_ENTRIES = 100_000
+CHUNK_BYTES = 1024 * 1024
+MMAP_MIN_BYTES = 64 * 1024 * 1024
+RACY_SECONDS = 2
+CACHE_SCHEMA_VERSION = 1
+
+
+def _identity(stat: os.stat_result) -> list[int]:
+    return [stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns]
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of the file, without the cache."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        else:
+            while chunk := handle.read(CHUNK_BYTES):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DigestCache:
+    """Digests by absolute path, valid while the file's identity is unchanged.
+
+    path=None keeps the cache in memory only.
+    """
+
+    def __init__(self, path: Optional[Path] = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path) if path is not None else None
+        self.max_entries = max_entries
+        self._entries: Optional[OrderedDict[str, list]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _read(self) -> OrderedDict[str, list]:
+        if self.path is not None:
+            try:
+                stored = json.loads(self.path.read_text(encoding="utf-8"))
+            except (FileNotFoundError, ValueError):
+                stored = None
+            if isinstance(stored, dict) and stored.get("schemaVersion") == CACHE_SCHEMA_VERSION:
+                return OrderedDict(stored["entries"])
+        return OrderedDict()
+
+    def _loaded(self) -> OrderedDict[str, list]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def sha256(self, path: Path) -> str:
+        key = os.path.abspath(path)
+        identity = _identity(os.stat(key))
+        with self._lock:
+            entries = self._loaded()
+            cached = entries.get(key)
+            if cached is not None and cached[:-1] == identity:
+                entries.move_to_end(key)
+                return cached[-1]
+        value = hash_file(key)
+        after = os.stat(key)
+        if _identity(after) == identity and time.time_ns() - after.st_ctime_ns > RACY_SECONDS * 1_000_000_000:
+            with self._lock:
+                entries = self._loaded()
+                entries[key] = [*identity, value]
+                entries.move_to_end(key)
+                self._dirty = True
+        return value
+
+    def sha256_many(self, paths: Iterable[Path], jobs: Optional[int] = None) -> list[str]:
+        """Digests in the order of paths, hashed on up to jobs threads."""
+        paths = list(paths)
+        workers = max(1, min(len(paths), jobs or os.cpu_count() or 1))
+        if workers == 1:
+            return [self.sha256(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.sha256, paths))
+
+    def save(self) -> None:
+        """Merge into the stored cache and write it atomically, if anything was learned."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            entries = self._read()
+            for key, value in self._entries.items():
+                entries[key] = value
+                entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(f".{self.path.name}.tmp-{os.getpid()}-{threading.get_ident()}")
+            try:
+                temporary.write_text(
+                    json.dumps({"schemaVersion": CACHE_SCHEMA_VERSION, "entries": entries}, separators=(",", ":")),
+                    encoding="utf-8",
+                )
+                os.replace(temporary, self.path)
+            finally:
+                temporary.unlink(missing_ok=True)
+            self._entries = entries
+            self._dirty = False
+
+
+def cache_path_from_environment() -> Optional[Path]:
+    """The shared cache's path: PRE_RENTREE_DIGEST_CACHE, None (memory only)
+    when it is empty, DEFAULT_CACHE_PATH when it is unset."""
+    value = os.environ.get(CACHE_PATH_ENV)
+    if value is None:
+        return DEFAULT_CACHE_PATH
+    return Path(value) if value else None
+
+
+DIGESTS = DigestCache(cache_path_from_environment())
+atexit.register(DIGESTS.save)
+
+
+def sha256(path: Path) -> str:
+    return DIGESTS.sha256(path)
+
+
+def sha256_many(paths: Iterable[Path], jobs: Optional[int] = None) -> list[str]:
+    return DIGESTS.sha256_many(paths, jobs)
@@ -13,20 +13,24 @@ import uuid
 from pathlib import Path
 from typing import Any
 
+from build_graph import Stage, StageCache, run_stages
 from document_assets import generate_qr, generate_social_visuals, prepare_assets
 from document_audit import (
+    assemble_visual_qa,
     audit_html_accessibility,
     audit_pdf,
     audit_social_visuals,
     audit_stylesheet_accessibility,
     build_content_gate_report,
     build_document_manifest,
-    build_visual_qa,
+    visual_qa_document,
+    visual_qa_inputs,
 )
 from document_model import load_snapshot
-from document_renderer import render_public_pdfs, write_public_html
+from document_renderer import RenderCache, qpdf_version, render_public_pdfs, weasyprint_version, write_public_html
 from operational_artifacts import generate_review_artifacts
 from verify_release import write_review_governance
+from visual_diff import VISUAL_REPORT, compare_visual_builds
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -130,45 +134,201 @@ def _browser_review(snapshot: dict[str, Any], package_root: Path) -> dict[str, A
     return json.loads(completed.stdout)
 
 
+def _build_stages(
+    snapshot: dict[str, Any],
+    package_root: Path,
+    *,
+    include_visual: bool,
+    jobs: int,
+    render_cache: RenderCache | None,
+    previous_visual: Path | None = None,
+) -> list[Stage]:
+    """The build as a stage graph; each stage's params are the snapshot slice it
+    reads. Per-document audits and rasters are separate stages so that they run
+    concurrently and are reused independently. With previous_visual (the
+    REVIEW/VISUAL of the build being replaced) the rasters are also diffed
+    against it into REVIEW/VISUAL/DIFF."""
+    public = package_root / "PUBLIC"
+    html = public / "HTML"
+    assets = public / "ASSETS"
+    social = public / "SOCIAL"
+    visual = package_root / "REVIEW/VISUAL"
+    outputs = snapshot["document"]["outputs"]
+    pdf_files = tuple(f"PUBLIC/{name}" for name in outputs["publicPdf"].values())
+    # The PDF render takes its processes out of the jobs budget shared by
+    # every concurrent stage.
+    pdf_jobs = max(1, min(jobs, len(pdf_files)))
+
+    def build_assets(_: dict[str, Any]) -> None:
+        _copy_public_assets(snapshot, assets)
+
+    def build_html(_: dict[str, Any]) -> None:
+        write_public_html(snapshot, html)
+
+    def build_pdfs(_: dict[str, Any]) -> None:
+        render_public_pdfs(snapshot, html, public, jobs=pdf_jobs, cache=render_cache)
+
+    def build_social(_: dict[str, Any]) -> None:
+        generate_social_visuals(snapshot, assets, social)
+
+    def build_review(_: dict[str, Any]) -> None:
+        generate_review_artifacts(snapshot, package_root / "REVIEW")
+
+    document = {"document": snapshot["document"]}
+    html_names = {"document": {"outputs": {"publicHtml": outputs["publicHtml"]}}}
+    social_names = {"document": {"outputs": {"social": outputs["social"]}}}
+    stages = [
+        Stage(
+            "assets",
+            build_assets,
+            outputs=("PUBLIC/ASSETS",),
+            sources=tuple(item["path"] for item in (*snapshot["assets"]["logos"], *snapshot["assets"]["fonts"])),
+            params=snapshot,
+        ),
+        Stage("html", build_html, outputs=("PUBLIC/HTML",), params=snapshot),
+        Stage(
+            "pdf",
+            build_pdfs,
+            after=("assets", "html"),
+            inputs=("PUBLIC/HTML", "PUBLIC/ASSETS"),
+            outputs=pdf_files,
+            params=[snapshot["repositoryCommitSha"], snapshot["document"], weasyprint_version(), qpdf_version()],
+            workers=pdf_jobs,
+        ),
+        Stage(
+            "social",
+            build_social,
+            after=("assets",),
+            inputs=("PUBLIC/ASSETS",),
+            outputs=("PUBLIC/SOCIAL",),
+            params=snapshot,
+        ),
+        Stage(
+            "review",
+            build_review,
+            outputs=("REVIEW/PEDAGOGY", "REVIEW/COMMUNICATION", "REVIEW/OPERATIONS"),
+            params=snapshot,
+        ),
+        Stage(
+            "content-gate",
+            lambda _: build_content_gate_report(snapshot, package_root, SCRIPT_DIR),
+            after=("assets", "html", "pdf"),
+            inputs=("PUBLIC/HTML", "PUBLIC/ASSETS/qr-canonical.png", *pdf_files),
+            params=snapshot,
+        ),
+        Stage(
+            "accessibility",
+            lambda _: _accessibility_report(html_names, package_root),
+            after=("assets", "html"),
+            inputs=("PUBLIC/HTML", "PUBLIC/ASSETS/document.css"),
+            params=html_names,
+        ),
+        Stage(
+            "social-audit",
+            lambda _: audit_social_visuals(social_names, social),
+            after=("social",),
+            inputs=("PUBLIC/SOCIAL",),
+            params=social_names,
+        ),
+    ]
+    stages += [
+        Stage(
+            f"pdf-audit:{key}",
+            lambda _, name=name: audit_pdf(public / name, document),
+            after=("pdf",),
+            inputs=(f"PUBLIC/{name}",),
+            params=document,
+        )
+        for key, name in outputs["publicPdf"].items()
+    ]
+    if include_visual:
+        visual_snapshot = visual_qa_inputs(snapshot)
+        visual_keys = [f"visual:{key}" for key in outputs["publicPdf"]]
+        stages += [
+            Stage(
+                f"visual:{key}",
+                lambda _, key=key: visual_qa_document(visual_snapshot, key, public, visual, dpi=200),
+                after=("pdf",),
+                inputs=(f"PUBLIC/{name}",),
+                outputs=(f"REVIEW/VISUAL/RASTERS_200_DPI/{key}",),
+                params=visual_snapshot,
+            )
+            for key, name in outputs["publicPdf"].items()
+        ]
+        stages += [
+            Stage(
+                "visual",
+                lambda results: assemble_visual_qa([results[name] for name in visual_keys], visual, dpi=200),
+                after=tuple(visual_keys),
+                cached=False,
+            ),
+            Stage(
+                "browser",
+                lambda _: _browser_review(html_names, package_root),
+                after=("assets", "html"),
+                inputs=("PUBLIC/HTML", "PUBLIC/ASSETS"),
+                outputs=(
+                    "REVIEW/VISUAL/guide-desktop.png",
+                    "REVIEW/VISUAL/guide-mobile.png",
+                    "REVIEW/VISUAL/browser-accessibility-report.json",
+                ),
+                params=outputs["publicHtml"]["parentGuide"],
+            ),
+        ]
+        if previous_visual is not None:
+            stages.append(Stage(
+                "visual-diff",
+                lambda _: compare_visual_builds(previous_visual, visual, visual / "DIFF", jobs=jobs),
+                after=("visual",),
+                cached=False,
+                workers=jobs,
+            ))
+    return stages
+
+
 def _build_in_staging(
     snapshot_path: Path,
     package_root: Path,
     *,
     include_visual: bool,
+    jobs: int = 1,
+    render_cache: RenderCache | None = None,
+    stage_cache: StageCache | None = None,
+    previous_visual: Path | None = None,
 ) -> dict[str, Any]:
     snapshot = load_snapshot(snapshot_path, SCHEMA_PATH)
     public = package_root / "PUBLIC"
     html = public / "HTML"
-    assets = public / "ASSETS"
     social = public / "SOCIAL"
     audit = package_root / "REVIEW/AUDIT"
 
-    _copy_public_assets(snapshot, assets)
-    write_public_html(snapshot, html)
-    render_public_pdfs(snapshot, html, public)
-    generate_social_visuals(snapshot, assets, social)
-    generate_review_artifacts(snapshot, package_root / "REVIEW")
+    stages = _build_stages(
+        snapshot,
+        package_root,
+        include_visual=include_visual,
+        jobs=jobs,
+        render_cache=render_cache,
+        previous_visual=previous_visual,
+    )
+    results, _ = run_stages(stages, package_root, stage_cache, jobs=jobs)
 
-    content_report = build_content_gate_report(snapshot, package_root, SCRIPT_DIR)
+    content_report = results["content-gate"]
     _atomic_json(audit / "content-gate-report.json", content_report)
-    accessibility = _accessibility_report(snapshot, package_root)
+    accessibility = results["accessibility"]
     _atomic_json(audit / "accessibility-report.json", accessibility)
     pdf_report = {
         "PDF_DOCUMENT_COUNT": len(snapshot["document"]["outputs"]["publicPdf"]),
         "PDF_UA_VALIDATION": "NOT_PERFORMED",
-        "DOCUMENTS": [
-            audit_pdf(public / filename, snapshot)
-            for filename in snapshot["document"]["outputs"]["publicPdf"].values()
-        ],
+        "DOCUMENTS": [results[f"pdf-audit:{key}"] for key in snapshot["document"]["outputs"]["publicPdf"]],
     }
     ligature_corruption_count = sum(
         record["LIGATURE_CORRUPTION_COUNT"] for record in pdf_report["DOCUMENTS"]
     )
     _atomic_json(audit / "pdf-qa-report.json", pdf_report)
-    social_report = audit_social_visuals(snapshot, social)
+    social_report = results["social-audit"]
     _atomic_json(audit / "social-visual-qa-report.json", social_report)
     visual_report = (
-        build_visual_qa(snapshot, public, package_root / "REVIEW/VISUAL", dpi=200)
+        results["visual"]
         if include_visual
         else {
             "AUTOMATED_VISUAL_CHECK": "SKIPPED_IN_UNIT_TEST",
@@ -179,7 +339,7 @@ def _build_in_staging(
     )
     _atomic_json(audit / "visual-qa-report.json", visual_report)
     browser_report = (
-        _browser_review(snapshot, package_root)
+        results["browser"]
         if include_visual
         else {
             "AUTOMATED_BROWSER_ACCESSIBILITY_CHECK": "SKIPPED_IN_UNIT_TEST",
@@ -268,14 +428,27 @@ def build_package(
     output_path: Path = DEFAULT_OUTPUT,
     *,
     include_visual: bool = True,
+    jobs: int = 1,
+    render_cache: RenderCache | None = None,
+    stage_cache: StageCache | None = None,
 ) -> dict[str, Any]:
     snapshot_path = _resolve_from_repo(Path(snapshot_path))
     output = _resolve_from_repo(Path(output_path))
     _validate_output_target(output)
     output.parent.mkdir(parents=True, exist_ok=True)
     staging = Path(tempfile.mkdtemp(prefix=f".{output.name}.tmp-", dir=output.parent))
+    # The build about to be replaced, if it had visual QA, is what REVIEW/VISUAL/DIFF compares against.
+    previous_visual = output / "REVIEW/VISUAL"
     try:
-        report = _build_in_staging(snapshot_path, staging, include_visual=include_visual)
+        report = _build_in_staging(
+            snapshot_path,
+            staging,
+            include_visual=include_visual,
+            jobs=jobs,
+            render_cache=render_cache,
+            stage_cache=stage_cache,
+            previous_visual=previous_visual if (previous_visual / VISUAL_REPORT).is_file() else None,
+        )
         _publish_staging(staging, output)
         return report
     except BaseException:
@@ -288,8 +461,26 @@ def main() -> None:
     parser.add_argument("--snapshot", type=Path, required=True)
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
     parser.add_argument("--skip-visual", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="PDF render worker processes and concurrent build stages (default: all cores; 1 builds serially)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="rebuild every stage and re-render every PDF, ignoring the stage and render caches",
+    )
     args = parser.parse_args()
-    report = build_package(args.snapshot, args.output, include_visual=not args.skip_visual)
+    report = build_package(
+        args.snapshot,
+        args.output,
+        include_visual=not args.skip_visual,
+        jobs=args.jobs,
+        render_cache=None if args.no_cache else RenderCache(),
+        stage_cache=None if args.no_cache else StageCache(),
+    )
     print(report["PUBLIC_STATUS"])
     print(report["PRIVATE_STATUS"])
 
@@ -11,6 +11,8 @@ from html import escape
 from pathlib import Path
 from typing import Any, Iterable
 
+from deterministic_zip import ParallelZipWriter
+
 
 def _atomic_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -302,10 +304,8 @@ def _economic_workbook(snapshot: dict[str, Any], destination: Path) -> None:
     temporary = destination.with_name(f".{destination.name}.tmp-{os.getpid()}")
     edition = date.fromisoformat(snapshot["document"]["documentEditionDate"])
     try:
-        with zipfile.ZipFile(temporary, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
-            for name, content in sorted(files.items()):
-                info, payload = _zip_entry(name, content, edition)
-                archive.writestr(info, payload, compress_type=zipfile.ZIP_DEFLATED, compresslevel=9)
+        with temporary.open("wb") as handle, ParallelZipWriter(handle, jobs=1) as archive:
+            archive.write(_zip_entry(name, content, edition) for name, content in sorted(files.items()))
         os.replace(temporary, destination)
     finally:
         temporary.unlink(missing_ok=True)
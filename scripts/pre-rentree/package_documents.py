@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import os
 import zipfile
@@ -12,6 +11,9 @@ from datetime import date
 from pathlib import Path
 from typing import Iterable
 
+from deterministic_zip import ParallelZipWriter
+from file_digests import sha256
+
 
 PARENT_PACKAGE = "NexusReussite_PreRentree2026_PARENT_PACKAGE.zip"
 REVIEW_PACKAGE = "NexusReussite_PreRentree2026_REVIEW_PACKAGE.zip"
@@ -27,10 +29,7 @@ MAX_PUBLIC_PDF_BYTES = 10 * 1024 * 1024
 MAX_REVIEW_IMAGE_BYTES = 10 * 1024 * 1024
 MAX_PARENT_PACKAGE_BYTES = 75 * 1024 * 1024
 MAX_REVIEW_PACKAGE_BYTES = 250 * 1024 * 1024
-
-
-def _sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+MANIFEST = "package-manifest.json"
 
 
 def _zip_info(name: str, edition: date) -> zipfile.ZipInfo:
@@ -41,68 +40,80 @@ def _zip_info(name: str, edition: date) -> zipfile.ZipInfo:
     return info
 
 
-def _write_zip(destination: Path, entries: Iterable[tuple[str, bytes]], edition: date) -> None:
+def _write_package(
+    destination: Path,
+    entries: Iterable[tuple[str, Path | bytes]],
+    package_type: str,
+    edition: date,
+    jobs: int | None = None,
+) -> tuple[list[dict], dict[str, int]]:
+    """Write the entries in name order, then a manifest of what was written.
+
+    Each file is read once, in chunks that feed its SHA-256 and its deflate
+    stream together, on ParallelZipWriter's worker processes. Returns the
+    manifest records and every entry's CRC-32 for _verify_compressed_package().
+    """
+    entries = sorted(entries, key=lambda entry: entry[0])
+    if any(name == MANIFEST for name, _ in entries):
+        raise ValueError("Package entries already contain a manifest")
     destination.parent.mkdir(parents=True, exist_ok=True)
     temporary = destination.with_name(f".{destination.name}.tmp-{os.getpid()}")
     try:
-        with zipfile.ZipFile(temporary, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
-            for name, content in sorted(entries):
-                archive.writestr(_zip_info(name, edition), content, compress_type=zipfile.ZIP_DEFLATED, compresslevel=9)
-        with temporary.open("rb") as handle:
+        with temporary.open("wb") as handle:
+            with ParallelZipWriter(handle, jobs=jobs) as archive:
+                written = archive.write((_zip_info(name, edition), source) for name, source in entries)
+                records = [
+                    {"path": entry.name, "sha256": entry.sha256, "fileSize": entry.file_size}
+                    for entry in written
+                ]
+                manifest = {
+                    "schemaVersion": "1.0.0",
+                    "packageType": package_type,
+                    "fileCount": len(records),
+                    "files": records,
+                }
+                payload = (json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode("utf-8")
+                written += archive.write([(_zip_info(MANIFEST, edition), payload)])
             os.fsync(handle.fileno())
         os.replace(temporary, destination)
     finally:
         temporary.unlink(missing_ok=True)
+    return records, {entry.name: entry.crc for entry in written}
 
 
 def _files(root: Path) -> Iterable[Path]:
     return (path for path in sorted(root.rglob("*")) if path.is_file())
 
 
-def _relative_entries(root: Path, prefix: str = "") -> list[tuple[str, bytes]]:
-    return [
-        (f"{prefix}{path.relative_to(root).as_posix()}", path.read_bytes())
-        for path in _files(root)
-    ]
+def _relative_entries(root: Path, prefix: str = "") -> list[tuple[str, Path]]:
+    return [(f"{prefix}{path.relative_to(root).as_posix()}", path) for path in _files(root)]
 
 
-def _with_manifest(entries: list[tuple[str, bytes]], package_type: str) -> list[tuple[str, bytes]]:
-    if any(name == "package-manifest.json" for name, _ in entries):
-        raise ValueError("Package entries already contain a manifest")
-    records = [
-        {
-            "path": name,
-            "sha256": hashlib.sha256(content).hexdigest(),
-            "fileSize": len(content),
-        }
-        for name, content in sorted(entries)
-    ]
-    manifest = {
-        "schemaVersion": "1.0.0",
-        "packageType": package_type,
-        "fileCount": len(records),
-        "files": records,
-    }
-    payload = (json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode("utf-8")
-    return [*entries, ("package-manifest.json", payload)]
-
+def _verify_compressed_package(path: Path, records: list[dict], crcs: dict[str, int]) -> None:
+    """Check the archive against what _write_package() recorded.
 
-def _verify_compressed_package(path: Path) -> None:
+    The SHA-256 digests were taken from the very bytes that were compressed,
+    so only the CRC-32 of each stored entry is re-checked here, streaming.
+    """
     with zipfile.ZipFile(path) as archive:
-        archive.testzip()
+        if archive.testzip() is not None:
+            raise ValueError(f"Corrupt package entry after compression: {path.name}")
+        infos = {info.filename: info for info in archive.infolist()}
         names = archive.namelist()
-        if names.count("package-manifest.json") != 1:
+        if names.count(MANIFEST) != 1:
             raise ValueError(f"Missing or duplicate package manifest: {path.name}")
-        manifest = json.loads(archive.read("package-manifest.json"))
-        records = {record["path"]: record for record in manifest["files"]}
-        payload_names = set(names) - {"package-manifest.json"}
-        if payload_names != set(records) or manifest["fileCount"] != len(payload_names):
+        manifest = json.loads(archive.read(MANIFEST))
+        payload_names = set(names) - {MANIFEST}
+        if (
+            manifest["files"] != records
+            or payload_names != {record["path"] for record in records}
+            or manifest["fileCount"] != len(payload_names)
+        ):
             raise ValueError(f"Package inventory mismatch after compression: {path.name}")
-        for name in sorted(payload_names):
-            content = archive.read(name)
-            record = records[name]
-            if record["fileSize"] != len(content) or record["sha256"] != hashlib.sha256(content).hexdigest():
-                raise ValueError(f"Package entry mismatch after compression: {path.name}:{name}")
+        for record in records:
+            info = infos[record["path"]]
+            if info.file_size != record["fileSize"] or info.CRC != crcs[record["path"]]:
+                raise ValueError(f"Package entry mismatch after compression: {path.name}:{record['path']}")
 
 
 def _atomic_index(path: Path, value: dict[str, object]) -> None:
@@ -117,7 +128,12 @@ def _atomic_index(path: Path, value: dict[str, object]) -> None:
         temporary.unlink(missing_ok=True)
 
 
-def package_documents(artifact_root: Path, output: Path, repo_root: Path) -> dict[str, dict[str, int | str]]:
+def package_documents(
+    artifact_root: Path,
+    output: Path,
+    repo_root: Path,
+    jobs: int | None = None,
+) -> dict[str, dict[str, int | str]]:
     artifact_root = Path(artifact_root).resolve()
     output = Path(output).resolve()
     repo_root = Path(repo_root).resolve()
@@ -153,17 +169,18 @@ def package_documents(artifact_root: Path, output: Path, repo_root: Path) -> dic
         "La demande d’information ne réserve pas de place, n’exige aucun paiement et ne forme pas un contrat.\n"
         "Ces documents sont des candidats de revue ; leur diffusion reste interdite avant autorisation.\n"
     ).encode("utf-8")
-    parent_entries = [(path.name, path.read_bytes()) for path in sorted(public.glob("*.pdf"))]
+    parent_entries: list[tuple[str, Path | bytes]] = [(path.name, path) for path in sorted(public.glob("*.pdf"))]
     parent_entries += _relative_entries(public / "HTML", "HTML/")
     parent_entries += _relative_entries(public / "ASSETS", "ASSETS/")
     parent_entries += [
-        ("THIRD_PARTY_NOTICES.md", (repo_root / "THIRD_PARTY_NOTICES.md").read_bytes()),
-        ("LICENSES/OFL-1.1.txt", (repo_root / "licenses/fonts/OFL-1.1.txt").read_bytes()),
+        ("THIRD_PARTY_NOTICES.md", repo_root / "THIRD_PARTY_NOTICES.md"),
+        ("LICENSES/OFL-1.1.txt", repo_root / "licenses/fonts/OFL-1.1.txt"),
     ]
     parent_entries.append(("LISEZ-MOI.txt", readme))
-    parent_entries = _with_manifest(parent_entries, "PARENT_REVIEW_CANDIDATE")
-    _write_zip(parent_path, parent_entries, edition)
-    _verify_compressed_package(parent_path)
+    parent_records, parent_crcs = _write_package(
+        parent_path, parent_entries, "PARENT_REVIEW_CANDIDATE", edition, jobs,
+    )
+    _verify_compressed_package(parent_path, parent_records, parent_crcs)
 
     documentation_root = repo_root / "docs/campaigns/pre-rentree-2026"
     documentation = []
@@ -171,14 +188,13 @@ def package_documents(artifact_root: Path, output: Path, repo_root: Path) -> dic
         source = documentation_root / filename
         if not source.is_file():
             raise FileNotFoundError(f"Missing review documentation: {source}")
-        documentation.append((f"DOCUMENTATION/{filename}", source.read_bytes()))
-    review_entries = [(PARENT_PACKAGE, parent_path.read_bytes())]
+        documentation.append((f"DOCUMENTATION/{filename}", source))
+    review_entries: list[tuple[str, Path | bytes]] = [(PARENT_PACKAGE, parent_path)]
     review_entries += _relative_entries(review, "REVIEW/")
     review_entries += _relative_entries(public / "SOCIAL", "PUBLIC/SOCIAL/")
     review_entries += documentation
-    review_entries = _with_manifest(review_entries, "OWNER_REVIEW")
-    _write_zip(review_path, review_entries, edition)
-    _verify_compressed_package(review_path)
+    review_records, review_crcs = _write_package(review_path, review_entries, "OWNER_REVIEW", edition, jobs)
+    _verify_compressed_package(review_path, review_records, review_crcs)
     if parent_path.stat().st_size > MAX_PARENT_PACKAGE_BYTES:
         raise ValueError("Parent package exceeds its size budget")
     if review_path.stat().st_size > MAX_REVIEW_PACKAGE_BYTES:
@@ -187,15 +203,15 @@ def package_documents(artifact_root: Path, output: Path, repo_root: Path) -> dic
     result = {
         "parent": {
             "file": parent_path.name,
-            "sha256": _sha256(parent_path),
+            "sha256": sha256(parent_path),
             "fileSize": parent_path.stat().st_size,
-            "fileCount": len(parent_entries),
+            "fileCount": len(parent_records) + 1,
         },
         "review": {
             "file": review_path.name,
-            "sha256": _sha256(review_path),
+            "sha256": sha256(review_path),
             "fileSize": review_path.stat().st_size,
-            "fileCount": len(review_entries),
+            "fileCount": len(review_records) + 1,
         },
     }
     _atomic_index(output / "package-index.json", {
@@ -210,12 +226,13 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--artifact-root", required=True, type=Path)
     parser.add_argument("--output", required=True, type=Path)
     parser.add_argument("--repo-root", type=Path, default=Path(__file__).resolve().parents[2])
+    parser.add_argument("--jobs", type=int, default=None, help="compression worker processes (default: all cores)")
     return parser
 
 
 def main() -> None:
     args = build_parser().parse_args()
-    result = package_documents(args.artifact_root, args.output, args.repo_root)
+    result = package_documents(args.artifact_root, args.output, args.repo_root, args.jobs)
     print(json.dumps(result, ensure_ascii=False, sort_keys=True))
 
 
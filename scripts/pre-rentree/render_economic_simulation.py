@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import argparse
 import csv
-import hashlib
 import html
 import json
 from pathlib import Path
@@ -14,6 +13,8 @@ import fitz
 from PIL import Image, ImageOps, ImageDraw, ImageFont
 from weasyprint import HTML
 
+from file_digests import sha256
+
 
 LEVEL_LABELS = {
     "QUATRIEME": "Entrée en 4e",
@@ -33,14 +34,6 @@ SUBJECT_LABELS = {
 }
 
 
-def sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def amount(value: int | float | None) -> str:
     if value is None:
         return "À renseigner"
@@ -4,18 +4,19 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import shutil
 import sys
 from pathlib import Path
 
-import fitz
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageFont
+
+from file_digests import sha256
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(REPO_ROOT / "tools" / "pdf-generator"))
-from pre_rentree_data import LEVEL_ORDER, PreRentreeData  # noqa: E402
+from page_rasters import PageRasterizer, SheetLayout, Thumbnail, contact_sheet  # noqa: E402
+from pre_rentree_data import LEVEL_ORDER, shared_data  # noqa: E402
 
 PUBLIC_DOCUMENT_FILENAMES = {
     "NexusReussite_PreRentree2026_FlyerEssentiel.pdf",
@@ -39,11 +40,22 @@ _FILENAME_BY_LEVEL = {
 }
 
 
+CONTACT_SHEET_LAYOUT = SheetLayout(
+    columns=4,
+    cell=(300, 430),
+    thumbnail=Thumbnail((260, 370)),
+    thumbnail_offset=(20, 12),
+    label_offset=(16, 392),
+    background="#F7F4ED",
+    label_fill="#071A3A",
+)
+
+
 def _level_dossier_public_status() -> dict[str, bool]:
     """Derive per-level dossier PUBLIC/REVIEW status from the SAME canonical source
     the generator itself uses (modules.json publicationStatus + gap detection) —
     never from a filename heuristic, so it generalizes beyond SVT to any subject."""
-    data = PreRentreeData(REPO_ROOT)
+    data = shared_data(REPO_ROOT)
     is_public_by_filename_level = {}
     for filename_level, level_code in _FILENAME_BY_LEVEL.items():
         assert level_code in LEVEL_ORDER
@@ -63,13 +75,7 @@ def _document_status(filename: str) -> str:
     return "PUBLIC_FINAL" if filename in PUBLIC_DOCUMENT_FILENAMES else "INTERNAL_REVIEW"
 
 
-def sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    digest.update(path.read_bytes())
-    return digest.hexdigest()
-
-
-def render_review(pdf_directory: Path, public_directory: Path) -> dict:
+def render_review(pdf_directory: Path, public_directory: Path, jobs: int | None = None) -> dict:
     pdf_directory = pdf_directory.resolve()
     public_directory = public_directory.resolve()
     public_directory.mkdir(parents=True, exist_ok=True)
@@ -83,60 +89,45 @@ def render_review(pdf_directory: Path, public_directory: Path) -> dict:
             shutil.rmtree(target)
         target.mkdir(parents=True)
 
+    pdf_paths = sorted(pdf_directory.glob("*.pdf"))
+    with PageRasterizer(jobs) as rasterizer:
+        rendered = rasterizer.render_many(
+            ((pdf_path, rendered_root / pdf_path.stem) for pdf_path in pdf_paths),
+            zoom=1.5,
+            thumbnail=CONTACT_SHEET_LAYOUT.thumbnail,
+        )
     page_records = []
     document_records = []
-    thumbnails: list[tuple[str, Image.Image]] = []
-    for pdf_path in sorted(pdf_directory.glob("*.pdf")):
-        document_directory = rendered_root / pdf_path.stem
-        document_directory.mkdir()
-        with fitz.open(pdf_path) as document:
-            document_records.append({
-                "fileName": pdf_path.name,
-                "bytes": pdf_path.stat().st_size,
-                "sizeLabel": f"{pdf_path.stat().st_size // 1024} Ko",
-                "sha256": sha256(pdf_path),
-                "pageCount": document.page_count,
-                "publicDownloadCandidate": pdf_path.name in PUBLIC_DOCUMENT_FILENAMES,
-                "publicationStatus": _document_status(pdf_path.name),
+    sheet_entries: list[tuple[str, Path, str]] = []
+    for pdf_path, pages in zip(pdf_paths, rendered):
+        document_records.append({
+            "fileName": pdf_path.name,
+            "bytes": pdf_path.stat().st_size,
+            "sizeLabel": f"{pdf_path.stat().st_size // 1024} Ko",
+            "sha256": sha256(pdf_path),
+            "pageCount": len(pages),
+            "publicDownloadCandidate": pdf_path.name in PUBLIC_DOCUMENT_FILENAMES,
+            "publicationStatus": _document_status(pdf_path.name),
+        })
+        for page in pages:
+            page_records.append({
+                "pdf": pdf_path.name,
+                "page": page.page,
+                "path": page.path.relative_to(pdf_directory).as_posix(),
+                "width": page.width,
+                "height": page.height,
+                "bytes": page.bytes,
+                "sha256": page.sha256,
             })
-            for page_number, page in enumerate(document, start=1):
-                pixmap = page.get_pixmap(matrix=fitz.Matrix(1.5, 1.5), alpha=False)
-                output = document_directory / f"page-{page_number:02d}.png"
-                pixmap.save(output)
-                page_records.append({
-                    "pdf": pdf_path.name,
-                    "page": page_number,
-                    "path": output.relative_to(pdf_directory).as_posix(),
-                    "width": pixmap.width,
-                    "height": pixmap.height,
-                    "bytes": output.stat().st_size,
-                    "sha256": sha256(output),
-                })
-                with Image.open(output) as rendered:
-                    thumbnail = rendered.convert("RGB")
-                    thumbnail.thumbnail((260, 370), Image.Resampling.LANCZOS)
-                    thumbnails.append((f"{pdf_path.stem} · p. {page_number}", thumbnail.copy()))
-
-    if not thumbnails:
+            label = f"{pdf_path.stem} · p. {page.page}"
+            sheet_entries.append((label if len(label) <= 38 else f"{label[:35]}…", page.path, page.sha256))
+
+    if not sheet_entries:
         raise RuntimeError("No PDF found to rasterize")
 
-    columns = 4
-    cell_width = 300
-    cell_height = 430
-    rows = (len(thumbnails) + columns - 1) // columns
-    sheet = Image.new("RGB", (columns * cell_width, rows * cell_height), "#F7F4ED")
-    draw = ImageDraw.Draw(sheet)
-    font = ImageFont.load_default(size=14)
-    for index, (label, thumbnail) in enumerate(thumbnails):
-        x = (index % columns) * cell_width
-        y = (index // columns) * cell_height
-        image_x = x + (cell_width - thumbnail.width) // 2
-        sheet.paste(thumbnail, (image_x, y + 12))
-        abbreviated = label if len(label) <= 38 else f"{label[:35]}…"
-        draw.text((x + 16, y + 392), abbreviated, fill="#071A3A", font=font)
-
-    contact_sheet = visual_review_root / "documents-final-contact-sheet.png"
-    sheet.save(contact_sheet, format="PNG", optimize=True)
+    sheet = contact_sheet(sheet_entries, CONTACT_SHEET_LAYOUT, ImageFont.load_default(size=14))
+    sheet_path = visual_review_root / "documents-final-contact-sheet.png"
+    sheet.save(sheet_path, format="PNG", optimize=True)
     review_manifest = {
         "schemaVersion": "1.0.0",
         "campaignId": "pre-rentree-2026",
@@ -145,11 +136,11 @@ def render_review(pdf_directory: Path, public_directory: Path) -> dict:
         "pageCount": len(page_records),
         "documents": document_records,
         "contactSheet": {
-            "path": contact_sheet.relative_to(pdf_directory).as_posix(),
+            "path": sheet_path.relative_to(pdf_directory).as_posix(),
             "width": sheet.width,
             "height": sheet.height,
-            "bytes": contact_sheet.stat().st_size,
-            "sha256": sha256(contact_sheet),
+            "bytes": sheet_path.stat().st_size,
+            "sha256": sha256(sheet_path),
         },
         "pages": page_records,
     }
@@ -196,8 +187,9 @@ def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--pdf-directory", type=Path, required=True)
     parser.add_argument("--public-directory", type=Path, required=True)
+    parser.add_argument("--jobs", type=int, default=None, help="rasterization worker processes (default: all cores)")
     args = parser.parse_args()
-    manifest = render_review(args.pdf_directory, args.public_directory)
+    manifest = render_review(args.pdf_directory, args.public_directory, args.jobs)
     print(json.dumps({
         "status": "PUBLIC_PDFS_RENDERED",
         "pdfCount": manifest["pdfCount"],
@@ -22,6 +22,7 @@ from pypdf import PdfWriter
 from pypdf.generic import ArrayObject, ByteStringObject
 
 from campaign_calendar import resolve_publication_date
+from file_digests import sha256
 from render_week_one_kit import Asset, KitRenderer
 
 
@@ -570,7 +571,7 @@ class FullCampaignRenderer(KitRenderer):
                 "width": asset.width,
                 "height": asset.height,
                 "bytes": asset.path.stat().st_size,
-                "sha256": hashlib.sha256(asset.path.read_bytes()).hexdigest(),
+                "sha256": sha256(asset.path),
                 "altText": asset.alt_text,
             })
         manifest = {
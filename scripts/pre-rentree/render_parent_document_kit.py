@@ -10,17 +10,23 @@ import html
 import io
 import json
 import shutil
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import fitz
 from fontTools.ttLib import TTFont
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageFont
 from pypdf import PdfWriter
 from pypdf.generic import ArrayObject, ByteStringObject
 from weasyprint import HTML
 
+from file_digests import sha256
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools" / "pdf-generator"))
+from page_rasters import PageRasterizer, SheetLayout, Thumbnail, contact_sheet  # noqa: E402
+
 
 VERSION = "2026-parent-documents-v1"
 SUBJECTS = {
@@ -40,6 +46,15 @@ LEVELS = {
     "TERMINALE": "Entrée en Terminale",
 }
 NO_STAGE_PRICING = {"accompagnements-annuels", "passerelle-stage-annuel"}
+CONTACT_SHEET_LAYOUT = SheetLayout(
+    columns=4,
+    cell=(350, 500),
+    thumbnail=Thumbnail((310, 439), "stretch"),
+    thumbnail_offset=(20, 18),
+    label_offset=(20, 467),
+    background="#E9EDF3",
+    label_fill="#0B1F3A",
+)
 
 
 @dataclass(frozen=True)
@@ -53,10 +68,6 @@ class Asset:
     page_count: int | None = None
 
 
-def _sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
 def _amount(value: int) -> str:
     return f"{value:,}".replace(",", "\u202f") + " TND"
 
@@ -250,50 +261,39 @@ class ParentDocumentRenderer:
             writer.write(target)
         normalized.replace(path)
 
-    def _render_pages(self, document_id: str, pdf_path: Path) -> tuple[int, list[dict[str, Any]]]:
-        target = self.output / "rendered" / document_id
-        target.mkdir(parents=True, exist_ok=True)
+    def _render_pages(
+        self, rasterizer: PageRasterizer, document_id: str, pdf_path: Path,
+    ) -> tuple[int, list[dict[str, Any]], list[tuple[str, Path, str]]]:
+        pages = rasterizer.render(
+            pdf_path,
+            self.output / "rendered" / document_id,
+            zoom=2.1,
+            size=(1240, 1755),
+            thumbnail=CONTACT_SHEET_LAYOUT.thumbnail,
+        )
         records = []
-        with fitz.open(pdf_path) as pdf:
-            page_count = pdf.page_count
-            for index, page in enumerate(pdf, start=1):
-                pixmap = page.get_pixmap(matrix=fitz.Matrix(2.1, 2.1), alpha=False)
-                image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
-                image = image.resize((1240, 1755), Image.Resampling.LANCZOS)
-                path = target / f"page-{index:02d}.png"
-                image.save(path, format="PNG", optimize=True)
-                text = page.get_text().strip()
-                records.append(
-                    {
-                        "page": index,
-                        "textCharacters": len(text),
-                        "blank": len(text) < 180,
-                        "width": 1240,
-                        "height": 1755,
-                    }
-                )
-                self.assets.append(
-                    Asset(path, f"parent-{document_id}-page-{index:02d}", "visual-inspection", document_id, 1240, 1755)
-                )
-        return page_count, records
-
-    def _contact_sheet(self, pages: list[tuple[str, Path]]) -> Path:
-        thumb_w, thumb_h = 310, 439
-        cols = 4
-        rows = (len(pages) + cols - 1) // cols
-        sheet = Image.new("RGB", (cols * 350, rows * 500), "#E9EDF3")
-        draw = ImageDraw.Draw(sheet)
+        for page in pages:
+            text = page.text.strip()
+            records.append(
+                {
+                    "page": page.page,
+                    "textCharacters": len(text),
+                    "blank": len(text) < 180,
+                    "width": 1240,
+                    "height": 1755,
+                }
+            )
+            self.assets.append(
+                Asset(page.path, f"parent-{document_id}-page-{page.page:02d}", "visual-inspection", document_id, 1240, 1755)
+            )
+        return len(pages), records, [(f"{document_id} · p{page.page}", page.path, page.sha256) for page in pages]
+
+    def _contact_sheet(self, pages: list[tuple[str, Path, str]]) -> Path:
         try:
             font = ImageFont.truetype("DejaVuSans.ttf", 18)
         except OSError:
             font = ImageFont.load_default()
-        for index, (label, page_path) in enumerate(pages):
-            x = (index % cols) * 350 + 20
-            y = (index // cols) * 500 + 18
-            with Image.open(page_path) as page:
-                thumbnail = page.convert("RGB").resize((thumb_w, thumb_h), Image.Resampling.LANCZOS)
-            sheet.paste(thumbnail, (x, y))
-            draw.text((x, y + thumb_h + 10), label, fill="#0B1F3A", font=font)
+        sheet = contact_sheet(pages, CONTACT_SHEET_LAYOUT, font)
         path = self.output / "visual-review" / "parent-documents-contact-sheet.png"
         path.parent.mkdir(parents=True, exist_ok=True)
         sheet.save(path, format="PNG", optimize=True)
@@ -328,51 +328,46 @@ class ParentDocumentRenderer:
         self._prepare_fonts(sources)
 
         qa_documents = []
-        rendered_pages: list[tuple[str, Path]] = []
-        for document in self.content["documents"]:
-            document_id = document["documentId"]
-            html_path = sources / f"{document_id}.html"
-            html_path.write_text(self._html(document), encoding="utf-8")
-            self.assets.append(Asset(html_path, f"parent-{document_id}-html", "editable-source", document_id))
-            pdf_path = pdf_dir / f"{document_id}.pdf"
-            HTML(filename=str(html_path), base_url=str(sources)).write_pdf(
-                pdf_path,
-                pdf_identifier=hashlib.sha256(document_id.encode("utf-8")).digest()[:16],
-            )
-            self._normalize_pdf(pdf_path, document)
-            page_count, page_records = self._render_pages(document_id, pdf_path)
-            self.assets.append(Asset(pdf_path, f"parent-{document_id}-pdf", "final-pdf", document_id, page_count=page_count))
-            rendered_pages.extend(
-                (
-                    f"{document_id} · p{page['page']}",
-                    self.output / "rendered" / document_id / f"page-{page['page']:02d}.png",
+        rendered_pages: list[tuple[str, Path, str]] = []
+        with PageRasterizer() as rasterizer:
+            for document in self.content["documents"]:
+                document_id = document["documentId"]
+                html_path = sources / f"{document_id}.html"
+                html_path.write_text(self._html(document), encoding="utf-8")
+                self.assets.append(Asset(html_path, f"parent-{document_id}-html", "editable-source", document_id))
+                pdf_path = pdf_dir / f"{document_id}.pdf"
+                HTML(filename=str(html_path), base_url=str(sources)).write_pdf(
+                    pdf_path,
+                    pdf_identifier=hashlib.sha256(document_id.encode("utf-8")).digest()[:16],
                 )
-                for page in page_records
-            )
-            with fitz.open(pdf_path) as pdf:
-                fonts = sorted({font[3] for page in pdf for font in page.get_fonts(full=True)})
-                links = [link for page in pdf for link in page.get_links()]
-                overflow_blocks = sum(
-                    1
-                    for page in pdf
-                    for block in page.get_text("blocks")
-                    if block[0] < -0.5
-                    or block[1] < -0.5
-                    or block[2] > page.rect.width + 0.5
-                    or block[3] > page.rect.height + 0.5
+                self._normalize_pdf(pdf_path, document)
+                page_count, page_records, sheet_entries = self._render_pages(rasterizer, document_id, pdf_path)
+                self.assets.append(Asset(pdf_path, f"parent-{document_id}-pdf", "final-pdf", document_id, page_count=page_count))
+                rendered_pages.extend(sheet_entries)
+                with fitz.open(pdf_path) as pdf:
+                    fonts = sorted({font[3] for page in pdf for font in page.get_fonts(full=True)})
+                    links = [link for page in pdf for link in page.get_links()]
+                    overflow_blocks = sum(
+                        1
+                        for page in pdf
+                        for block in page.get_text("blocks")
+                        if block[0] < -0.5
+                        or block[1] < -0.5
+                        or block[2] > page.rect.width + 0.5
+                        or block[3] > page.rect.height + 0.5
+                    )
+                qa_documents.append(
+                    {
+                        "documentId": document_id,
+                        "pageCount": page_count,
+                        "pages": page_records,
+                        "blankPageCount": sum(1 for page in page_records if page["blank"]),
+                        "fonts": fonts,
+                        "fontCount": len(fonts),
+                        "overflowBlockCount": overflow_blocks,
+                        "whatsappLinkPresent": any(link.get("uri") == self.content["contact"]["url"] for link in links),
+                    }
                 )
-            qa_documents.append(
-                {
-                    "documentId": document_id,
-                    "pageCount": page_count,
-                    "pages": page_records,
-                    "blankPageCount": sum(1 for page in page_records if page["blank"]),
-                    "fonts": fonts,
-                    "fontCount": len(fonts),
-                    "overflowBlockCount": overflow_blocks,
-                    "whatsappLinkPresent": any(link.get("uri") == self.content["contact"]["url"] for link in links),
-                }
-            )
 
         self._contact_sheet(rendered_pages)
         qa_report = {
@@ -421,7 +416,7 @@ class ParentDocumentRenderer:
                 "role": asset.role,
                 "format": asset.path.suffix.removeprefix(".").upper(),
                 "bytes": asset.path.stat().st_size,
-                "sha256": _sha256(asset.path),
+                "sha256": sha256(asset.path),
             }
             if asset.document_id:
                 record["documentId"] = asset.document_id
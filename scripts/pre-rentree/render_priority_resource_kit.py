@@ -9,20 +9,27 @@ import html
 import io
 import json
 import shutil
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import fitz
 from fontTools.ttLib import TTFont
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageFont
 from pypdf import PdfWriter
 from pypdf.generic import ArrayObject, ByteStringObject
 from weasyprint import HTML
 
+from file_digests import sha256
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools" / "pdf-generator"))
+from page_rasters import PageRasterizer, SheetLayout, Thumbnail, contact_sheet  # noqa: E402
+
 
 VERSION = "2026-priority-resources-v1"
 DOCUMENTS = ("positioningStudent", "positioningTeacher", "workbookStudent", "guideTeacher")
+CONTACT_SHEET_LAYOUT = SheetLayout(columns=4, cell=(280, 400), thumbnail=Thumbnail((248, 351), "stretch"), thumbnail_offset=(16, 12), label_offset=(16, 370), background="#E9EDF3", label_fill="#0B1F3A")
 
 
 @dataclass(frozen=True)
@@ -41,10 +48,6 @@ def esc(value: Any) -> str:
     return html.escape(str(value), quote=True)
 
 
-def sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
 def contrast_ratio(foreground: str, background: str) -> float:
     def luminance(color: str) -> float:
         values = [int(color[index:index + 2], 16) / 255 for index in (1, 3, 5)]
@@ -224,40 +227,25 @@ class PriorityResourceRenderer:
         shutil.copyfile(self.root / "licenses/fonts/OFL-1.1.txt", license_path)
         self.assets.append(Asset(license_path, "priority-font-license-ofl", "font-license"))
 
-    def _render_pages(self, module_id: str, document_id: str, pdf_path: Path) -> tuple[int, list[dict[str, Any]]]:
-        target = self.output / "rendered" / module_id / document_id
-        target.mkdir(parents=True, exist_ok=True)
+    def _render_pages(self, rasterizer: PageRasterizer, module_id: str, document_id: str, pdf_path: Path) -> tuple[int, list[dict[str, Any]], list[tuple[str, Path, str]]]:
+        pages = rasterizer.render(pdf_path, self.output / "rendered" / module_id / document_id, zoom=2.1, size=(1240, 1755), thumbnail=CONTACT_SHEET_LAYOUT.thumbnail)
         records = []
-        with fitz.open(pdf_path) as pdf:
-            for index, page in enumerate(pdf, start=1):
-                pixmap = page.get_pixmap(matrix=fitz.Matrix(2.1, 2.1), alpha=False)
-                image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples).resize((1240, 1755), Image.Resampling.LANCZOS)
-                path = target / f"page-{index:02d}.png"
-                image.save(path, format="PNG", optimize=True)
-                text_length = len(page.get_text("text").strip())
-                records.append({"page": index, "textCharacters": text_length, "blank": text_length <= 120, "width": 1240, "height": 1755})
-                self.assets.append(Asset(path, f"priority-{module_id}-{document_id}-page-{index:02d}", "visual-inspection", module_id, document_id, 1240, 1755))
-        return len(records), records
-
-    def _contact_sheets(self, pages: list[tuple[str, Path]]) -> None:
+        for page in pages:
+            text_length = len(page.text.strip())
+            records.append({"page": page.page, "textCharacters": text_length, "blank": text_length <= 120, "width": 1240, "height": 1755})
+            self.assets.append(Asset(page.path, f"priority-{module_id}-{document_id}-page-{page.page:02d}", "visual-inspection", module_id, document_id, 1240, 1755))
+        return len(records), records, [(f"{module_id} · {document_id} · p{page.page}"[:38], page.path, page.sha256) for page in pages]
+
+    def _contact_sheets(self, pages: list[tuple[str, Path, str]]) -> None:
         chunk_size = 20
         target_dir = self.output / "visual-review"
         target_dir.mkdir(parents=True)
+        try:
+            font = ImageFont.truetype("DejaVuSans.ttf", 12)
+        except OSError:
+            font = ImageFont.load_default()
         for sheet_index, start in enumerate(range(0, len(pages), chunk_size), start=1):
-            chunk = pages[start:start + chunk_size]
-            thumb_w, thumb_h, cell_w, cell_h, cols = 248, 351, 280, 400, 4
-            rows = (len(chunk) + cols - 1) // cols
-            sheet = Image.new("RGB", (cols * cell_w, rows * cell_h), "#E9EDF3")
-            draw = ImageDraw.Draw(sheet)
-            try:
-                font = ImageFont.truetype("DejaVuSans.ttf", 12)
-            except OSError:
-                font = ImageFont.load_default()
-            for index, (label, page_path) in enumerate(chunk):
-                x, y = (index % cols) * cell_w + 16, (index // cols) * cell_h + 12
-                with Image.open(page_path) as page:
-                    sheet.paste(page.convert("RGB").resize((thumb_w, thumb_h), Image.Resampling.LANCZOS), (x, y))
-                draw.text((x, y + thumb_h + 7), label[:38], fill="#0B1F3A", font=font)
+            sheet = contact_sheet(pages[start:start + chunk_size], CONTACT_SHEET_LAYOUT, font)
             path = target_dir / f"priority-resources-contact-sheet-{sheet_index:02d}.png"
             sheet.save(path, format="PNG", optimize=True)
             self.assets.append(Asset(path, f"priority-contact-sheet-{sheet_index:02d}", "visual-review", width=sheet.width, height=sheet.height))
@@ -270,29 +258,30 @@ class PriorityResourceRenderer:
         self._prepare_fonts(source_root)
         manifest_modules = []
         qa_documents = []
-        all_pages: list[tuple[str, Path]] = []
-
-        for module in self.content["modules"]:
-            module_id = module["moduleId"]
-            module_documents = {}
-            for document_id in DOCUMENTS:
-                html_path = source_root / module_id / f"{document_id}.html"
-                html_path.parent.mkdir(parents=True, exist_ok=True)
-                html_path.write_text(self._document_html(module, document_id), encoding="utf-8")
-                self.assets.append(Asset(html_path, f"priority-{module_id}-{document_id}-html", "editable-source", module_id, document_id))
-                pdf_path = self.output / "pdf" / module_id / f"{document_id}.pdf"
-                pdf_path.parent.mkdir(parents=True, exist_ok=True)
-                HTML(filename=str(html_path), base_url=str(html_path.parent)).write_pdf(pdf_path, pdf_identifier=hashlib.sha256(f"{module_id}:{document_id}".encode()).digest()[:16])
-                self._normalize_pdf(pdf_path, f"{module['title']} · {document_id}", f"{module_id}:{document_id}")
-                page_count, page_records = self._render_pages(module_id, document_id, pdf_path)
-                self.assets.append(Asset(pdf_path, f"priority-{module_id}-{document_id}-pdf", "final-pdf", module_id, document_id, page_count=page_count))
-                all_pages.extend((f"{module_id} · {document_id} · p{page['page']}", self.output / "rendered" / module_id / document_id / f"page-{page['page']:02d}.png") for page in page_records)
-                with fitz.open(pdf_path) as pdf:
-                    fonts = sorted({font[3] for page in pdf for font in page.get_fonts(full=True)})
-                    overflow = sum(1 for page in pdf for block in page.get_text("blocks") if block[0] < -.5 or block[1] < -.5 or block[2] > page.rect.width + .5 or block[3] > page.rect.height + .5)
-                qa_documents.append({"moduleId": module_id, "documentId": document_id, "pageCount": page_count, "pages": page_records, "fonts": fonts, "blankPageCount": sum(page["blank"] for page in page_records), "missingFont": not ("dm" in " ".join(fonts).lower() and "sans" in " ".join(fonts).lower() and "fraunces" in " ".join(fonts).lower()), "overflowCount": overflow})
-                module_documents[document_id] = {"html": html_path.relative_to(self.output).as_posix(), "pdf": pdf_path.relative_to(self.output).as_posix(), "pageCount": page_count}
-            manifest_modules.append({"moduleId": module_id, "programmeId": module["programmeMatrixRef"], "status": module["status"], "validationStatus": module["validation"]["status"], "documents": module_documents})
+        all_pages: list[tuple[str, Path, str]] = []
+
+        with PageRasterizer() as rasterizer:
+            for module in self.content["modules"]:
+                module_id = module["moduleId"]
+                module_documents = {}
+                for document_id in DOCUMENTS:
+                    html_path = source_root / module_id / f"{document_id}.html"
+                    html_path.parent.mkdir(parents=True, exist_ok=True)
+                    html_path.write_text(self._document_html(module, document_id), encoding="utf-8")
+                    self.assets.append(Asset(html_path, f"priority-{module_id}-{document_id}-html", "editable-source", module_id, document_id))
+                    pdf_path = self.output / "pdf" / module_id / f"{document_id}.pdf"
+                    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+                    HTML(filename=str(html_path), base_url=str(html_path.parent)).write_pdf(pdf_path, pdf_identifier=hashlib.sha256(f"{module_id}:{document_id}".encode()).digest()[:16])
+                    self._normalize_pdf(pdf_path, f"{module['title']} · {document_id}", f"{module_id}:{document_id}")
+                    page_count, page_records, sheet_entries = self._render_pages(rasterizer, module_id, document_id, pdf_path)
+                    self.assets.append(Asset(pdf_path, f"priority-{module_id}-{document_id}-pdf", "final-pdf", module_id, document_id, page_count=page_count))
+                    all_pages.extend(sheet_entries)
+                    with fitz.open(pdf_path) as pdf:
+                        fonts = sorted({font[3] for page in pdf for font in page.get_fonts(full=True)})
+                        overflow = sum(1 for page in pdf for block in page.get_text("blocks") if block[0] < -.5 or block[1] < -.5 or block[2] > page.rect.width + .5 or block[3] > page.rect.height + .5)
+                    qa_documents.append({"moduleId": module_id, "documentId": document_id, "pageCount": page_count, "pages": page_records, "fonts": fonts, "blankPageCount": sum(page["blank"] for page in page_records), "missingFont": not ("dm" in " ".join(fonts).lower() and "sans" in " ".join(fonts).lower() and "fraunces" in " ".join(fonts).lower()), "overflowCount": overflow})
+                    module_documents[document_id] = {"html": html_path.relative_to(self.output).as_posix(), "pdf": pdf_path.relative_to(self.output).as_posix(), "pageCount": page_count}
+                manifest_modules.append({"moduleId": module_id, "programmeId": module["programmeMatrixRef"], "status": module["status"], "validationStatus": module["validation"]["status"], "documents": module_documents})
 
         self._contact_sheets(all_pages)
         qa_report = {
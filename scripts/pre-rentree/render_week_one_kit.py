@@ -6,7 +6,6 @@ from __future__ import annotations
 import argparse
 import base64
 import csv
-import hashlib
 import html
 import json
 import re
@@ -21,6 +20,7 @@ from fontTools.ttLib import TTFont
 from PIL import Image, ImageDraw, ImageFont
 
 from campaign_calendar import resolve_publication_date
+from file_digests import sha256
 
 
 BLUE = "#0B1F3A"
@@ -702,7 +702,7 @@ class KitRenderer:
                 "width": asset.width,
                 "height": asset.height,
                 "bytes": asset.path.stat().st_size,
-                "sha256": hashlib.sha256(asset.path.read_bytes()).hexdigest(),
+                "sha256": sha256(asset.path),
                 "altText": asset.alt_text,
             })
         manifest = {
@@ -1,12 +1,16 @@
 """Hermetic prerequisites for the pre-rentree Python test collection."""
 
 from pathlib import Path
+import os
 import subprocess
 
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 SNAPSHOT_PATH = REPO_ROOT / ".artifacts/pre-rentree-2026/publication.snapshot.json"
 
+# Digests hashed by the tests themselves stay in memory instead of the checkout.
+os.environ.setdefault("PRE_RENTREE_DIGEST_CACHE", "")
+
 
 def pytest_sessionstart(session):  # noqa: ARG001
     """Build the canonical snapshot before test modules import it."""
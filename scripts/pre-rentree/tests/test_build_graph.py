@@ -0,0 +1,180 @@
+"""The incremental build graph may only skip a stage whose code, params and
+input bytes are unchanged, and a skipped stage must leave the staging tree and
+the results exactly as re-running it would. Running independent stages
+concurrently must not change results, order or failure semantics."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import build_graph  # noqa: E402
+from build_graph import Stage, StageCache, code_fingerprint, ordered_stages, run_stages  # noqa: E402
+
+
+def _stages(root: Path, text: str, calls: list[str]) -> list[Stage]:
+    def write(_):
+        calls.append("write")
+        (root / "out").mkdir(exist_ok=True)
+        (root / "out/page.txt").write_text(text.strip(), encoding="utf-8")
+
+    def measure(results):
+        calls.append("measure")
+        return {"LENGTH": len((root / "out/page.txt").read_text(encoding="utf-8"))}
+
+    return [
+        Stage("measure", measure, after=("write",), inputs=("out",)),
+        Stage("write", write, outputs=("out",), params=text),
+    ]
+
+
+def test_unchanged_stages_are_restored_into_a_fresh_root(tmp_path):
+    cache = StageCache(tmp_path / "cache")
+    first_root, second_root = tmp_path / "first", tmp_path / "second"
+    first_root.mkdir()
+    second_root.mkdir()
+    calls: list[str] = []
+
+    first, executed = run_stages(_stages(first_root, "FAQ", calls), first_root, cache, code="v1")
+    assert executed == ["write", "measure"]
+    second, executed = run_stages(_stages(second_root, "FAQ", calls), second_root, cache, code="v1")
+
+    assert executed == []
+    assert calls == ["write", "measure"]
+    assert second == first == {"write": None, "measure": {"LENGTH": 3}}
+    assert (second_root / "out/page.txt").read_text(encoding="utf-8") == "FAQ"
+
+
+def test_only_stages_whose_inputs_changed_rerun(tmp_path):
+    cache = StageCache(tmp_path / "cache")
+    calls: list[str] = []
+    run_stages(_stages(tmp_path, "FAQ", calls), tmp_path, cache, code="v1")
+
+    # New params, identical output bytes: the downstream stage is still reused.
+    _, executed = run_stages(_stages(tmp_path, "FAQ  ", calls), tmp_path, cache, code="v1")
+    assert executed == ["write"]
+    _, executed = run_stages(_stages(tmp_path, "FAQ!", calls), tmp_path, cache, code="v1")
+    assert executed == ["write", "measure"]
+    _, executed = run_stages(_stages(tmp_path, "FAQ!", calls), tmp_path, cache, code="v2")
+    assert executed == ["write", "measure"]
+
+
+def test_stage_reruns_when_a_repository_source_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_graph, "REPO_ROOT", tmp_path / "repo")
+    logo = tmp_path / "repo/assets/logo.png"
+    logo.parent.mkdir(parents=True)
+    logo.write_bytes(b"logo v1")
+    cache = StageCache(tmp_path / "cache")
+    stages = [Stage("assets", lambda _: logo.read_bytes().decode("ascii"), sources=("assets/logo.png",))]
+
+    assert run_stages(stages, tmp_path, cache, code="v1") == ({"assets": "logo v1"}, ["assets"])
+    assert run_stages(stages, tmp_path, cache, code="v1") == ({"assets": "logo v1"}, [])
+    logo.write_bytes(b"logo v2")
+    assert run_stages(stages, tmp_path, cache, code="v1") == ({"assets": "logo v2"}, ["assets"])
+    logo.unlink()
+    with pytest.raises(FileNotFoundError, match="source is missing"):
+        run_stages(stages, tmp_path, cache, code="v1")
+
+
+def test_code_fingerprint_covers_the_shared_pdf_generator_modules(tmp_path):
+    scripts, tools = tmp_path / "scripts", tmp_path / "tools"
+    scripts.mkdir()
+    tools.mkdir()
+    (scripts / "generate_documents.py").write_text("STAGES = []\n", encoding="utf-8")
+    for name in build_graph.PDF_GENERATOR_MODULES:
+        (tools / name).write_text(f"# {name}\n", encoding="utf-8")
+    before = code_fingerprint(scripts, tools)
+
+    (tools / "pdf_fonts.py").write_text("# pdf_fonts.py, edited\n", encoding="utf-8")
+    assert code_fingerprint(scripts, tools) != before
+    (tools / "pdf_fonts.py").unlink()
+    with pytest.raises(FileNotFoundError, match="pdf_fonts.py"):
+        code_fingerprint(scripts, tools)
+
+
+def test_cache_keeps_only_recent_fingerprints(tmp_path):
+    cache = StageCache(tmp_path / "cache", keep=2)
+    for text in ("a", "b", "c"):
+        run_stages(_stages(tmp_path, text, []), tmp_path, cache, code="v1")
+
+    assert len(list((tmp_path / "cache/write").iterdir())) == 2
+
+
+def test_order_rejects_unknown_and_cyclic_dependencies():
+    noop = lambda _: None  # noqa: E731
+    assert [s.name for s in ordered_stages([Stage("b", noop, after=("a",)), Stage("a", noop)])] == ["a", "b"]
+    with pytest.raises(ValueError, match="unknown"):
+        ordered_stages([Stage("b", noop, after=("a",))])
+    with pytest.raises(ValueError, match="cycle"):
+        ordered_stages([Stage("a", noop, after=("b",)), Stage("b", noop, after=("a",))])
+
+
+def test_parallel_run_overlaps_independent_stages_and_matches_serial(tmp_path):
+    barrier = threading.Barrier(2, timeout=10)
+
+    def together(name):
+        def run(_):
+            barrier.wait()
+            return name
+        return run
+
+    stages = [
+        Stage("pdf", together("pdf")),
+        Stage("social", together("social")),
+        Stage("audit", lambda results: [results["pdf"], results["social"]], after=("pdf", "social")),
+    ]
+    results, executed = run_stages(stages, tmp_path, jobs=4)
+
+    assert executed == ["pdf", "social", "audit"]
+    assert list(results) == executed
+    assert results["audit"] == ["pdf", "social"]
+
+
+def test_parallel_run_keeps_stage_workers_within_jobs(tmp_path):
+    lock = threading.Lock()
+    busy: list[int] = []
+
+    def occupy(workers):
+        def run(_):
+            with lock:
+                busy.append((busy[-1] if busy else 0) + workers)
+            time.sleep(0.05)
+            with lock:
+                busy.append(busy[-1] - workers)
+        return run
+
+    stages = [
+        Stage("pdf", occupy(3), workers=3),
+        Stage("social", occupy(1)),
+        Stage("review", occupy(1)),
+        Stage("audit", occupy(1)),
+    ]
+    _, executed = run_stages(stages, tmp_path, jobs=4)
+
+    assert executed == ["pdf", "social", "review", "audit"]
+    assert max(busy) == 4
+
+
+def test_parallel_failure_stops_dependents_and_raises_first_failure(tmp_path):
+    calls: list[str] = []
+
+    def fail(message):
+        def run(_):
+            raise RuntimeError(message)
+        return run
+
+    stages = [
+        Stage("html", fail("html failed")),
+        Stage("review", lambda _: calls.append("review")),
+        Stage("pdf", lambda _: calls.append("pdf"), after=("html",)),
+    ]
+    with pytest.raises(RuntimeError, match="html failed"):
+        run_stages(stages, tmp_path, jobs=4)
+    assert "pdf" not in calls
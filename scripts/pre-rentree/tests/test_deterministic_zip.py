@@ -0,0 +1,98 @@
+"""ParallelZipWriter must write, byte for byte, what zipfile writes serially
+for the same entries and compression, whatever the worker count."""
+
+from __future__ import annotations
+
+import io
+import os
+import random
+import sys
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import deterministic_zip  # noqa: E402
+from deterministic_zip import ParallelZipWriter, compression_for  # noqa: E402
+
+
+def _info(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, (2026, 6, 15, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.create_system = 3
+    info.external_attr = 0o100644 << 16
+    return info
+
+
+def _entries(root: Path) -> list[tuple[str, Path | bytes]]:
+    generator = random.Random(2026)
+    words = ["stage", "pré-rentrée", "mathématiques", "français", "bilan", "acompte", "groupe"]
+    text = " ".join(generator.choice(words) for _ in range(400_000)).encode("utf-8")
+    (root / "guide.html").write_bytes(text)
+    (root / "page.png").write_bytes(b"\x89PNG\r\n\x1a\n" + os.urandom(300_000))
+    (root / "empty.txt").write_bytes(b"")
+    return [
+        ("HTML/guide.html", root / "guide.html"),
+        ("REVIEW/page.png", root / "page.png"),
+        ("empty.txt", root / "empty.txt"),
+        ("Modèle économique.xml", b"<?xml version='1.0'?><a>" + b"<b/>" * 5000 + b"</a>"),
+        ("nested.zip", b"PK\x03\x04" + os.urandom(1000)),
+    ]
+
+
+def _serial(entries: list[tuple[str, Path | bytes]]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, source in entries:
+            content = source if isinstance(source, bytes) else source.read_bytes()
+            compress_type, level = compression_for(_info(name), content[:8])
+            archive.writestr(_info(name), content, compress_type=compress_type, compresslevel=level)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(("jobs", "entry_max", "window"), [(1, 0, 0), (2, 1 << 30, 1 << 30), (2, 1024 * 1024, 1)])
+def test_parallel_writer_matches_serial_zipfile_bytes(tmp_path, monkeypatch, jobs, entry_max, window):
+    monkeypatch.setattr(deterministic_zip, "PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(deterministic_zip, "PARALLEL_ENTRY_MAX_BYTES", entry_max)
+    monkeypatch.setattr(deterministic_zip, "PARALLEL_WINDOW_BYTES", window)
+    monkeypatch.setattr(deterministic_zip, "CHUNK_BYTES", 64 * 1024)
+    entries = _entries(tmp_path)
+    buffer = io.BytesIO()
+    with ParallelZipWriter(buffer, jobs=jobs) as archive:
+        written = archive.write((_info(name), source) for name, source in entries[:3])
+        written += archive.write((_info(name), source) for name, source in entries[3:])
+
+    assert buffer.getvalue() == _serial(entries)
+    assert [entry.compress_type for entry in written] == [
+        zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED,
+    ]
+    with zipfile.ZipFile(buffer) as archive:
+        assert archive.testzip() is None
+        assert archive.read("HTML/guide.html") == (tmp_path / "guide.html").read_bytes()
+    with pytest.raises(ValueError, match="Duplicate ZIP entry"):
+        ParallelZipWriter(io.BytesIO()).write([(_info("a"), b"1"), (_info("a"), b"2")])
+
+
+def test_entries_deflated_in_process_are_written_chunk_by_chunk(tmp_path):
+    path = tmp_path / "registrations.csv"
+    with path.open("w", encoding="utf-8") as handle:
+        for row in range(600_000):
+            handle.write(f"{row},stage-{row % 7},groupe-{row % 13},{row * 37 % 1000}.00\n")
+    package = tmp_path / "package.zip"
+
+    tracemalloc.start()
+    try:
+        with package.open("wb") as handle, ParallelZipWriter(handle, jobs=1) as archive:
+            archive.write([(_info("registrations.csv"), path)])
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert package.stat().st_size > 3 * deterministic_zip.CHUNK_BYTES
+    assert peak < 4 * deterministic_zip.CHUNK_BYTES
+    with zipfile.ZipFile(package) as archive:
+        assert archive.read("registrations.csv") == path.read_bytes()
@@ -10,6 +10,8 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 from document_assets import generate_qr, prepare_assets  # noqa: E402
 from document_audit import (  # noqa: E402
+    _public_text_files,
+    analyze_pdf,
     audit_html_accessibility,
     audit_pdf,
     audit_stylesheet_accessibility,
@@ -64,6 +66,16 @@ def test_audits_pdf_metadata_language_fonts_links_and_text(package: Path):
     assert record["PII_TEST_FINDING_COUNT"] == 0
 
 
+def test_each_pdf_is_parsed_once_and_shared_by_every_audit(package: Path):
+    pdf_path = package / "PUBLIC" / SNAPSHOT["document"]["outputs"]["publicPdf"]["essential"]
+    analysis = analyze_pdf(pdf_path)
+    record = audit_pdf(pdf_path, SNAPSHOT)
+
+    assert analyze_pdf(pdf_path) is analysis
+    assert (record["PDF_SHA256"], record["PAGE_COUNT"]) == (analysis.sha256, analysis.page_count)
+    assert dict(_public_text_files(package / "PUBLIC"))[pdf_path] == analysis.text
+
+
 def test_accessible_html_has_no_structural_issue(package: Path):
     for filename in SNAPSHOT["document"]["outputs"]["publicHtml"].values():
         issues = audit_html_accessibility(package / "PUBLIC/HTML" / filename)
@@ -28,7 +28,7 @@ def sha256(path: Path) -> str:
     return hashlib.sha256(path.read_bytes()).hexdigest()
 
 
-def build_fixture(root: Path) -> tuple[dict[str, Path], dict[str, Path]]:
+def build_fixture(root: Path, jobs: int = 1) -> tuple[dict[str, Path], dict[str, Path]]:
     assets_dir = root / "PUBLIC/ASSETS"
     css_dir = assets_dir
     html_dir = root / "PUBLIC/HTML"
@@ -38,7 +38,7 @@ def build_fixture(root: Path) -> tuple[dict[str, Path], dict[str, Path]]:
     css_dir.mkdir(parents=True, exist_ok=True)
     shutil.copyfile(SCRIPT_DIR / "templates/document.css", css_dir / "document.css")
     html = write_public_html(SNAPSHOT, html_dir)
-    pdf = render_public_pdfs(SNAPSHOT, html_dir, pdf_dir)
+    pdf = render_public_pdfs(SNAPSHOT, html_dir, pdf_dir, jobs=jobs)
     return html, pdf
 
 
@@ -93,6 +93,16 @@ def test_repeated_render_is_byte_deterministic(tmp_path: Path):
     }
 
 
+def test_parallel_render_is_byte_identical_to_serial(tmp_path: Path):
+    _, serial = build_fixture(tmp_path / "serial")
+    _, parallel = build_fixture(tmp_path / "parallel", jobs=3)
+
+    assert {key: sha256(path) for key, path in parallel.items()} == {
+        key: sha256(path) for key, path in serial.items()
+    }
+    assert "SOURCE_DATE_EPOCH" not in os.environ
+
+
 def test_source_date_epoch_uses_utc_independently_of_host_timezone():
     previous_timezone = os.environ.get("TZ")
     try:
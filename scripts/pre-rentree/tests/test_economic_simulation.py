@@ -1,5 +1,6 @@
 import csv
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -10,6 +11,8 @@ import pytest
 REPO_ROOT = Path(__file__).resolve().parents[3]
 SCRIPT = REPO_ROOT / "scripts/pre-rentree/render_economic_simulation.py"
 OPERATIONS = REPO_ROOT / "content/pre-rentree-2026/operations.fr.json"
+# Scripts run against the checkout keep their digest cache in memory.
+SCRIPT_ENV = {**os.environ, "PRE_RENTREE_DIGEST_CACHE": ""}
 
 
 @pytest.fixture(scope="module")
@@ -35,6 +38,7 @@ def test_economic_simulation_is_complete_but_fail_closed_without_cost_inputs(tmp
         [sys.executable, str(SCRIPT), "--commercial", str(commercial_snapshot), "--operations", str(OPERATIONS), "--output", str(output)],
         cwd=REPO_ROOT,
         check=True,
+        env=SCRIPT_ENV,
     )
 
     simulation = json.loads((output / "economic-simulation.json").read_text(encoding="utf-8"))
@@ -103,6 +107,7 @@ def test_economic_simulation_calculates_validated_costs_and_break_even(tmp_path:
         [sys.executable, str(SCRIPT), "--commercial", str(commercial_snapshot), "--operations", str(operations_path), "--output", str(output)],
         cwd=REPO_ROOT,
         check=True,
+        env=SCRIPT_ENV,
     )
     simulation = json.loads((output / "economic-simulation.json").read_text(encoding="utf-8"))
     assert simulation["status"] == "CALCULATED"
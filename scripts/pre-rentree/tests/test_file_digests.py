@@ -0,0 +1,68 @@
+"""The digest cache may only ever spare work: a digest it returns must be the
+file's current SHA-256, even after a rewrite that keeps size and mtime."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import file_digests  # noqa: E402
+from file_digests import DigestCache  # noqa: E402
+
+
+def _counting_hashes(monkeypatch) -> list[str]:
+    hashed: list[str] = []
+    original = file_digests.hash_file
+
+    def counting(path):
+        hashed.append(os.path.basename(path))
+        return original(path)
+
+    monkeypatch.setattr(file_digests, "hash_file", counting)
+    monkeypatch.setattr(file_digests, "RACY_SECONDS", 0)
+    return hashed
+
+
+def test_saved_digests_spare_unchanged_files_only(tmp_path, monkeypatch):
+    hashed = _counting_hashes(monkeypatch)
+    files = [tmp_path / f"file-{index}.bin" for index in range(6)]
+    for index, path in enumerate(files):
+        path.write_bytes(os.urandom(100_000 + index))
+    cache_path = tmp_path / "cache/digests.json"
+
+    first = DigestCache(cache_path)
+    assert first.sha256_many(files, jobs=3) == [hashlib.sha256(path.read_bytes()).hexdigest() for path in files]
+    first.save()
+    assert len(hashed) == 6
+
+    stat = files[0].stat()
+    files[0].write_bytes(os.urandom(100_000))
+    os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    hashed.clear()
+    second = DigestCache(cache_path)
+    assert second.sha256_many(files) == [hashlib.sha256(path.read_bytes()).hexdigest() for path in files]
+    assert hashed == ["file-0.bin"]
+
+
+def test_large_files_are_memory_mapped_and_racy_digests_not_kept(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_digests, "MMAP_MIN_BYTES", 1)
+    path = tmp_path / "video.mp4"
+    path.write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+    cache = DigestCache(None)
+
+    assert cache.sha256(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+    assert cache._entries == {}
+
+
+def test_environment_overrides_or_disables_the_shared_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv(file_digests.CACHE_PATH_ENV, raising=False)
+    assert file_digests.cache_path_from_environment() == file_digests.DEFAULT_CACHE_PATH
+    monkeypatch.setenv(file_digests.CACHE_PATH_ENV, str(tmp_path / "digests.json"))
+    assert file_digests.cache_path_from_environment() == tmp_path / "digests.json"
+    monkeypatch.setenv(file_digests.CACHE_PATH_ENV, "")
+    assert file_digests.cache_path_from_environment() is None
@@ -1,5 +1,6 @@
 import hashlib
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -9,7 +10,11 @@ import pytest
 SCRIPT_DIR = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(SCRIPT_DIR))
 
+import build_graph  # noqa: E402
+import generate_documents  # noqa: E402
+from build_graph import StageCache, run_stages  # noqa: E402
 from generate_documents import (  # noqa: E402
+    _build_stages,
     _validate_output_target,
     build_package,
 )
@@ -59,6 +64,40 @@ def test_builds_complete_public_tree_and_records_private_package_block(built_pac
     assert status["PUBLIC_DISTRIBUTION"] == "NOT_AUTHORIZED"
 
 
+def test_rebuild_from_stage_cache_matches_a_fresh_build(built_package: Path, tmp_path: Path):
+    cache = StageCache(tmp_path / "stage-cache")
+    build_package(SNAPSHOT, tmp_path / "first", include_visual=False, stage_cache=cache)
+    report = build_package(SNAPSHOT, tmp_path / "second", include_visual=False, stage_cache=cache)
+
+    fresh = json.loads((built_package / "REVIEW/AUDIT/final-report.json").read_text(encoding="utf-8"))
+    assert report == fresh
+    for path in sorted((built_package / "PUBLIC").rglob("*")):
+        if path.is_file():
+            assert sha256(tmp_path / "second" / path.relative_to(built_package)) == sha256(path), path
+
+
+def test_warm_stage_cache_still_rejects_an_edited_project_asset(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    snapshot = json.loads(SNAPSHOT.read_text(encoding="utf-8"))
+    repo = tmp_path / "repo"
+    for item in (*snapshot["assets"]["logos"], *snapshot["assets"]["fonts"]):
+        (repo / item["path"]).parent.mkdir(parents=True, exist_ok=True)
+        (repo / item["path"]).write_bytes((REPO_ROOT / item["path"]).read_bytes())
+    monkeypatch.setattr(generate_documents, "REPO_ROOT", repo)
+    monkeypatch.setattr(build_graph, "REPO_ROOT", repo)
+    cache = StageCache(tmp_path / "stage-cache")
+
+    def build_assets(root: Path) -> list[str]:
+        stages = _build_stages(snapshot, root, include_visual=False, jobs=1, render_cache=None)
+        return run_stages([stage for stage in stages if stage.name == "assets"], root, cache, code="v1")[1]
+
+    assert build_assets(tmp_path / "first") == ["assets"]
+    assert build_assets(tmp_path / "second") == []
+    logo = repo / snapshot["assets"]["logos"][0]["path"]
+    logo.write_bytes(logo.read_bytes() + b"\0")
+    with pytest.raises(ValueError, match="Asset hash mismatch"):
+        build_assets(tmp_path / "third")
+
+
 def test_records_all_final_gates_without_copying_repository_sources(built_package: Path):
     final_report = json.loads((built_package / "REVIEW/AUDIT/final-report.json").read_text(encoding="utf-8"))
     zero_gates = (
@@ -102,6 +141,7 @@ def test_cli_is_independent_of_current_working_directory(tmp_path: Path):
         cwd=tmp_path,
         check=True,
         capture_output=True,
+        env={**os.environ, "PRE_RENTREE_DIGEST_CACHE": ""},
         text=True,
     )
     assert output.is_dir()
@@ -48,12 +48,12 @@ import generate_level_dossiers  # noqa: E402
 importlib.reload(pre_rentree_data)
 importlib.reload(generate_level_dossiers)
 
-from pre_rentree_data import LEVEL_ORDER, PreRentreeData  # noqa: E402
+from pre_rentree_data import LEVEL_ORDER, PreRentreeData, shared_data  # noqa: E402
 
 
 @pytest.fixture(scope="module")
 def data() -> PreRentreeData:
-    return PreRentreeData(REPO_ROOT)
+    return shared_data(REPO_ROOT)
 
 
 @pytest.fixture(scope="module")
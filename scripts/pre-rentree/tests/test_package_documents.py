@@ -4,11 +4,16 @@ import hashlib
 import json
 import sys
 import zipfile
+from datetime import date
 from pathlib import Path
 
+import pytest
+
 SCRIPT_DIR = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(SCRIPT_DIR))
 
+import deterministic_zip  # noqa: E402
+import package_documents as packaging  # noqa: E402
 from package_documents import package_documents  # noqa: E402
 
 
@@ -93,3 +98,28 @@ def test_packages_exact_parent_surface_and_review_evidence_deterministically(tmp
         "NexusReussite_PreRentree2026_REVIEW_PACKAGE.zip",
     ]
     assert all(len(item["sha256"]) == 64 for item in index["packages"])
+
+
+def test_streamed_entries_are_hashed_in_the_pass_that_compresses_them(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(deterministic_zip, "CHUNK_BYTES", 1000)
+    large = tmp_path / "large.bin"
+    large.write_bytes(bytes(range(256)) * 40)
+    destination = tmp_path / "package.zip"
+
+    records, crcs = packaging._write_package(
+        destination, [("b/large.bin", large), ("a.txt", b"bonjour")], "TEST", date(2026, 6, 15),
+    )
+
+    assert records == [
+        {"path": "a.txt", "sha256": hashlib.sha256(b"bonjour").hexdigest(), "fileSize": 7},
+        {"path": "b/large.bin", "sha256": _sha(large), "fileSize": 10240},
+    ]
+    with zipfile.ZipFile(destination) as archive:
+        assert archive.namelist() == ["a.txt", "b/large.bin", "package-manifest.json"]
+        assert archive.read("b/large.bin") == large.read_bytes()
+        assert json.loads(archive.read("package-manifest.json"))["files"] == records
+    packaging._verify_compressed_package(destination, records, crcs)
+    with pytest.raises(ValueError, match="entry mismatch"):
+        packaging._verify_compressed_package(destination, records, {**crcs, "a.txt": crcs["a.txt"] ^ 1})
+    with pytest.raises(ValueError, match="already contain a manifest"):
+        packaging._write_package(destination, [("package-manifest.json", b"{}")], "TEST", date(2026, 6, 15))
@@ -0,0 +1,59 @@
+"""page_rasters.PageRasterizer serves every review tool: its files and records
+must not depend on the worker count, and contact sheets must come out of the
+thumbnail cache without reopening the page files."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from PIL import ImageChops
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
+if str(PDF_GENERATOR_DIR) not in sys.path:
+    sys.path.insert(0, str(PDF_GENERATOR_DIR))
+
+from page_rasters import PageRasterizer, SheetLayout, Thumbnail, ThumbnailCache, contact_sheet  # noqa: E402
+
+FINAL_PDFS = sorted((REPO_ROOT / "assets/campaigns/pre-rentree-2026/documents-final").glob("*.pdf"))
+
+
+def test_pool_and_serial_rendering_write_the_same_pages(tmp_path):
+    documents = FINAL_PDFS[:2]
+    with PageRasterizer(workers=1, cache=ThumbnailCache()) as rasterizer:
+        serial = rasterizer.render_many(
+            [(pdf, tmp_path / "serial" / pdf.stem) for pdf in documents], zoom=0.5,
+            name="{stem}-{page:0{digits}d}.png",
+        )
+    with PageRasterizer(workers=2, cache=ThumbnailCache()) as rasterizer:
+        pooled = rasterizer.render_many(
+            [(pdf, tmp_path / "pooled" / pdf.stem) for pdf in documents], zoom=0.5,
+            name="{stem}-{page:0{digits}d}.png",
+        )
+
+    assert [len(pages) for pages in serial] == [len(pages) for pages in pooled]
+    for serial_pages, pooled_pages in zip(serial, pooled):
+        assert [page.page for page in pooled_pages] == list(range(1, len(pooled_pages) + 1))
+        for one, other in zip(serial_pages, pooled_pages):
+            assert (one.path.name, one.sha256, one.text) == (other.path.name, other.sha256, other.text)
+            assert one.path.read_bytes() == other.path.read_bytes()
+            assert one.path.name.startswith(f"{one.pdf.stem}-")
+
+
+def test_contact_sheet_reuses_cached_thumbnails(tmp_path):
+    cache = ThumbnailCache()
+    spec = Thumbnail((120, 170), "pad")
+    with PageRasterizer(workers=1, cache=cache) as rasterizer:
+        pages = rasterizer.render(FINAL_PDFS[0], tmp_path, zoom=0.5, thumbnail=spec)
+    layout = SheetLayout(columns=3, cell=(130, 200), thumbnail=spec, label_offset=(0, 175), margin=5)
+    for page in pages:
+        page.path.unlink()
+
+    sheet = contact_sheet([(f"page {page.page}", page.path, page.sha256) for page in pages], layout, cache=cache)
+
+    rows = -(-len(pages) // 3)
+    assert sheet.size == (3 * 130 + 5, rows * 200 + 5)
+    assert all(cache.get(page.sha256, spec).size == (120, 170) for page in pages)
+    first = cache.get(pages[0].sha256, spec)
+    assert not ImageChops.difference(sheet.crop((5, 5, 125, 175)), first).getbbox()
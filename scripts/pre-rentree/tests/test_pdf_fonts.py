@@ -0,0 +1,37 @@
+"""pdf_fonts.font_inventory() replaced pdffonts and the PyMuPDF font walks: it
+must name exactly the fonts PyMuPDF sees in every committed public PDF and
+find their embedded programs without extracting them."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+from pypdf import PdfReader
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
+if str(PDF_GENERATOR_DIR) not in sys.path:
+    sys.path.insert(0, str(PDF_GENERATOR_DIR))
+
+from pdf_fonts import font_inventory, font_names  # noqa: E402
+
+FINAL_PDFS = sorted((REPO_ROOT / "assets/campaigns/pre-rentree-2026/documents-final").glob("*.pdf"))
+
+
+@pytest.mark.parametrize("path", FINAL_PDFS, ids=lambda path: path.name)
+def test_inventory_matches_pymupdf_font_names_and_embedding(path):
+    inventory = font_inventory(PdfReader(str(path)))
+    with fitz.open(path) as document:
+        names = {font[3] for page in document for font in page.get_fonts()}
+        embedded = {
+            font[3] for page in document for font in page.get_fonts()
+            if font[0] and document.extract_font(font[0])[-1]
+        }
+
+    assert font_names(inventory) == sorted(names)
+    assert {font.base_font for font in inventory if font.embedded} == embedded
+    assert all(font.subset == ("+" in font.base_font) for font in inventory)
+    assert [font.page for font in inventory] == sorted(font.page for font in inventory)
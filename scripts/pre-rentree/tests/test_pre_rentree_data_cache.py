@@ -0,0 +1,100 @@
+"""PreRentreeData's compiled cache must be invisible: a cache hit yields the
+same derived data as a fresh parse, and editing any canonical source (or the
+loader itself) invalidates it instead of serving the stale schedule."""
+
+from __future__ import annotations
+
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
+if str(PDF_GENERATOR_DIR) not in sys.path:
+    sys.path.insert(0, str(PDF_GENERATOR_DIR))
+
+from pre_rentree_data import SOURCE_FILES, PreRentreeData, shared_data  # noqa: E402
+
+
+def _copy_sources(root: Path) -> None:
+    for relative in SOURCE_FILES:
+        (root / relative).parent.mkdir(parents=True, exist_ok=True)
+        (root / relative).write_bytes((REPO_ROOT / relative).read_bytes())
+
+
+def test_cache_hit_matches_a_fresh_parse(tmp_path):
+    _copy_sources(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    fresh = PreRentreeData(tmp_path)
+    PreRentreeData(tmp_path, cache_dir=cache_dir)
+    cached = PreRentreeData(tmp_path, cache_dir=cache_dir)
+
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+    assert vars(cached) == vars(fresh)
+    assert cached.level_dossier("TERMINALE") == fresh.level_dossier("TERMINALE")
+
+
+def test_editing_a_source_invalidates_the_cache(tmp_path):
+    _copy_sources(tmp_path)
+    cache_dir = tmp_path / "cache"
+    before = PreRentreeData(tmp_path, cache_dir=cache_dir)
+
+    campaign_path = tmp_path / SOURCE_FILES[0]
+    campaign = json.loads(campaign_path.read_text(encoding="utf-8"))
+    moved = next(s for w in campaign["schedule"] for s in w["slots"] if s["level"] == "SECONDE")
+    moved["room"] = "salle-9"
+    campaign_path.write_text(json.dumps(campaign), encoding="utf-8")
+    after = PreRentreeData(tmp_path, cache_dir=cache_dir)
+
+    assert "salle-9" not in {s.room for s in before.slots_for_level("SECONDE")}
+    assert "salle-9" in {s.room for s in after.slots_for_level("SECONDE")}
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"not a pickle",
+        pickle.dumps(42),  # not a (key, state) pair
+        pickle.dumps(("key",)),
+        b"\x80\x04cmissing_module\nThing\n.",  # a class that no longer imports
+    ],
+)
+def test_corrupt_cache_is_rebuilt(tmp_path, payload):
+    _copy_sources(tmp_path)
+    cache_dir = tmp_path / "cache"
+    PreRentreeData(tmp_path, cache_dir=cache_dir)
+    (pickle_path,) = cache_dir.glob("*.pickle")
+    pickle_path.write_bytes(payload)
+
+    rebuilt = PreRentreeData(tmp_path, cache_dir=cache_dir)
+
+    assert rebuilt.subjects_for_level("TERMINALE") == PreRentreeData(tmp_path).subjects_for_level("TERMINALE")
+
+
+def test_shared_data_is_one_instance_per_repository(tmp_path):
+    first, second = tmp_path / "first", tmp_path / "second"
+    _copy_sources(first)
+    _copy_sources(second)
+
+    assert shared_data(first) is shared_data(first)
+    assert shared_data(first) is not shared_data(second)
+
+
+def test_compact_slots_keep_their_template_fields_through_the_cache(tmp_path):
+    _copy_sources(tmp_path)
+    data = PreRentreeData(tmp_path, cache_dir=tmp_path / "cache")
+    data = PreRentreeData(tmp_path, cache_dir=tmp_path / "cache")
+    campaign = json.loads((tmp_path / SOURCE_FILES[0]).read_text(encoding="utf-8"))
+    times = {b["id"]: (b["startTime"], b["endTime"]) for b in campaign["blocks"]}
+
+    slot = data.dated_slots_for_level("TERMINALE")[0]
+
+    assert (slot.start_time, slot.end_time) == times[slot.block]
+    assert slot.end_minutes - slot.start_minutes == 120
+    assert slot._replace(room="salle-2").start_time == slot.start_time
+    assert not hasattr(slot, "__dict__")
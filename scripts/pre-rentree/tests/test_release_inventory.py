@@ -7,6 +7,23 @@ from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 SCRIPT = REPO_ROOT / "scripts/pre-rentree/build_release_inventory.py"
+sys.path.insert(0, str(SCRIPT.parent))
+
+from build_release_inventory import clean_tracked_blobs, files_for  # noqa: E402
+
+# Scripts run against the checkout keep their digest cache in memory.
+SCRIPT_ENV = {**os.environ, "PRE_RENTREE_DIGEST_CACHE": ""}
+
+
+def _inventory(tmp_path: Path, name: str, *options: str) -> dict:
+    head = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    baseline = subprocess.check_output(["git", "rev-parse", "HEAD^"], cwd=REPO_ROOT, text=True).strip()
+    subprocess.run([
+        sys.executable, str(SCRIPT), "--repo-root", str(REPO_ROOT), "--output", str(tmp_path / name),
+        "--branch", "release/pre-rentree-2026-public-ready", "--pull-request", "999",
+        "--baseline-sha", baseline, "--repository-commit-sha", head, *options,
+    ], check=True, env=SCRIPT_ENV)
+    return json.loads((tmp_path / name).read_text(encoding="utf-8"))
 
 
 def test_release_inventory_covers_all_seven_lots_and_final_assets(tmp_path: Path):
@@ -36,7 +53,7 @@ def test_release_inventory_covers_all_seven_lots_and_final_assets(tmp_path: Path
         baseline,
         "--repository-commit-sha",
         head,
-    ], check=True)
+    ], check=True, env=SCRIPT_ENV)
     inventory = json.loads(output.read_text(encoding="utf-8"))
     release_gates = json.loads(
         (REPO_ROOT / "content/pre-rentree-2026/release-gates.json")
@@ -112,7 +129,7 @@ def test_release_inventory_derives_pull_request_from_explicit_environment(tmp_pa
         cwd=REPO_ROOT,
         text=True,
     ).strip()
-    env = os.environ.copy()
+    env = dict(SCRIPT_ENV)
     env["PRE_RENTREE_PULL_REQUEST"] = "999"
     env["PRE_RENTREE_BASELINE_SHA"] = baseline
 
@@ -135,7 +152,7 @@ def test_release_inventory_derives_pull_request_from_explicit_environment(tmp_pa
 
 
 def test_release_inventory_fails_closed_without_pull_request(tmp_path: Path):
-    env = os.environ.copy()
+    env = dict(SCRIPT_ENV)
     env.pop("PRE_RENTREE_PULL_REQUEST", None)
     env["PRE_RENTREE_BASELINE_SHA"] = subprocess.check_output(
         ["git", "rev-parse", "HEAD^"],
@@ -164,7 +181,7 @@ def test_release_inventory_fails_closed_without_pull_request(tmp_path: Path):
 
 
 def test_release_inventory_fails_closed_without_baseline(tmp_path: Path):
-    env = os.environ.copy()
+    env = dict(SCRIPT_ENV)
     env["PRE_RENTREE_PULL_REQUEST"] = "999"
     env.pop("PRE_RENTREE_BASELINE_SHA", None)
     result = subprocess.run([
@@ -197,3 +214,33 @@ def test_active_package_script_has_no_hardcoded_pull_request():
     assert "PRE_RENTREE_PULL_REQUEST" in command
     assert "PRE_RENTREE_BRANCH" in command
     assert "PRE_RENTREE_BASELINE_SHA" in command
+
+
+def test_incremental_inventory_matches_a_full_rescan(tmp_path: Path):
+    full = _inventory(tmp_path, "full.json")
+
+    index = str(tmp_path / "blobs.json")
+    assert _inventory(tmp_path, "first.json", "--incremental", "--blob-index", index) == full
+    assert (tmp_path / "blobs.json").is_file()
+    assert _inventory(tmp_path, "second.json", "--incremental", "--blob-index", index) == full
+
+
+def test_incremental_inventory_reads_only_files_with_unknown_blobs():
+    target = "assets/campaigns/pre-rentree-2026/documents-final"
+    blobs = clean_tracked_blobs(REPO_ROOT, [target])
+    pdf = next(path for path in sorted(blobs) if path.endswith(".pdf"))
+    size = (REPO_ROOT / pdf).stat().st_size
+    index = {blobs[pdf]: [size, "0" * 64]}
+
+    records = {item["path"]: item for item in files_for(
+        REPO_ROOT, [target], public_candidate=False, blobs=blobs, blob_index=index,
+    )}
+
+    assert records[pdf]["sha256"] == "0" * 64
+    other = next(path for path in sorted(blobs) if path != pdf)
+    assert index[blobs[other]] == [records[other]["bytes"], records[other]["sha256"]]
+    index = {blobs[pdf]: [size + 1, "0" * 64]}
+    records = {item["path"]: item for item in files_for(
+        REPO_ROOT, [target], public_candidate=False, blobs=blobs, blob_index=index,
+    )}
+    assert records[pdf]["sha256"] != "0" * 64
@@ -0,0 +1,64 @@
+"""The render cache may only ever skip a render whose inputs are unchanged: any
+edited part or referenced asset must change the key, a hit must reproduce the
+stored bytes exactly, and the store must stay within its byte budget by
+dropping the least recently used PDFs first."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
+if str(PDF_GENERATOR_DIR) not in sys.path:
+    sys.path.insert(0, str(PDF_GENERATOR_DIR))
+
+from render_cache import RenderCache, referenced_asset_parts, render_key  # noqa: E402
+
+
+def test_key_separates_parts_and_follows_referenced_assets(tmp_path):
+    assert render_key("ab", "c") != render_key("a", "bc")
+    assert render_key("ab", "c") == render_key(b"ab", b"c")
+
+    (tmp_path / "logo.png").write_bytes(b"v1")
+    html = '<img src="nexus-asset:logo.png"><p style="background: url(nexus-asset:missing.png)">'
+    resolve = lambda name: tmp_path / name  # noqa: E731
+    before = referenced_asset_parts(html, "nexus-asset:", resolve)
+    assert [part.split(b":")[0] for part in before] == [b"logo.png", b"missing.png"]
+    assert before[1].endswith(b":missing")
+
+    (tmp_path / "logo.png").write_bytes(b"v2")
+    assert render_key(html, *referenced_asset_parts(html, "nexus-asset:", resolve)) != render_key(html, *before)
+
+
+def test_hit_copies_stored_bytes_and_miss_leaves_destination(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    rendered = tmp_path / "rendered.pdf"
+    rendered.write_bytes(b"%PDF-1.7 rendered")
+    destination = tmp_path / "out" / "copy.pdf"
+    destination.parent.mkdir()
+
+    assert cache.fetch(render_key("doc"), destination) is False
+    assert not destination.exists()
+
+    cache.store(render_key("doc"), rendered)
+    assert cache.fetch(render_key("doc"), destination) is True
+    assert destination.read_bytes() == rendered.read_bytes()
+    assert sorted(p.name for p in destination.parent.iterdir()) == ["copy.pdf"]
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    cache = RenderCache(tmp_path / "cache", max_bytes=250)
+    source = tmp_path / "source.pdf"
+    source.write_bytes(b"x" * 100)
+    keys = [render_key(name) for name in ("a", "b", "c")]
+    for age, key in enumerate(keys[:2]):
+        cache.store(key, source)
+        os.utime(cache.path_for(key), ns=(age * 10**9, age * 10**9))
+
+    # A hit on the oldest entry makes "b" the least recently used.
+    assert cache.fetch(keys[0], tmp_path / "hit.pdf")
+    cache.store(keys[2], source)
+
+    assert [cache.path_for(key).exists() for key in keys] == [True, False, True]
@@ -1,3 +1,4 @@
+import subprocess
 import sys
 from pathlib import Path
 
@@ -18,3 +19,34 @@ def test_repository_contains_no_tracked_document_outputs_or_duplicate_sources_or
     assert report["DUPLICATE_DOCUMENT_SOURCE_COUNT"] == 0
     assert report["TRACKED_PRIVATE_DIRECTORY_COUNT"] == 0
     assert report["PASS"] is True
+
+
+def test_audit_reads_duplicates_and_outputs_from_the_git_index(tmp_path):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    source = "export const total = 2026;\n"
+    files = {
+        "scripts/pre-rentree/a.ts": source,
+        "scripts/pre-rentree/b.ts": "export const other = 1;\n",
+        "lib/a_copy.ts": source,
+        "lib/notes.txt": source,
+        ".artifacts/pre-rentree-2026/report.json": "{}\n",
+        "artifacts/private/key.txt": "secret\n",
+    }
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content, encoding="utf-8")
+    (tmp_path / "lib/a_link.ts").symlink_to("../scripts/pre-rentree/a.ts")
+    git("init", "-q")
+    git("add", "-f", ".")
+
+    report = audit_repository(tmp_path)
+
+    assert report["DUPLICATE_DOCUMENT_SOURCES"] == [
+        "lib/a_copy.ts == scripts/pre-rentree/a.ts",
+        "lib/a_link.ts == scripts/pre-rentree/a.ts",
+    ]
+    assert report["TRACKED_GENERATED_OUTPUTS"] == [".artifacts/pre-rentree-2026/report.json"]
+    assert report["TRACKED_PRIVATE_DIRECTORIES"] == ["artifacts/private/key.txt"]
+    assert report["PASS"] is False
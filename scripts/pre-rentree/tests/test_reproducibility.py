@@ -1,14 +1,16 @@
+import hashlib
 import json
 import sys
 from pathlib import Path
 
 import pytest
+from PIL import Image, ImageDraw
 
 
 SCRIPT_DIR = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(SCRIPT_DIR))
 
-from verify_reproducibility import compare_public_builds  # noqa: E402
+from verify_reproducibility import compare_public_builds, compare_public_builds_visually  # noqa: E402
 
 
 def _public_file(root: Path, name: str, content: bytes) -> None:
@@ -38,3 +40,47 @@ def test_reproducibility_comparison_fails_on_content_drift(tmp_path: Path):
     with pytest.raises(ValueError, match="not reproducible"):
         compare_public_builds(first, second)
 
+
+
+def _rasterized_build(root: Path, pdf: bytes, erase: bool = False) -> Path:
+    _public_file(root, "guide.pdf", pdf)
+    image = Image.new("RGB", (320, 400), "white")
+    draw = ImageDraw.Draw(image)
+    for line in range(12):
+        draw.text((24, 24 + line * 24), f"Stage de pré-rentrée — ligne {line}", fill="black")
+    if erase:
+        draw.rectangle((24, 96, 200, 120), fill="white")
+    raster = root / "REVIEW/VISUAL/RASTERS_200_DPI/parentGuide/guide-1.png"
+    raster.parent.mkdir(parents=True, exist_ok=True)
+    image.save(raster)
+    evidence = [{
+        "PDF_FILE": "guide.pdf",
+        "PAGE": 1,
+        "IMAGE_PATH": raster.relative_to(root / "REVIEW/VISUAL").as_posix(),
+        # Distinct per build, so the rasters are decoded and compared rather than skipped.
+        "SHA256": hashlib.sha256(raster.read_bytes() + pdf).hexdigest(),
+    }]
+    (root / "REVIEW/VISUAL/visual-qa-report.json").write_text(json.dumps({"PAGE_EVIDENCE": evidence}), encoding="utf-8")
+    return root
+
+
+def test_visual_mode_accepts_pdf_drift_without_visible_change(tmp_path: Path):
+    first = _rasterized_build(tmp_path / "first", b"first")
+    second = _rasterized_build(tmp_path / "second", b"second")
+
+    report = compare_public_builds_visually(first, second, tmp_path / "diff")
+
+    assert report["REPRODUCIBLE_PUBLIC_BUILD"] is False
+    assert report["VISUALLY_REPRODUCIBLE_PUBLIC_BUILD"] is True
+    assert report["VISUALLY_EQUIVALENT_PDF_COUNT"] == 1
+    assert report["VISUAL_DIFF"]["WITHIN_TOLERANCE_PAGE_COUNT"] == 1
+
+
+def test_visual_mode_fails_when_a_page_visibly_moved(tmp_path: Path):
+    first = _rasterized_build(tmp_path / "first", b"first")
+    second = _rasterized_build(tmp_path / "second", b"second", erase=True)
+
+    with pytest.raises(ValueError, match="not visually reproducible"):
+        compare_public_builds_visually(first, second, tmp_path / "diff")
+    report = json.loads((tmp_path / "diff/visual-diff-report.json").read_text(encoding="utf-8"))
+    assert report["CHANGED_PAGE_COUNT"] == 1
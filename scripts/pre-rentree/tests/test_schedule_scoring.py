@@ -0,0 +1,238 @@
+"""The schedule solvers score candidates through scoring.ScoringEngine lookup
+tables instead of calling compute_itinerary() per combination. These tests pin
+the tables to the reference engine: any divergence would silently change which
+schedule the solvers prove optimal.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SOLVER_DIR = REPO_ROOT / "assets" / "campaigns" / "pre-rentree-2026" / "schedule-optimization"
+PDF_GENERATOR_DIR = REPO_ROOT / "tools" / "pdf-generator"
+for directory in (SOLVER_DIR, PDF_GENERATOR_DIR):
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
+
+import scenario_solver  # noqa: E402
+import solver  # noqa: E402
+import solver_campaign  # noqa: E402
+import solver_s5  # noqa: E402
+from itinerary import assign_itinerary, compute_itinerary  # noqa: E402
+from pre_rentree_data import ScheduledSlot  # noqa: E402
+from scenario_model import load_model, model_from_dict  # noqa: E402
+from scoring import ScoringEngine  # noqa: E402
+
+S5_MODEL = load_model(SOLVER_DIR / "scenario-s5-terminale.model.json")
+
+TIMES = {"A": ("09:00", "11:00"), "B": ("11:15", "13:15"), "C": ("14:15", "16:15"), "D": ("16:30", "18:30")}
+
+
+def _sessions(blocks):
+    return [
+        ScheduledSlot(
+            level="TERMINALE", subject=f"S{i}", block=block, room="salle-1", window_id="w", window_label="w",
+            start_time=TIMES[block][0], end_time=TIMES[block][1], date="2026-08-24",
+        )
+        for i, block in enumerate(blocks)
+    ]
+
+
+def test_engine_matches_compute_itinerary_on_every_block_multiset():
+    engine = ScoringEngine(TIMES)
+    for size in range(1, 5):
+        for blocks in itertools.combinations_with_replacement("ABCD", size):
+            sessions = _sessions(blocks)
+            report = compute_itinerary("TERMINALE", [s.subject for s in sessions], sessions)
+            outcome = engine.outcome_for_blocks(blocks)
+            assert (outcome.status, outcome.max_idle_minutes, outcome.total_idle_minutes) == (
+                report.status, report.max_idle_minutes, report.total_idle_minutes,
+            ), blocks
+
+
+def test_engine_pair_tables_follow_block_gaps():
+    engine = ScoringEngine(TIMES)
+    a, b, c = (engine.block_index[x] for x in "ABC")
+    assert engine.pair_gaps[a][b] == 15
+    assert engine.pair_gaps[c][a] == 195
+    assert engine.simultaneous_pairs[b][b] is True
+    assert engine.simultaneous_pairs[a][c] is False
+    assert engine.pair_outcomes[a][c].status == "LONG_IDLE"
+
+
+def test_s1_pair_scoring_matches_compute_itinerary():
+    campaign = solver.load_campaign()
+    entries = solver.window_entries(campaign, "fenetre-2")
+    times = solver.block_times(campaign)
+    for blocks in itertools.product("ABCD", repeat=len(entries)):
+        assignment = {entry: (block, "salle-1") for entry, block in zip(entries, blocks)}
+        sessions = solver.build_sessions(entries, assignment, times)
+        _, details = solver.score_assignment(entries, assignment, times)
+        for level, pair, status, idle in details:
+            report = compute_itinerary(level, pair, sessions)
+            assert (status, idle) == (report.status, report.max_idle_minutes), (blocks, pair)
+
+
+def test_s5_combo_scoring_matches_compute_itinerary():
+    engine = scenario_solver.engine_for(S5_MODEL)
+    entries = S5_MODEL.entries((("TERMINALE", "NSI"), ("TERMINALE", "SVT")))
+    plan = scenario_solver.combo_plan(S5_MODEL, entries)
+    assignments = scenario_solver.enumerate_assignments(S5_MODEL, entries)
+    for assignment, _ in itertools.islice(assignments, 0, 20000, 97):
+        sessions = scenario_solver.sessions_from_assignment(S5_MODEL, entries, assignment)
+        bits = [engine.block_bit[assignment[e][0]] for e in entries]
+        _, combo_results = scenario_solver.score_blocks(engine, plan, bits)
+        for result in combo_results:
+            combo = result["combo"]
+            cohorts = [[e for e in entries if e.subject == subject] for subject in combo]
+            reports = [
+                compute_itinerary("TERMINALE", combo, [sessions[e] for e in pick])
+                for pick in itertools.product(*cohorts)
+            ]
+            best = min(
+                reports,
+                key=lambda r: (r.status == "SIMULTANEOUS", r.status == "LONG_IDLE", r.max_idle_minutes),
+            )
+            assert (result["status"], result["maxIdleMinutes"]) == (best.status, best.max_idle_minutes)
+
+
+def _without_search_counters(result: dict) -> dict:
+    counters = {"candidatesChecked", "search", "nodesExplored", "subtreesPruned"}
+    return {key: value for key, value in result.items() if key not in counters}
+
+
+def test_s1_branch_and_bound_keeps_the_exhaustive_optimum():
+    # The live fenêtre 1 holds a second Première SVT cohort (identical Entry
+    # values the dict-keyed exhaustive loop cannot tell apart), so the window
+    # is rebuilt from its distinct entries, as the original S1 search saw it.
+    campaign = solver.load_campaign()
+    fenetre_1 = next(w for w in campaign["schedule"] if w["windowId"] == "fenetre-1")
+    slots = [s for s in fenetre_1["slots"] if s["level"] != "QUATRIEME" and s.get("isPrimary", True)]
+    window = {**fenetre_1, "windowId": "s1-fenetre-1", "slots": slots}
+    campaign = {**campaign, "schedule": [window]}
+
+    exhaustive = solver.solve_window(campaign, "s1-fenetre-1")
+    pruned = solver.solve_window(campaign, "s1-fenetre-1", search="branch-and-bound")
+
+    assert pruned["search"] == "branch-and-bound"
+    assert pruned["candidatesChecked"] < exhaustive["candidatesChecked"]
+    assert _without_search_counters(pruned) == _without_search_counters(exhaustive)
+
+
+@pytest.mark.parametrize("duplicated", [(), ("SVT",), ("NSI", "SVT")])
+def test_s5_branch_and_bound_keeps_the_exhaustive_optimum_and_rooms(duplicated):
+    exhaustive = solver_s5.solve_for_duplicated_subset(duplicated)
+    pruned = solver_s5.solve_for_duplicated_subset(duplicated, search="branch-and-bound")
+
+    assert pruned["candidatesChecked"] < exhaustive["candidatesChecked"]
+    assert _without_search_counters(pruned) == _without_search_counters(exhaustive)
+
+
+def test_s5_parallel_chunks_merge_to_the_serial_output():
+    subsets = [(), (("TERMINALE", "SVT"),)]
+    serial = [scenario_solver.solve_subset(S5_MODEL, subset) for subset in subsets]
+    parallel = scenario_solver.solve_subsets(S5_MODEL, subsets, "exhaustive", jobs=2)
+
+    assert parallel == serial
+    assert [r["assignment"] for r in parallel] == [r["assignment"] for r in serial]
+
+
+def test_scenario_model_rejects_combos_on_unscheduled_subjects():
+    raw = json.loads((SOLVER_DIR / "scenario-s5-premiere.model.json").read_text(encoding="utf-8"))
+    raw["requiredCombos"].append({"level": "PREMIERE", "subjects": ["MATHEMATIQUES", "PHILOSOPHIE"]})
+
+    with pytest.raises(ValueError, match="PREMIERE/PHILOSOPHIE"):
+        model_from_dict(raw)
+
+
+def test_premiere_model_proves_one_extra_svt_cohort_is_enough():
+    model = load_model(SOLVER_DIR / "scenario-s5-premiere.model.json")
+    report = scenario_solver.build_report(model, scenario_solver.sweep(model, "branch-and-bound"))
+
+    assert report["provenMinimumAdditionalCohorts"] == 1
+    assert report["compliantSubsetsAtMinimum"] == [[{"level": "PREMIERE", "subject": "SVT"}]]
+
+
+def _reference_score(problem, block_of, combos):
+    rooms_of = {i: problem.entries[i].room for i in block_of}
+    sessions = solver_campaign.dated_sessions(problem, block_of, rooms_of)
+    simultaneous = long_idle = idle = 0
+    for level, subjects, _ in combos:
+        report = assign_itinerary(level, subjects, sessions).itinerary
+        simultaneous += report.status == "SIMULTANEOUS"
+        if report.status == "LONG_IDLE":
+            long_idle += 1
+            idle += report.max_idle_minutes
+    return (simultaneous, long_idle, idle)
+
+
+def test_campaign_incremental_score_matches_assign_itinerary_on_dated_sessions():
+    problem = solver_campaign.CampaignProblem(solver.load_campaign(), max_combo_size=3)
+    windows = next(c for c in problem.components if "fenetre-2" in c)
+    indices = [i for i, e in enumerate(problem.entries) if e.window_id in windows]
+    combos = [
+        combo for combo in problem.combos
+        if any(sum(1 for i in pick if problem.entries[i].window_id in windows) >= 2 for pick in combo[2])
+    ]
+    state = solver_campaign.IncrementalScore(problem, indices, combos)
+    rng = random.Random(2026)
+    for _ in range(150):
+        bits = {i: rng.randrange(len(problem.blocks)) for i in indices}
+        for i in indices:
+            state.place(i, bits[i])
+        block_of = {i: problem.blocks[b] for i, b in bits.items()}
+        block_of.update({i: e.block for i, e in enumerate(problem.entries) if i not in block_of})
+        assert state.score == _reference_score(problem, block_of, combos), bits
+        for i in reversed(indices):
+            state.remove(i, bits[i])
+        assert state.score == (0, 0, 0)
+
+
+def test_campaign_components_follow_chained_combo_merges():
+    windows = ("A", "B", "C", "D", "E")
+    entries = [SimpleNamespace(window_id=w) for w in "AABBCCDDABAC"]
+    # Each combo only joins windows once the next one has: A+B, then AB+C,
+    # then ABC+D take three passes in this order. E shares no combo.
+    problem = SimpleNamespace(
+        window_days={w: (f"2026-08-2{n}",) for n, w in enumerate(windows)},
+        date_classes=[solver_campaign.DateClass((f"2026-08-2{n}",), frozenset({w}), ()) for n, w in enumerate(windows)],
+        entries=entries,
+        combos=[
+            ("TERMINALE", ("S1", "S2"), ((10, 11, 6, 7),)),  # A, C, D, D
+            ("TERMINALE", ("S1", "S3"), ((8, 9, 4, 5),)),  # A, B, C, C
+            ("TERMINALE", ("S2", "S3"), ((0, 1, 2, 3),)),  # A, A, B, B
+        ],
+    )
+
+    assert solver_campaign.CampaignProblem._components(problem) == [("A", "B", "C", "D"), ("E",)]
+
+
+def test_campaign_joint_solver_respects_shared_dates():
+    result = solver_campaign.solve_campaign(solver.load_campaign())
+    by_date_block = {}
+    days = {w["windowId"]: w["days"] for w in solver.load_campaign()["schedule"]}
+    for slot in result["assignment"]:
+        for day in days[slot["windowId"]]:
+            for key in ((day, slot["block"], slot["teacherRole"]), (day, slot["block"], slot["room"])):
+                assert key not in by_date_block, (slot, by_date_block.get(key))
+                by_date_block[key] = slot
+
+    combos = result["comboResults"]
+    assert result["totalScore"] == {
+        "simultaneousCombos": sum(c["status"] == "SIMULTANEOUS" for c in combos),
+        "longIdleCombos": sum(c["status"] == "LONG_IDLE" for c in combos),
+        "totalIdleMinutes": sum(c["maxIdleMinutes"] for c in combos if c["status"] == "LONG_IDLE"),
+    }
+    for component in result["components"]:
+        best, baseline = (
+            tuple(component[key].values()) if component[key] else None for key in ("bestScore", "baselineScore")
+        )
+        assert baseline is None or best <= baseline
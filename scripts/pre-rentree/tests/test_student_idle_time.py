@@ -19,6 +19,7 @@ student ever attends.
 
 from __future__ import annotations
 
+import itertools
 import json
 import sys
 from pathlib import Path
@@ -32,11 +33,13 @@ if str(PDF_GENERATOR_DIR) not in sys.path:
 
 from itinerary import (  # noqa: E402
     MAX_STUDENT_IDLE_MINUTES,
+    ItineraryIndex,
     assign_itinerary,
     compute_itinerary,
     enumerate_selections,
 )
-from pre_rentree_data import PreRentreeData  # noqa: E402
+from itinerary_batch import BatchItineraryEvaluator  # noqa: E402
+from pre_rentree_data import PreRentreeData, shared_data  # noqa: E402
 
 # Combinaisons de matières réellement souscrites cette session, lues depuis le
 # registre d'arbitrages du propriétaire — jamais recopiées ici. Le catalogue en
@@ -58,7 +61,7 @@ def _is_open(subjects) -> bool:
 
 @pytest.fixture(scope="module")
 def data() -> PreRentreeData:
-    return PreRentreeData(REPO_ROOT)
+    return shared_data(REPO_ROOT)
 
 
 @pytest.fixture(scope="module")
@@ -266,6 +269,79 @@ def test_enumerate_selections_no_duplicates_and_cap():
     assert all(len(s) <= 2 for s in capped)
 
 
+def test_itinerary_index_matches_brute_force_cohort_choice(data: PreRentreeData, all_sessions):
+    index = ItineraryIndex(all_sessions)
+    for level in ("TROISIEME", "SECONDE", "PREMIERE", "TERMINALE"):
+        level_sessions = [s for s in all_sessions if s.level == level]
+        for selection in enumerate_selections(data.subjects_for_level(level), 4):
+            cohorts = [
+                list({s.cohort_id: None for s in level_sessions if s.subject == subject}) for subject in selection
+            ]
+            reports = []
+            for choice in itertools.product(*cohorts):
+                chosen = [
+                    s for subject, cohort in zip(selection, choice)
+                    for s in level_sessions if s.subject == subject and s.cohort_id == cohort
+                ]
+                reports.append(compute_itinerary(level, selection, chosen))
+            best = min(
+                reports,
+                key=lambda r: (r.status == "SIMULTANEOUS", r.status == "LONG_IDLE", r.max_idle_minutes),
+            )
+            report = index.assign(level, selection).itinerary
+            assert (report.status, report.max_idle_minutes, report.days_present) == (
+                best.status, best.max_idle_minutes, best.days_present,
+            ), (level, selection)
+            assert index.assign(level, list(selection)) is index.assign(level, selection)
+
+
+def _choice_sessions(level_sessions, selection, choice):
+    return [
+        s for subject, cohort in zip(selection, choice)
+        for s in level_sessions if s.subject == subject and s.cohort_id == cohort
+    ]
+
+
+def test_batch_evaluator_matches_compute_itinerary(data: PreRentreeData, all_sessions):
+    evaluator = BatchItineraryEvaluator(all_sessions)
+    queries, expected = [], []
+    for level in ("TROISIEME", "SECONDE", "PREMIERE", "TERMINALE"):
+        level_sessions = [s for s in all_sessions if s.level == level]
+        for selection in enumerate_selections(data.subjects_for_level(level), 4):
+            cohorts = [
+                list({s.cohort_id: None for s in level_sessions if s.subject == subject}) for subject in selection
+            ]
+            for choice in itertools.product(*cohorts):
+                report = compute_itinerary(level, selection, _choice_sessions(level_sessions, selection, choice))
+                queries.append((level, selection, choice))
+                expected.append((report.status, report.max_idle_minutes, report.total_idle_minutes, report.days_present))
+
+    batch = evaluator.evaluate(queries)
+    actual = list(zip(batch.statuses, batch.max_idle_minutes, batch.total_idle_minutes, batch.days_present))
+    assert actual == expected
+
+
+def test_batch_evaluator_matches_compute_itinerary_on_synthetic_grids():
+    grids = [
+        _fixture([("X", "A"), ("Y", "B"), ("Z", "C")]),
+        _fixture([("X", "A"), ("Y", "A")]),
+        _fixture([("X", "C"), ("Y", "A"), ("Z", "A")]),
+    ]
+    for grid in grids:
+        subjects = [s.subject for s in grid]
+        evaluator = BatchItineraryEvaluator(grid)
+        selections = enumerate_selections(subjects, 3)
+        batch = evaluator.evaluate([("TERMINALE", selection, (None,) * len(selection)) for selection in selections])
+        for row, selection in enumerate(selections):
+            report = compute_itinerary("TERMINALE", selection, grid)
+            assert (batch.statuses[row], batch.max_idle_minutes[row], batch.total_idle_minutes[row]) == (
+                report.status, report.max_idle_minutes, report.total_idle_minutes,
+            ), selection
+
+    with pytest.raises(ValueError, match="Missing campaign schedule"):
+        BatchItineraryEvaluator(grids[0]).evaluate([("TERMINALE", ("X", "W"), (None, None))])
+
+
 def test_max_idle_constant():
     assert MAX_STUDENT_IDLE_MINUTES == 60
 
@@ -301,3 +377,45 @@ def test_baseline_schedule_has_no_room_or_teacher_conflict(data: PreRentreeData)
             assert teacher_key not in by_teacher_block, f"teacher conflict at {teacher_key}"
             by_room_block[room_key] = slot
             by_teacher_block[teacher_key] = slot
+
+
+def test_indexed_lookups_match_linear_scans(data: PreRentreeData):
+    levels = ("QUATRIEME", "TROISIEME", "SECONDE", "PREMIERE", "TERMINALE")
+    dated = [s for level in levels for s in data.dated_slots_for_level(level)]
+    for level in levels:
+        level_slots = data.dated_slots_for_level(level)
+        for subject in data.subjects_for_level(level):
+            assert data.dated_slots_for_subject(level, subject) == tuple(s for s in level_slots if s.subject == subject)
+        for cohort_id in {s.cohort_id for s in level_slots}:
+            assert data.dated_slots_for_cohort(level, cohort_id) == tuple(
+                s for s in level_slots if s.cohort_id == cohort_id
+            )
+    for date, block in {(s.date, s.block) for s in dated}:
+        assert sorted(data.dated_slots_at(date, block), key=repr) == sorted(
+            (s for s in dated if (s.date, s.block) == (date, block)), key=repr
+        )
+    assert data.subjects_for_level("INCONNU") == data.dated_slots_for_level("INCONNU") == ()
+
+
+def test_incompatibilities_are_indexed_once_for_every_level(tmp_path):
+    for relative in (
+        "data/campaigns/pre-rentree-2026.json",
+        "data/pricing.canonical.json",
+        "content/pre-rentree-2026/modules.json",
+        "content/pre-rentree-2026/publication-decisions.owner.json",
+    ):
+        (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative).write_bytes((REPO_ROOT / relative).read_bytes())
+    campaign_path = tmp_path / "data/campaigns/pre-rentree-2026.json"
+    campaign = json.loads(campaign_path.read_text(encoding="utf-8"))
+    fenetre_1 = next(w for w in campaign["schedule"] if w["windowId"] == "fenetre-1")
+    premiere = [s for s in fenetre_1["slots"] if s["level"] == "PREMIERE" and s.get("isPrimary", True)]
+    premiere[1]["block"] = premiere[0]["block"]
+    campaign_path.write_text(json.dumps(campaign), encoding="utf-8")
+
+    clashing = PreRentreeData(tmp_path)
+
+    pairs = clashing.incompatibilities_for_level("PREMIERE")
+    assert [(i.subject_a, i.subject_b) for i in pairs] == [tuple(sorted((premiere[0]["subject"], premiere[1]["subject"])))]
+    assert clashing.incompatibilities_for_level("TERMINALE") == ()
+
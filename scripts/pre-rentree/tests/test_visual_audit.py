@@ -1,15 +1,16 @@
 import shutil
 import sys
+import threading
 from pathlib import Path
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageDraw
 
 SCRIPT_DIR = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from document_assets import generate_qr, prepare_assets  # noqa: E402
-from document_audit import build_visual_qa  # noqa: E402
+from document_audit import _grayscale, _ink_geometries, _stream_rasters, analyze_pdf, build_visual_qa  # noqa: E402
 from document_model import load_snapshot  # noqa: E402
 from document_renderer import render_public_pdfs, write_public_html  # noqa: E402
 
@@ -58,3 +59,38 @@ def test_generates_200_dpi_page_checksums_and_contact_sheet(
     assert report["VISUAL_DEFECT_COUNT"] == 0
     assert report["ASSISTANT_VISUAL_REVIEW"] == "PENDING"
     assert report["OWNER_VISUAL_REVIEW"] == "PENDING"
+
+
+def test_streamed_rasters_cover_every_page_and_stop_when_abandoned(rendered_package: Path):
+    pdf_path = rendered_package / "PUBLIC" / SNAPSHOT["document"]["outputs"]["publicPdf"]["parentGuide"]
+    sizes = [image.size for image in _stream_rasters(pdf_path, 72)]
+    assert len(sizes) == analyze_pdf(pdf_path).page_count
+    assert all(abs(width - 595) <= 1 and abs(height - 842) <= 1 for width, height in sizes)
+
+    stream = _stream_rasters(pdf_path, 72, depth=1)
+    next(stream)
+    stream.close()
+    assert not any(thread.name == f"rasterize-{pdf_path.name}" for thread in threading.enumerate())
+
+
+def test_ink_geometry_batches_pages_and_keeps_report_fields():
+    page = Image.new("RGB", (800, 1000), "white")
+    draw = ImageDraw.Draw(page)
+    draw.rectangle((0, 0, 9, 9), fill="black")  # corner: counted by the top and left strips
+    draw.rectangle((100, 950, 199, 959), fill=(60, 60, 60))  # footer band starts at row 910
+    draw.rectangle((300, 300, 399, 399), fill=(240, 240, 240))  # too light to count as ink
+    blank = Image.new("RGB", (600, 400), "white")
+
+    inked, empty, again = _ink_geometries([_grayscale(page), _grayscale(blank), _grayscale(page)])
+
+    assert inked == again == {
+        "WIDTH": 800,
+        "HEIGHT": 1000,
+        "INK_BOUNDING_BOX": [0, 0, 200, 960],
+        "DARK_PIXEL_RATIO": 0.001375,
+        "FOOTER_INK_PIXEL_COUNT": 1000,
+        "EDGE_INK_PIXEL_COUNT": 40,
+        "BLANK_PAGE_SCORE": 0.998625,
+    }
+    assert empty["INK_BOUNDING_BOX"] is None
+    assert (empty["WIDTH"], empty["HEIGHT"], empty["DARK_PIXEL_RATIO"]) == (600, 400, 0.0)
@@ -0,0 +1,87 @@
+"""The visual diff must let through what nobody can see (a page nudged by a
+pixel, identical rasters) and flag, locate and rank what moved."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from visual_diff import compare_visual_builds, difference_pyramid, tolerant_difference  # noqa: E402
+
+
+def _page(erase: tuple[int, int, int, int] | None = None, shift: int = 0) -> Image.Image:
+    image = Image.new("L", (480, 640), 255)
+    draw = ImageDraw.Draw(image)
+    for line in range(24):
+        draw.text((40 + shift, 40 + line * 22), f"Ligne {line:02d} — stage de pré-rentrée, 120 €", fill=0)
+    if erase:
+        draw.rectangle(erase, fill=255)
+    return image.convert("RGB")
+
+
+def _visual_tree(root: Path, pages: dict[tuple[str, int], Image.Image]) -> Path:
+    evidence = []
+    for (key, number), image in pages.items():
+        relative = f"RASTERS_200_DPI/{key}/{key}-{number}.png"
+        (root / relative).parent.mkdir(parents=True, exist_ok=True)
+        image.save(root / relative)
+        evidence.append({
+            "PDF_FILE": f"{key}.pdf",
+            "PAGE": number,
+            "IMAGE_PATH": relative,
+            "SHA256": hashlib.sha256((root / relative).read_bytes()).hexdigest(),
+        })
+    (root / "visual-qa-report.json").write_text(json.dumps({"PAGE_EVIDENCE": evidence}), encoding="utf-8")
+    return root
+
+
+def test_one_pixel_shift_is_tolerated_and_erased_text_is_not():
+    page = np.asarray(_page().convert("L"))
+    shifted = np.asarray(_page(shift=1).convert("L"))
+    erased = np.asarray(_page(erase=(40, 150, 200, 170)).convert("L"))
+
+    assert not tolerant_difference(page, shifted).any()
+    pyramid = difference_pyramid(page, erased)
+    assert [grid.shape for grid in pyramid] == [(40, 30), (20, 15), (10, 8), (5, 4)]
+    assert pyramid[0].max() > 10
+    with pytest.raises(ValueError, match="different sizes"):
+        tolerant_difference(page, page[:-1])
+
+
+def test_compare_builds_reports_only_moved_pages_with_heatmaps(tmp_path):
+    previous = _visual_tree(tmp_path / "previous", {
+        ("guide", 1): _page(),
+        ("guide", 2): _page(),
+        ("guide", 3): _page(),
+        ("tarifs", 1): _page(),
+    })
+    current = _visual_tree(tmp_path / "current", {
+        ("guide", 1): _page(),
+        ("guide", 2): _page(shift=1),
+        ("guide", 3): _page(erase=(40, 150, 200, 170)),
+        ("guide", 4): _page(),
+    })
+
+    report = compare_visual_builds(previous, current, tmp_path / "diff")
+    pages = {(page["DOCUMENT"], page["PAGE"]): page for page in report["PAGES"]}
+
+    assert [pages[key]["STATUS"] for key in sorted(pages)] == [
+        "IDENTICAL", "WITHIN_TOLERANCE", "CHANGED", "ADDED", "REMOVED",
+    ]
+    assert report["MOVED_PAGE_COUNT"] == 3
+    assert [(page["DOCUMENT"], page["PAGE"]) for page in report["PAGES_TO_REVIEW"]][-1] == ("guide", 3)
+    changed = pages[("guide", 3)]
+    left, top, right, bottom = changed["REGIONS"][0]["BOX"]
+    assert left <= 40 and top <= 150 and right >= 200 and bottom >= 170
+    assert (tmp_path / "diff" / changed["HEATMAP"]).is_file()
+    assert "HEATMAP" not in pages[("guide", 2)]
+    assert json.loads((tmp_path / "diff/visual-diff-report.json").read_text(encoding="utf-8")) == report
@@ -4,13 +4,19 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import re
 import subprocess
+import sys
 from pathlib import Path
 
 import fitz
+from pypdf import PdfReader
+
+from file_digests import sha256
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools" / "pdf-generator"))
+from pdf_fonts import font_inventory  # noqa: E402
 
 
 EXPECTED_PUBLIC_FILES = {
@@ -38,10 +44,6 @@ FORBIDDEN_PUBLIC_COPY = (
 )
 
 
-def sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
 def require(condition: bool, message: str) -> None:
     if not condition:
         raise RuntimeError(message)
@@ -60,7 +62,6 @@ def verify_pdf(path: Path, rooms_public: bool) -> dict:
 
     text_parts: list[str] = []
     links: set[str] = set()
-    embedded_font_count = 0
     with fitz.open(path) as document:
         require(document.page_count > 0, f"{path.name}: empty document")
         for page in document:
@@ -78,14 +79,8 @@ def verify_pdf(path: Path, rooms_public: bool) -> dict:
                 uri = link.get("uri")
                 if uri:
                     links.add(uri)
-            for font in page.get_fonts(full=True):
-                xref = font[0]
-                if not xref:
-                    continue
-                extracted = document.extract_font(xref)
-                if extracted and extracted[-1]:
-                    embedded_font_count += 1
 
+    embedded_font_count = sum(font.embedded for font in font_inventory(PdfReader(str(path))))
     require(embedded_font_count > 0, f"{path.name}: no embedded font")
     for scheme in ("tel:", "mailto:", "https:"):
         require(any(link.startswith(scheme) for link in links), f"{path.name}: missing {scheme} link")
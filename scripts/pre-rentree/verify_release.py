@@ -14,6 +14,8 @@ from typing import Any
 
 from jsonschema import Draft202012Validator, FormatChecker
 
+from file_digests import sha256, sha256_many
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REVIEW_SCHEMA = SCRIPT_DIR / "schemas/review-manifest.schema.json"
@@ -42,10 +44,6 @@ PRIVATE_KEY_MARKER = b"".join((
 ))
 
 
-def _sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
 def _json(path: Path) -> dict[str, Any]:
     value = json.loads(path.read_text(encoding="utf-8"))
     if not isinstance(value, dict):
@@ -118,15 +116,17 @@ def build_review_manifest(artifact_root: Path, repo_root: Path) -> dict[str, Any
         "REVIEW/AUDIT/owner-approval.template.json",
         "REVIEW/AUDIT/owner-approval.json",
     }
+    paths = [
+        path for path in _safe_artifact_files(artifact_root)
+        if path.relative_to(artifact_root).as_posix() not in excluded
+    ]
     artifacts = []
-    for path in _safe_artifact_files(artifact_root):
+    for path, digest in zip(paths, sha256_many(paths)):
         relative = path.relative_to(artifact_root).as_posix()
-        if relative in excluded:
-            continue
         artifacts.append({
             "path": relative,
             "role": _role(relative),
-            "sha256": _sha256(path),
+            "sha256": digest,
             "fileSize": path.stat().st_size,
         })
     manifest = {
@@ -137,9 +137,9 @@ def build_review_manifest(artifact_root: Path, repo_root: Path) -> dict[str, Any
         "sourceAnchorSha": snapshot["sourceAnchorSha"],
         "repositoryCommitSha": snapshot["repositoryCommitSha"],
         "sourceSetSha256": snapshot["sourceSetSha256"],
-        "snapshotSha256": _sha256(snapshot_path),
-        "generatorSha256": _sha256(SCRIPT_DIR / "generate_documents.py"),
-        "approvalSchemaSha256": _sha256(APPROVAL_SCHEMA),
+        "snapshotSha256": sha256(snapshot_path),
+        "generatorSha256": sha256(SCRIPT_DIR / "generate_documents.py"),
+        "approvalSchemaSha256": sha256(APPROVAL_SCHEMA),
         "publicStatus": "PDF_PACKAGE_READY_FOR_OWNER_REVIEW",
         "privateStatus": "BLOCKED_BY_LEGAL_TERMS",
         "ownerReview": "PENDING",
@@ -4,9 +4,10 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
+import posixpath
 import subprocess
 from pathlib import Path
+from typing import NamedTuple
 
 
 FORBIDDEN_TRACKED_PREFIXES = (
@@ -14,71 +15,87 @@ FORBIDDEN_TRACKED_PREFIXES = (
     "artifacts/pre-rentree-2026/",
     "outputs-v5-canonical/",
 )
+PRIVATE_SCAN_PREFIXES = ("outputs-v5-canonical/", "artifacts/", ".artifacts/")
 CANONICAL_SOURCE_ROOT = Path("scripts/pre-rentree")
 SOURCE_SUFFIXES = {".py", ".ts", ".tsx", ".mjs", ".css"}
+REGULAR_FILE_MODES = {"100644", "100755"}
+SYMLINK_MODE = "120000"
 
 
-def _tracked_paths(repo_root: Path) -> list[Path]:
+class TrackedFile(NamedTuple):
+    path: str  # POSIX, relative to the repository root
+    mode: str
+    blob: str  # git object ID of the indexed content
+
+
+def _tracked_files(repo_root: Path) -> list[TrackedFile]:
+    """Every index entry, from one git ls-files -s call. Identical contents
+    share a blob ID, so duplicates are found without reading any file."""
     result = subprocess.run(
-        ["git", "ls-files", "-z"],
+        ["git", "ls-files", "-s", "-z"],
         cwd=repo_root,
         capture_output=True,
         check=True,
     )
-    return [Path(value.decode("utf-8")) for value in result.stdout.split(b"\0") if value]
-
-
-def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
-
-
-def verify(repo_root: Path) -> tuple[list[str], list[str]]:
-    root = repo_root.resolve()
-    tracked = _tracked_paths(root)
-    generated = [
-        path.as_posix()
-        for path in tracked
-        if any(path.as_posix().startswith(prefix) for prefix in FORBIDDEN_TRACKED_PREFIXES)
-    ]
-
-    canonical = [
-        path
-        for path in tracked
-        if path.is_relative_to(CANONICAL_SOURCE_ROOT)
-        and path.suffix in SOURCE_SUFFIXES
-        and (root / path).is_file()
-    ]
-    candidates_by_hash: dict[str, list[str]] = {}
-    for path in tracked:
-        if not (root / path).is_file():
+    tracked = []
+    for record in result.stdout.split(b"\0"):
+        if not record:
             continue
-        if path.suffix not in SOURCE_SUFFIXES:
+        meta, _, path = record.partition(b"\t")
+        mode, blob, _stage = meta.decode("ascii").split()
+        tracked.append(TrackedFile(path.decode("utf-8"), mode, blob))
+    return tracked
+
+
+def _scan(repo_root: Path, tracked: list[TrackedFile]) -> tuple[list[str], list[str], list[str]]:
+    """Tracked generated outputs, duplicate-source pairs and private
+    directories, in one pass over the index. A tracked symbolic link to a
+    tracked source counts as a copy of it, as when sources were hashed
+    through the working tree."""
+    canonical_prefix = f"{CANONICAL_SOURCE_ROOT.as_posix()}/"
+    generated = set()
+    private = set()
+    sources_by_blob: dict[str, set[str]] = {}
+    blobs: dict[str, str] = {}
+    links: list[str] = []
+    for entry in tracked:
+        if entry.path.startswith(FORBIDDEN_TRACKED_PREFIXES):
+            generated.add(entry.path)
+        if entry.path.startswith(PRIVATE_SCAN_PREFIXES) and "PRIVATE" in entry.path.upper().split("/"):
+            private.add(entry.path)
+        if posixpath.splitext(entry.path)[1] not in SOURCE_SUFFIXES:
             continue
-        candidates_by_hash.setdefault(_sha256(root / path), []).append(path.as_posix())
+        if entry.mode in REGULAR_FILE_MODES:
+            sources_by_blob.setdefault(entry.blob, set()).add(entry.path)
+            blobs[entry.path] = entry.blob
+        elif entry.mode == SYMLINK_MODE:
+            links.append(entry.path)
+    root = Path(repo_root).resolve()
+    for link in links:
+        target = (root / link).resolve()
+        blob = blobs.get(target.relative_to(root).as_posix()) if target.is_relative_to(root) else None
+        if blob is not None:
+            sources_by_blob[blob].add(link)
 
     duplicate_pairs: set[tuple[str, str]] = set()
-    for source in canonical:
-        for duplicate in candidates_by_hash.get(_sha256(root / source), []):
-            if duplicate == source.as_posix():
+    for paths in sources_by_blob.values():
+        if len(paths) < 2:
+            continue
+        for source in paths:
+            if not source.startswith(canonical_prefix):
                 continue
-            duplicate_pairs.add(tuple(sorted((source.as_posix(), duplicate))))
+            duplicate_pairs.update(tuple(sorted((source, duplicate))) for duplicate in paths if duplicate != source)
     duplicates = [f"{first} == {second}" for first, second in sorted(duplicate_pairs)]
-    return sorted(generated), duplicates
+    return sorted(generated), duplicates, sorted(private)
+
+
+def verify(repo_root: Path) -> tuple[list[str], list[str]]:
+    generated, duplicates, _ = _scan(repo_root, _tracked_files(repo_root.resolve()))
+    return generated, duplicates
 
 
 def audit_repository(repo_root: Path) -> dict[str, object]:
-    generated, duplicates = verify(repo_root)
-    tracked = _tracked_paths(repo_root.resolve())
-    private_directories = sorted(
-        path.as_posix()
-        for path in tracked
-        if any(part.upper() == "PRIVATE" for part in path.parts)
-        and path.as_posix().startswith(("outputs-v5-canonical/", "artifacts/", ".artifacts/"))
-    )
+    generated, duplicates, private_directories = _scan(repo_root, _tracked_files(repo_root.resolve()))
     return {
         "TRACKED_GENERATED_OUTPUT_COUNT": len(generated),
         "TRACKED_GENERATED_OUTPUTS": generated,
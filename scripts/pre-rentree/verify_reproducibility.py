@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import shutil
 import tempfile
@@ -12,28 +11,26 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from file_digests import sha256_many
 from generate_documents import build_package
-
-
-def _sha256(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+from visual_diff import DEFAULT_THRESHOLD, DIFF_REPORT, VISUALLY_EQUIVALENT, compare_visual_builds
 
 
 def _inventory(root: Path) -> dict[str, dict[str, int | str]]:
     public = Path(root).resolve() / "PUBLIC"
     if not public.is_dir():
         raise FileNotFoundError(f"Missing public artifact tree: {public}")
+    paths = sorted(path for path in public.rglob("*") if path.is_file())
     return {
         path.relative_to(public).as_posix(): {
-            "sha256": _sha256(path),
+            "sha256": digest,
             "fileSize": path.stat().st_size,
         }
-        for path in sorted(public.rglob("*"))
-        if path.is_file()
+        for path, digest in zip(paths, sha256_many(paths))
     }
 
 
-def compare_public_builds(first: Path, second: Path) -> dict[str, Any]:
+def _public_comparison(first: Path, second: Path) -> dict[str, Any]:
     first_inventory = _inventory(first)
     second_inventory = _inventory(second)
     names = sorted(set(first_inventory) | set(second_inventory))
@@ -46,7 +43,7 @@ def compare_public_builds(first: Path, second: Path) -> dict[str, Any]:
         for name in names
         if first_inventory.get(name) != second_inventory.get(name)
     ]
-    report = {
+    return {
         "SCOPE": "PUBLIC_FAMILY_ARTIFACTS",
         "REPRODUCIBLE_PUBLIC_BUILD": not mismatches,
         "COMPARED_FILE_COUNT": len(names),
@@ -57,8 +54,55 @@ def compare_public_builds(first: Path, second: Path) -> dict[str, Any]:
             for name in sorted(first_inventory)
         ],
     }
-    if mismatches:
-        raise ValueError(f"Public document build is not reproducible ({len(mismatches)} mismatches)")
+
+
+def compare_public_builds(first: Path, second: Path) -> dict[str, Any]:
+    report = _public_comparison(first, second)
+    if report["MISMATCHES"]:
+        raise ValueError(f"Public document build is not reproducible ({report['MISMATCH_COUNT']} mismatches)")
+    return report
+
+
+def compare_public_builds_visually(
+    first: Path,
+    second: Path,
+    diff_root: Path,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    jobs: int = 1,
+) -> dict[str, Any]:
+    """compare_public_builds() for two builds with visual QA: a PDF whose bytes
+    differ passes when every one of its pages is identical or within the
+    perceptual tolerance of visual_diff. Any other mismatch still fails."""
+    report = _public_comparison(first, second)
+    visual = compare_visual_builds(
+        Path(first) / "REVIEW/VISUAL",
+        Path(second) / "REVIEW/VISUAL",
+        diff_root,
+        threshold=threshold,
+        jobs=jobs,
+    )
+    moved = {page["PDF_FILE"] for page in visual["PAGES"] if page["STATUS"] not in VISUALLY_EQUIVALENT}
+    blocking = [
+        mismatch for mismatch in report["MISMATCHES"]
+        if not (
+            mismatch["path"].endswith(".pdf")
+            and mismatch["first"] is not None
+            and mismatch["second"] is not None
+            and mismatch["path"] not in moved
+        )
+    ]
+    report.update({
+        "VISUALLY_REPRODUCIBLE_PUBLIC_BUILD": not blocking,
+        "VISUALLY_EQUIVALENT_PDF_COUNT": report["MISMATCH_COUNT"] - len(blocking),
+        "BLOCKING_MISMATCH_COUNT": len(blocking),
+        "VISUAL_DIFF": {name: value for name, value in visual.items() if name != "PAGES"},
+    })
+    if blocking:
+        raise ValueError(
+            f"Public document build is not visually reproducible ({len(blocking)} mismatches); "
+            f"see {Path(diff_root) / DIFF_REPORT}"
+        )
     return report
 
 
@@ -66,15 +110,26 @@ def verify_reproducibility(
     snapshot: Path,
     reference: Path,
     output_report: Path,
+    *,
+    visual_diff: bool = False,
+    jobs: int = 1,
 ) -> dict[str, Any]:
+    """Rebuild without caches into a temporary tree and compare it with the
+    reference build. With visual_diff the rebuild includes visual QA and PDF
+    drift is judged page by page (heatmaps next to the report, in visual-diff/)."""
     reference = Path(reference).resolve()
     work_parent = reference.parent
+    destination = Path(output_report).resolve()
     candidate = Path(tempfile.mkdtemp(prefix=".reproducibility-build-", dir=work_parent))
     try:
-        build_package(snapshot, candidate, include_visual=False)
-        report = compare_public_builds(reference, candidate)
+        build_package(snapshot, candidate, include_visual=visual_diff, jobs=jobs)
+        if visual_diff:
+            report = compare_public_builds_visually(
+                reference, candidate, destination.parent / "visual-diff", jobs=jobs,
+            )
+        else:
+            report = compare_public_builds(reference, candidate)
         report["OBSERVED_AT"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
-        destination = Path(output_report).resolve()
         destination.parent.mkdir(parents=True, exist_ok=True)
         destination.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
         return report
@@ -87,8 +142,16 @@ def main() -> None:
     parser.add_argument("--snapshot", required=True, type=Path)
     parser.add_argument("--reference", required=True, type=Path)
     parser.add_argument("--output-report", required=True, type=Path)
+    parser.add_argument(
+        "--visual-diff",
+        action="store_true",
+        help="rebuild with visual QA and accept PDF byte drift that leaves every page visually unchanged",
+    )
+    parser.add_argument("--jobs", type=int, default=1)
     args = parser.parse_args()
-    result = verify_reproducibility(args.snapshot, args.reference, args.output_report)
+    result = verify_reproducibility(
+        args.snapshot, args.reference, args.output_report, visual_diff=args.visual_diff, jobs=args.jobs,
+    )
     print(json.dumps(result, ensure_ascii=False, sort_keys=True))
 
 
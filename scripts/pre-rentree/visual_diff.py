@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Perceptual page diff between two visual-QA builds.
+
+visual-qa-report.json records a SHA-256 per 200 DPI page raster, so exact
+comparison cannot tell a font-hinting nudge from a broken layout. Here each
+page raster of the current build is compared with the same page of the
+previous build. The per-pixel difference is shift tolerant: a pixel is
+compared with its best match within SHIFT_PX pixels, both ways, so content
+that moved by a pixel costs nothing. That difference map is averaged over
+tiles of TILE_PX, 2 * TILE_PX, 4 * TILE_PX ... pixels, a mean absolute
+difference pyramid. A tile changed when its mean exceeds the threshold (in
+grey levels) divided by its size ratio to the base tile: small tiles catch an
+edited glyph, large ones a faint but widespread change, and anti-aliasing
+noise stays under both. Changed pages get a heatmap and a ranked list of
+changed regions; reviewers open those pages instead of every contact sheet.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+VISUAL_REPORT = "visual-qa-report.json"
+DIFF_REPORT = "visual-diff-report.json"
+TILE_PX = 16
+LEVELS = 4
+SHIFT_PX = 1
+# Calibrated on the committed public PDFs at 200 DPI: halving MuPDF's
+# anti-aliasing reaches at most 0.75 of it, erasing one glyph about twice it.
+DEFAULT_THRESHOLD = 10.0
+HEATMAP_SCALE = 4  # heatmaps are drawn at a quarter of the raster resolution
+VISUALLY_EQUIVALENT = frozenset({"IDENTICAL", "WITHIN_TOLERANCE"})
+
+
+def _grayscale(path: Path) -> np.ndarray:
+    with Image.open(path) as image:
+        return np.asarray(image.convert("L"))
+
+
+def _nearest_difference(source: np.ndarray, target: np.ndarray, shift: int) -> np.ndarray:
+    """|source - target| with each source pixel matched to the closest target
+    pixel within `shift` pixels."""
+    height, width = source.shape
+    padded = np.pad(target, shift, mode="edge")
+    best = None
+    for dy in range(2 * shift + 1):
+        for dx in range(2 * shift + 1):
+            difference = np.abs(source - padded[dy:dy + height, dx:dx + width])
+            best = difference if best is None else np.minimum(best, difference)
+    return best
+
+
+def tolerant_difference(previous: np.ndarray, current: np.ndarray, shift: int = SHIFT_PX) -> np.ndarray:
+    """Per-pixel difference of two same-size grayscale pages that ignores
+    displacements of up to `shift` pixels. Both directions are measured, so a
+    thin stroke that appears is caught as surely as one that disappears."""
+    if previous.shape != current.shape:
+        raise ValueError(f"Cannot diff pages of different sizes: {previous.shape} != {current.shape}")
+    previous = previous.astype(np.int16)
+    current = current.astype(np.int16)
+    return np.maximum(
+        _nearest_difference(previous, current, shift),
+        _nearest_difference(current, previous, shift),
+    ).astype(np.float32)
+
+
+def _tile_means(values: np.ndarray, tile: int) -> np.ndarray:
+    """Mean of each tile x tile block; edge tiles average over the pixels they have."""
+    height, width = values.shape
+    rows, columns = -(-height // tile), -(-width // tile)
+    padded = np.zeros((rows * tile, columns * tile), dtype=np.float32)
+    padded[:height, :width] = values
+    sums = padded.reshape(rows, tile, columns, tile).sum(axis=(1, 3))
+    row_pixels = np.minimum(tile, height - np.arange(rows) * tile)
+    column_pixels = np.minimum(tile, width - np.arange(columns) * tile)
+    return sums / np.outer(row_pixels, column_pixels)
+
+
+def difference_pyramid(previous: np.ndarray, current: np.ndarray, levels: int = LEVELS) -> list[np.ndarray]:
+    """Tile means of the tolerant difference; level n tiles are TILE_PX * 2**n pixels."""
+    difference = tolerant_difference(previous, current)
+    return [_tile_means(difference, TILE_PX * 2 ** level) for level in range(levels)]
+
+
+def change_scores(pyramid: list[np.ndarray], threshold: float) -> np.ndarray:
+    """Base-tile grid of the strongest level score covering each tile, where a
+    level score is the tile mean over that level's threshold: above 1 is a change."""
+    base = pyramid[0]
+    scores = np.zeros_like(base)
+    for level, grid in enumerate(pyramid):
+        factor = 2 ** level
+        level_scores = grid * factor / threshold
+        expanded = np.repeat(np.repeat(level_scores, factor, axis=0), factor, axis=1)
+        scores = np.maximum(scores, expanded[:base.shape[0], :base.shape[1]])
+    return scores
+
+
+def _changed_regions(scores: np.ndarray, size: tuple[int, int]) -> list[dict[str, Any]]:
+    """8-connected groups of changed base tiles, as page-pixel boxes (right and
+    bottom exclusive), strongest first."""
+    width, height = size
+    changed = scores > 1.0
+    seen = np.zeros_like(changed)
+    regions = []
+    for start in zip(*np.nonzero(changed)):
+        if seen[start]:
+            continue
+        seen[start] = True
+        tiles, stack = [], [start]
+        while stack:
+            row, column = stack.pop()
+            tiles.append((row, column))
+            for neighbour in ((row + dr, column + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)):
+                if (
+                    0 <= neighbour[0] < scores.shape[0] and 0 <= neighbour[1] < scores.shape[1]
+                    and changed[neighbour] and not seen[neighbour]
+                ):
+                    seen[neighbour] = True
+                    stack.append(neighbour)
+        rows = [int(row) for row, _ in tiles]
+        columns = [int(column) for _, column in tiles]
+        regions.append({
+            "BOX": [
+                min(columns) * TILE_PX,
+                min(rows) * TILE_PX,
+                min(width, (max(columns) + 1) * TILE_PX),
+                min(height, (max(rows) + 1) * TILE_PX),
+            ],
+            "SCORE": round(max(float(scores[tile]) for tile in tiles), 3),
+            "TILE_COUNT": len(tiles),
+        })
+    regions.sort(key=lambda region: (-region["SCORE"], -region["TILE_COUNT"], region["BOX"]))
+    return regions
+
+
+def _write_heatmap(current: np.ndarray, scores: np.ndarray, destination: Path) -> None:
+    """The current page, faded and reduced, with changed tiles tinted red by score."""
+    height, width = current.shape[0] // HEATMAP_SCALE, current.shape[1] // HEATMAP_SCALE
+    base = current[:height * HEATMAP_SCALE, :width * HEATMAP_SCALE].reshape(
+        height, HEATMAP_SCALE, width, HEATMAP_SCALE,
+    ).mean(axis=(1, 3), dtype=np.float32)
+    alpha = np.where(scores > 1.0, np.clip(scores / 4.0, 0.3, 0.8), 0.0).astype(np.float32)
+    tile = TILE_PX // HEATMAP_SCALE
+    alpha = np.kron(alpha, np.ones((tile, tile), dtype=np.float32))[:height, :width]
+    faded = 128.0 + base / 2.0
+    red = faded * (1.0 - alpha) + 255.0 * alpha
+    other = faded * (1.0 - alpha)
+    image = np.dstack((red, other, other)).round().astype(np.uint8)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(image, "RGB").save(destination, format="PNG", optimize=False, compress_level=6)
+
+
+def diff_page(
+    previous_path: Path,
+    current_path: Path,
+    heatmap_path: Path,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> dict[str, Any]:
+    """Status, pyramid summary and ranked changed regions of one page; the
+    heatmap is only written for a CHANGED page."""
+    previous, current = _grayscale(previous_path), _grayscale(current_path)
+    height, width = current.shape
+    if previous.shape != current.shape:
+        return {
+            "STATUS": "RESIZED",
+            "SCORE": None,
+            "PREVIOUS_SIZE": [previous.shape[1], previous.shape[0]],
+            "REGIONS": [{"BOX": [0, 0, width, height], "SCORE": None, "TILE_COUNT": None}],
+        }
+    pyramid = difference_pyramid(previous, current)
+    scores = change_scores(pyramid, threshold)
+    regions = _changed_regions(scores, (width, height))
+    if regions:
+        _write_heatmap(current, scores, heatmap_path)
+    return {
+        "STATUS": "CHANGED" if regions else "WITHIN_TOLERANCE",
+        "SCORE": round(float(scores.max()), 3),
+        "PYRAMID": [
+            {
+                "TILE_PX": TILE_PX * 2 ** level,
+                "THRESHOLD": round(threshold / 2 ** level, 3),
+                "MAX_MAD": round(float(grid.max()), 3),
+                "MEAN_MAD": round(float(grid.mean()), 3),
+            }
+            for level, grid in enumerate(pyramid)
+        ],
+        "REGIONS": regions,
+    }
+
+
+def _page_evidence(visual_root: Path) -> dict[tuple[str, int], dict[str, Any]]:
+    report_path = visual_root / VISUAL_REPORT
+    if not report_path.is_file():
+        raise FileNotFoundError(f"Missing visual QA report: {report_path}")
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    # IMAGE_PATH is RASTERS_200_DPI/<document key>/<stem>-<page>.png.
+    return {(Path(page["IMAGE_PATH"]).parts[1], page["PAGE"]): page for page in report["PAGE_EVIDENCE"]}
+
+
+def compare_visual_builds(
+    previous_root: Path,
+    current_root: Path,
+    output_root: Path,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    jobs: int = 1,
+) -> dict[str, Any]:
+    """Diff every page raster of two REVIEW/VISUAL trees and write
+    visual-diff-report.json with heatmaps under output_root.
+
+    Pages with identical raster hashes are not decoded. PAGES_TO_REVIEW lists
+    the pages that moved (changed, resized, added or removed), worst first.
+    """
+    if threshold <= 0:
+        raise ValueError("Visual diff threshold must be positive")
+    previous_root = Path(previous_root).resolve()
+    current_root = Path(current_root).resolve()
+    output_root = Path(output_root).resolve()
+    previous = _page_evidence(previous_root)
+    current = _page_evidence(current_root)
+
+    def compare(key: tuple[str, int]) -> dict[str, Any]:
+        page = current.get(key) or previous[key]
+        record: dict[str, Any] = {"DOCUMENT": key[0], "PAGE": key[1], "PDF_FILE": page["PDF_FILE"]}
+        if key not in previous:
+            return {**record, "IMAGE_PATH": page["IMAGE_PATH"], "STATUS": "ADDED", "SCORE": None}
+        if key not in current:
+            return {**record, "IMAGE_PATH": None, "STATUS": "REMOVED", "SCORE": None}
+        record["IMAGE_PATH"] = page["IMAGE_PATH"]
+        if previous[key]["SHA256"] == page["SHA256"]:
+            return {**record, "STATUS": "IDENTICAL", "SCORE": 0.0}
+        heatmap = Path("heatmaps") / Path(page["IMAGE_PATH"]).relative_to("RASTERS_200_DPI")
+        result = diff_page(
+            previous_root / previous[key]["IMAGE_PATH"],
+            current_root / page["IMAGE_PATH"],
+            output_root / heatmap,
+            threshold,
+        )
+        if result["STATUS"] == "CHANGED":
+            result["HEATMAP"] = heatmap.as_posix()
+        return {**record, **result}
+
+    keys = [*current, *(key for key in previous if key not in current)]
+    output_root.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        pages = list(pool.map(compare, keys))
+
+    moved = [page for page in pages if page["STATUS"] not in VISUALLY_EQUIVALENT]
+    moved.sort(key=lambda page: -(page["SCORE"] if page["SCORE"] is not None else float("inf")))
+    counts = {status: sum(page["STATUS"] == status for page in pages) for status in (
+        "IDENTICAL", "WITHIN_TOLERANCE", "CHANGED", "RESIZED", "ADDED", "REMOVED",
+    )}
+    report = {
+        "DIFF_METHOD": "TILED_MEAN_ABSOLUTE_DIFFERENCE_PYRAMID",
+        "TILE_PX": TILE_PX,
+        "LEVELS": LEVELS,
+        "SHIFT_TOLERANCE_PX": SHIFT_PX,
+        "THRESHOLD": threshold,
+        "COMPARED_PAGE_COUNT": len(pages),
+        **{f"{status}_PAGE_COUNT": count for status, count in counts.items()},
+        "MOVED_PAGE_COUNT": len(moved),
+        "PAGES_TO_REVIEW": [
+            {name: page.get(name) for name in ("DOCUMENT", "PAGE", "STATUS", "SCORE", "IMAGE_PATH", "HEATMAP")}
+            for page in moved
+        ],
+        "PAGES": pages,
+    }
+    (output_root / DIFF_REPORT).write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--previous", required=True, type=Path, help="REVIEW/VISUAL of the previous build")
+    parser.add_argument("--current", required=True, type=Path, help="REVIEW/VISUAL of the current build")
+    parser.add_argument("--output", required=True, type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--jobs", type=int, default=1)
+    args = parser.parse_args()
+    report = compare_visual_builds(
+        args.previous, args.current, args.output, threshold=args.threshold, jobs=args.jobs,
+    )
+    summary = {name: value for name, value in report.items() if name != "PAGES"}
+    print(json.dumps(summary, ensure_ascii=False, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
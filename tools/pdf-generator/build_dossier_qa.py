@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Phase 8 visual QA for the 4 parent dossiers: structural checks (qpdf, fonts,
 links, overflow, blank pages) + a 200dpi contact sheet per dossier and a global
-one. Writes a JSON report next to the images. Read-only against the dossiers;
-does not regenerate them.
+one. The pages are rasterized in process (page_rasters) under pdftoppm's
+names. Writes a JSON report next to the images. Read-only against the
+dossiers; does not regenerate them.
 """
 from __future__ import annotations
 
@@ -11,7 +12,11 @@ import subprocess
 from pathlib import Path
 
 import fitz
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageFont
+from pypdf import PdfReader
+
+from page_rasters import PageRasterizer, SheetLayout, Thumbnail, contact_sheet
+from pdf_fonts import font_inventory, font_names
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 DOCUMENTS_FINAL = REPO_ROOT / "assets" / "campaigns" / "pre-rentree-2026" / "documents-final"
@@ -24,6 +29,15 @@ DOSSIER_FILES = [
     "NexusReussite_PreRentree2026_Programme_Premiere.pdf",
     "NexusReussite_PreRentree2026_Programme_Terminale.pdf",
 ]
+CONTACT_SHEET_LAYOUT = SheetLayout(
+    columns=4,
+    cell=(260, 370),
+    thumbnail=Thumbnail((240, 330)),
+    thumbnail_offset=(10, 8),
+    label_offset=(10, 346),
+    background="#F7F4ED",
+    label_fill="#071A3A",
+)
 
 
 def check_dossier(filename: str) -> dict:
@@ -39,7 +53,6 @@ def check_dossier(filename: str) -> dict:
         page_rect = document[0].rect
         overflow = 0
         blank_pages = []
-        fonts = set()
         links = []
         for page in document:
             for block in page.get_text("blocks"):
@@ -48,14 +61,13 @@ def check_dossier(filename: str) -> dict:
                     overflow += 1
             if len(page.get_text().strip()) < 80:
                 blank_pages.append(page.number + 1)
-            for font in page.get_fonts():
-                fonts.add(font[3])
             for link in page.get_links():
                 if link.get("uri"):
                     links.append(link["uri"])
         report["overflowBlocks"] = overflow
         report["nearBlankPages"] = blank_pages
-        report["fontsUsed"] = sorted(fonts)
+        fonts = font_names(font_inventory(PdfReader(str(path))))
+        report["fontsUsed"] = fonts
         report["hasFraunces"] = any("Fraunces" in f for f in fonts)
         report["hasDMSans"] = any("DM-Sans" in f or "DMSans" in f for f in fonts)
         report["hasDejaVuFallback"] = any("DejaVu" in f for f in fonts)
@@ -64,38 +76,32 @@ def check_dossier(filename: str) -> dict:
     return report
 
 
-def build_contact_sheet(filename: str) -> Path:
-    stem = Path(filename).stem
-    pages = sorted(QA_DIR.glob(f"{stem}-*.png"))
-    if not pages:
-        raise RuntimeError(f"No 200dpi renders found for {filename}; run pdftoppm first")
-    columns = 4
-    cell_width, cell_height = 260, 370
-    rows = (len(pages) + columns - 1) // columns
-    sheet = Image.new("RGB", (columns * cell_width, rows * cell_height), "#F7F4ED")
-    draw = ImageDraw.Draw(sheet)
-    font = ImageFont.load_default(size=13)
-    for index, page_path in enumerate(pages):
-        with Image.open(page_path) as img:
-            thumb = img.convert("RGB")
-            thumb.thumbnail((cell_width - 20, cell_height - 40), Image.Resampling.LANCZOS)
-            x = (index % columns) * cell_width
-            y = (index // columns) * cell_height
-            image_x = x + (cell_width - thumb.width) // 2
-            sheet.paste(thumb, (image_x, y + 8))
-            draw.text((x + 10, y + cell_height - 24), f"p.{index + 1}", fill="#071A3A", font=font)
-    out_path = QA_DIR / f"{stem}-contact-sheet.png"
+def build_contact_sheet(filename: str, rasterizer: PageRasterizer) -> Path:
+    pages = rasterizer.render(
+        DOCUMENTS_FINAL / filename,
+        QA_DIR,
+        zoom=200 / 72,
+        name="{stem}-{page:0{digits}d}.png",
+        thumbnail=CONTACT_SHEET_LAYOUT.thumbnail,
+    )
+    sheet = contact_sheet(
+        [(f"p.{page.page}", page.path, page.sha256) for page in pages],
+        CONTACT_SHEET_LAYOUT,
+        ImageFont.load_default(size=13),
+    )
+    out_path = QA_DIR / f"{Path(filename).stem}-contact-sheet.png"
     sheet.save(out_path, format="PNG", optimize=True)
     return out_path
 
 
 def main() -> None:
     reports = []
-    for filename in DOSSIER_FILES:
-        reports.append(check_dossier(filename))
-        contact_sheet = build_contact_sheet(filename)
-        print(f"  {filename}: qpdf={'OK' if reports[-1]['qpdfCheckPassed'] else 'FAIL'}, "
-              f"{reports[-1]['pageCount']} pages, contact sheet -> {contact_sheet.name}")
+    with PageRasterizer() as rasterizer:
+        for filename in DOSSIER_FILES:
+            reports.append(check_dossier(filename))
+            sheet_path = build_contact_sheet(filename, rasterizer)
+            print(f"  {filename}: qpdf={'OK' if reports[-1]['qpdfCheckPassed'] else 'FAIL'}, "
+                  f"{reports[-1]['pageCount']} pages, contact sheet -> {sheet_path.name}")
 
     report_path = QA_DIR / "qa-report.json"
     report_path.write_text(json.dumps({"dossiers": reports}, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
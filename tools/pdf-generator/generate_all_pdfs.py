@@ -24,12 +24,19 @@ scripts/pre-rentree/document_templates.py via generate_documents.py
 is an internal review package, never served publicly.
 """
 
+import argparse
 import hashlib
 import json
 import os
 from pathlib import Path
 from weasyprint import HTML
-from stable_assets import fetch_public_pdf_asset, public_pdf_asset_url
+from render_cache import RenderCache, referenced_asset_parts, render_key, source_digest, weasyprint_version
+from stable_assets import (
+    PUBLIC_PDF_ASSET_SCHEME,
+    fetch_public_pdf_asset,
+    public_pdf_asset_path,
+    public_pdf_asset_url,
+)
 
 TOOL_DIR = Path(__file__).parent
 REPO_ROOT = TOOL_DIR.parent.parent
@@ -387,8 +394,20 @@ def wrap_html(body, title, extra_css=""):
 </html>"""
 
 
-def generate_pdf(html_content, filename, title):
-    """Generate PDF with metadata."""
+def generate_pdf(html_content, filename, title, cache=None):
+    """Generate PDF with metadata; reuse the cached render when its inputs are unchanged."""
+    destination = OUT_DIR / filename
+    description = "Stages de pré-rentrée 2026"
+    identifier = hashlib.sha256(f"pre-rentree-2026:{filename}".encode()).digest()
+    if cache is not None:
+        key = render_key(
+            source_digest(Path(__file__)), weasyprint_version(), os.environ.get("SOURCE_DATE_EPOCH", ""),
+            html_content, title, description, identifier,
+            *referenced_asset_parts(html_content, PUBLIC_PDF_ASSET_SCHEME, public_pdf_asset_path),
+        )
+        if cache.fetch(key, destination):
+            print(f"  {filename}: {os.path.getsize(destination) // 1024} Ko (cache)")
+            return filename
     html = HTML(
         string=html_content,
         base_url="nexus-public-pdf:",
@@ -397,12 +416,11 @@ def generate_pdf(html_content, filename, title):
     doc = html.render()
     doc.metadata.title = title
     doc.metadata.authors = ["Nexus Réussite"]
-    doc.metadata.description = "Stages de pré-rentrée 2026"
-    doc.write_pdf(
-        str(OUT_DIR / filename),
-        pdf_identifier=hashlib.sha256(f"pre-rentree-2026:{filename}".encode()).digest(),
-    )
-    size = os.path.getsize(OUT_DIR / filename)
+    doc.metadata.description = description
+    doc.write_pdf(str(destination), pdf_identifier=identifier)
+    if cache is not None:
+        cache.store(key, destination)
+    size = os.path.getsize(destination)
     print(f"  {filename}: {size // 1024} Ko")
     return filename
 
@@ -914,6 +932,10 @@ tbody td { padding: 3px 4px; font-size: 8pt; }
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génère les PDF publics de la pré-rentrée 2026.")
+    parser.add_argument("--no-cache", action="store_true", help="re-render every PDF, ignoring the render cache")
+    args = parser.parse_args()
+    cache = None if args.no_cache else RenderCache()
     print("=== Production des PDF ===\n")
 
     # 0-3. Les 4 dossiers complets parents (un par niveau : 3e, Seconde, Première,
@@ -924,30 +946,30 @@ if __name__ == "__main__":
     # qu'un PDF séparé) sont dérivées de content/pre-rentree-2026/modules.json.
     import generate_level_dossiers
     generate_level_dossiers.configure_reproducible_pdf_environment()
-    generate_level_dossiers.generate_all_level_dossiers()
+    generate_level_dossiers.generate_all_level_dossiers(cache=cache)
 
     # 4. Planning
     body = make_planning_body()
     html = wrap_html(body, "Nexus Réussite — Planning et informations pratiques — Pré-rentrée 2026")
     generate_pdf(html, "NexusReussite_PreRentree2026_Planning_InfosPratiques.pdf",
-                 "Nexus Réussite — Planning et informations pratiques — Pré-rentrée 2026")
+                 "Nexus Réussite — Planning et informations pratiques — Pré-rentrée 2026", cache)
 
     # 5. Tarifs
     body = make_tarifs_body()
     html = wrap_html(body, "Nexus Réussite — Tarifs — Pré-rentrée 2026", TARIFS_CSS)
     generate_pdf(html, "NexusReussite_PreRentree2026_Tarifs.pdf",
-                 "Nexus Réussite — Tarifs et conditions financières — Pré-rentrée 2026")
+                 "Nexus Réussite — Tarifs et conditions financières — Pré-rentrée 2026", cache)
 
     # 7. Dossier Accueil PRINT
     body = make_dossier_accueil_body()
     html = wrap_html(body, "Nexus Réussite — Dossier d'accueil famille — Pré-rentrée 2026", DOSSIER_CSS)
     generate_pdf(html, "NexusReussite_PreRentree2026_DossierAccueil_PRINT.pdf",
-                 "Nexus Réussite — Dossier d'accueil famille — Pré-rentrée 2026")
+                 "Nexus Réussite — Dossier d'accueil famille — Pré-rentrée 2026", cache)
 
     # 8. Flyer essentiel
     body = make_flyer_body()
     html = wrap_html(body, "Nexus Réussite — Flyer essentiel — Pré-rentrée 2026")
     generate_pdf(html, "NexusReussite_PreRentree2026_FlyerEssentiel.pdf",
-                 "Nexus Réussite — Flyer essentiel — Pré-rentrée 2026")
+                 "Nexus Réussite — Flyer essentiel — Pré-rentrée 2026", cache)
 
     print("\n✓ Production terminée")
@@ -16,6 +16,7 @@ publicationStatus values and gap detection), never by a local flag.
 
 from __future__ import annotations
 
+import argparse
 import hashlib
 import os
 from pathlib import Path
@@ -37,8 +38,15 @@ from pre_rentree_data import (
     LevelDossierData,
     PreRentreeData,
     format_tnd,
+    shared_data,
+)
+from render_cache import RenderCache, referenced_asset_parts, render_key, source_digest, weasyprint_version
+from stable_assets import (
+    PUBLIC_PDF_ASSET_SCHEME,
+    fetch_public_pdf_asset,
+    public_pdf_asset_path,
+    public_pdf_asset_url,
 )
-from stable_assets import fetch_public_pdf_asset, public_pdf_asset_url
 
 TOOL_DIR = Path(__file__).parent
 REPO_ROOT = TOOL_DIR.parent.parent
@@ -454,36 +462,50 @@ def build_dossier_html(dossier: LevelDossierData, data: PreRentreeData) -> str:
 </html>"""
 
 
-def generate_dossier_pdf(dossier: LevelDossierData, data: PreRentreeData) -> str:
+def generate_dossier_pdf(dossier: LevelDossierData, data: PreRentreeData, cache: RenderCache | None = None) -> str:
     # Historic public filenames use "Premiere"/"3e" without the accent; keep them stable.
     filename_level = {
         "4e": "4e", "3e": "3e", "Seconde": "Seconde", "Première": "Premiere", "Terminale": "Terminale",
     }[dossier.level_label]
     filename = f"NexusReussite_PreRentree2026_Programme_{filename_level}.pdf"
+    destination = OUT_DIR / filename
 
     html_content = build_dossier_html(dossier, data)
+    title = f"Nexus Réussite — Dossier complet parents — Entrée en {dossier.level_label} — Pré-rentrée 2026"
+    description = f"Dossier complet parents — Stage de pré-rentrée 2026 — Entrée en {dossier.level_label}"
+    keywords = ["pré-rentrée 2026", "Nexus Réussite", dossier.level_label]
+    identifier = hashlib.sha256(f"pre-rentree-2026:{filename}".encode()).digest()
+    if cache is not None:
+        key = render_key(
+            source_digest(Path(__file__)), weasyprint_version(), os.environ.get("SOURCE_DATE_EPOCH", ""),
+            html_content, title, description, *keywords, identifier,
+            *referenced_asset_parts(html_content, PUBLIC_PDF_ASSET_SCHEME, public_pdf_asset_path),
+        )
+        if cache.fetch(key, destination):
+            print(f"  {filename}: {os.path.getsize(destination) // 1024} Ko (cache, {'PUBLIC' if dossier.is_public else 'REVIEW'})")
+            return filename
+
     document = HTML(
         string=html_content,
         base_url="nexus-public-pdf:",
         url_fetcher=fetch_public_pdf_asset,
     )
     doc = document.render()
-    doc.metadata.title = f"Nexus Réussite — Dossier complet parents — Entrée en {dossier.level_label} — Pré-rentrée 2026"
+    doc.metadata.title = title
     doc.metadata.authors = ["Nexus Réussite"]
-    doc.metadata.description = f"Dossier complet parents — Stage de pré-rentrée 2026 — Entrée en {dossier.level_label}"
-    doc.metadata.keywords = ["pré-rentrée 2026", "Nexus Réussite", dossier.level_label]
-    doc.write_pdf(
-        str(OUT_DIR / filename),
-        pdf_identifier=hashlib.sha256(f"pre-rentree-2026:{filename}".encode()).digest(),
-    )
-    size = os.path.getsize(OUT_DIR / filename)
+    doc.metadata.description = description
+    doc.metadata.keywords = keywords
+    doc.write_pdf(str(destination), pdf_identifier=identifier)
+    if cache is not None:
+        cache.store(key, destination)
+    size = os.path.getsize(destination)
     print(f"  {filename}: {size // 1024} Ko ({len(doc.pages)} pages, {'PUBLIC' if dossier.is_public else 'REVIEW'})")
     return filename
 
 
-def generate_all_level_dossiers(data: PreRentreeData = None) -> list:
+def generate_all_level_dossiers(data: PreRentreeData = None, cache: RenderCache | None = None) -> list:
     if data is None:
-        data = PreRentreeData()
+        data = shared_data()
     filenames = []
     for level in LEVEL_ORDER:
         dossier = data.level_dossier(level)
@@ -493,12 +515,15 @@ def generate_all_level_dossiers(data: PreRentreeData = None) -> list:
                 f"Gap detected for level {level}: subject(s) {gap_desc} have no matching pedagogical "
                 "module in modules.json. Refusing to generate a dossier with invented content."
             )
-        filenames.append(generate_dossier_pdf(dossier, data))
+        filenames.append(generate_dossier_pdf(dossier, data, cache))
     return filenames
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génère les dossiers complets parents par niveau.")
+    parser.add_argument("--no-cache", action="store_true", help="re-render every PDF, ignoring the render cache")
+    args = parser.parse_args()
     configure_reproducible_pdf_environment()
     print("=== Production des 4 dossiers complets parents ===\n")
-    generate_all_level_dossiers()
+    generate_all_level_dossiers(cache=None if args.no_cache else RenderCache())
     print("\n✓ Production terminée")
@@ -9,8 +9,9 @@ drift between the two.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Literal, Optional, Sequence
+import itertools
+from dataclasses import dataclass
+from typing import Literal, NamedTuple, Optional, Sequence
 
 from pre_rentree_data import ScheduledSlot
 
@@ -26,13 +27,7 @@ ItineraryStatus = Literal[
 ]
 
 
-def _to_minutes(time: str) -> int:
-    h, m = time.split(":")
-    return int(h) * 60 + int(m)
-
-
-@dataclass(frozen=True)
-class DayItinerary:
+class DayItinerary(NamedTuple):
     date: str
     sessions: tuple
     idle_gaps_minutes: tuple
@@ -40,8 +35,7 @@ class DayItinerary:
     simultaneous: bool
 
 
-@dataclass(frozen=True)
-class FirstConflict:
+class FirstConflict(NamedTuple):
     date: str
     subject_a: str
     subject_b: str
@@ -49,8 +43,7 @@ class FirstConflict:
     idle_minutes: Optional[int] = None
 
 
-@dataclass(frozen=True)
-class ItineraryReport:
+class ItineraryReport(NamedTuple):
     level: str
     subjects: tuple
     status: ItineraryStatus
@@ -71,7 +64,13 @@ def compute_itinerary(level: str, subjects: Sequence[str], all_sessions: Sequenc
     by_date: dict[str, list[ScheduledSlot]] = {}
     for session in relevant:
         by_date.setdefault(session.date, []).append(session)
+    return _itinerary_from_dates(level, subjects, by_date)
+
 
+def _itinerary_from_dates(level: str, subjects: tuple, by_date: dict) -> ItineraryReport:
+    """compute_itinerary() once the relevant sessions are grouped by date
+    (each date's list in input order — the stable sort below keeps it for
+    sessions starting at the same time)."""
     days: list[DayItinerary] = []
     first_conflict: Optional[FirstConflict] = None
     overall_max_idle = 0
@@ -81,7 +80,7 @@ def compute_itinerary(level: str, subjects: Sequence[str], all_sessions: Sequenc
     any_shared_day = False
 
     for date in sorted(by_date.keys()):
-        day_sessions = sorted(by_date[date], key=lambda s: _to_minutes(s.start_time))
+        day_sessions = sorted(by_date[date], key=lambda s: s.start_minutes)
         gaps: list[int] = []
         day_simultaneous = False
         day_max_idle = 0
@@ -92,7 +91,7 @@ def compute_itinerary(level: str, subjects: Sequence[str], all_sessions: Sequenc
         for i in range(len(day_sessions) - 1):
             current = day_sessions[i]
             nxt = day_sessions[i + 1]
-            gap = _to_minutes(nxt.start_time) - _to_minutes(current.end_time)
+            gap = nxt.start_minutes - current.end_minutes
             if gap < 0:
                 day_simultaneous = True
                 any_simultaneous = True
@@ -140,19 +139,84 @@ class AssignmentResult:
     itinerary: ItineraryReport
 
 
-def _cohort_groups(subject: str, sessions: Sequence[ScheduledSlot]) -> list[dict]:
-    by_subject = [s for s in sessions if s.subject == subject]
-    groups: dict[Optional[str], list[ScheduledSlot]] = {}
-    for session in by_subject:
-        groups.setdefault(session.cohort_id, []).append(session)
-    return [
-        {
-            "cohort_id": cohort_id,
-            "is_primary": sess[0].is_primary if sess[0].is_primary is not None else True,
-            "sessions": sess,
-        }
-        for cohort_id, sess in groups.items()
-    ]
+class ItineraryIndex:
+    """assign_itinerary() over a session list that is scanned only once.
+
+    Building the index groups every (level, subject) into its cohorts (by
+    cohort_id, in first-appearance order) and splits each cohort's sessions
+    by date. assign() then merges the chosen cohorts' per-date lists
+    directly instead of refiltering the whole grid for every cohort choice,
+    and memoizes each (level, subjects) result, so a full selection matrix
+    costs about one evaluation per selection. Results are shared between
+    calls: callers must not mutate them.
+    """
+
+    def __init__(self, all_sessions: Sequence[ScheduledSlot]):
+        groups: dict[tuple, dict[Optional[str], list[ScheduledSlot]]] = {}
+        for session in all_sessions:
+            groups.setdefault((session.level, session.subject), {}).setdefault(session.cohort_id, []).append(session)
+        self._options: dict[tuple, list[dict]] = {}
+        for key, cohorts in groups.items():
+            options = []
+            for cohort_id, sess in cohorts.items():
+                by_date: dict[str, list[ScheduledSlot]] = {}
+                for session in sess:
+                    by_date.setdefault(session.date, []).append(session)
+                options.append({
+                    "cohort_id": cohort_id,
+                    "is_primary": sess[0].is_primary if sess[0].is_primary is not None else True,
+                    "sessions": sess,
+                    "by_date": by_date,
+                })
+            self._options[key] = options
+        self._results: dict[tuple, AssignmentResult] = {}
+
+    def cohort_options(self, level: str, subject: str) -> list[dict]:
+        return self._options.get((level, subject), [])
+
+    def assign(self, level: str, subjects: Sequence[str]) -> AssignmentResult:
+        subjects = tuple(subjects)
+        key = (level, subjects)
+        if key not in self._results:
+            self._results[key] = self._assign(level, subjects)
+        return self._results[key]
+
+    def _assign(self, level: str, subjects: tuple) -> AssignmentResult:
+        options_per_subject = [self.cohort_options(level, subject) for subject in subjects]
+        for i, options in enumerate(options_per_subject):
+            if not options:
+                raise ValueError(f"Missing campaign schedule for {level}/{subjects[i]}")
+
+        best_report: Optional[ItineraryReport] = None
+        best_choice: Optional[tuple] = None
+        best_rank: Optional[tuple] = None
+
+        # The first subject's cohort varies fastest, as in the original
+        # combination-index decoding, so ties keep the same winner.
+        for reversed_choice in itertools.product(*reversed(options_per_subject)):
+            choice = reversed_choice[::-1]
+            by_date: dict[str, list[ScheduledSlot]] = {}
+            for cohort in choice:
+                for date, sessions in cohort["by_date"].items():
+                    by_date.setdefault(date, []).extend(sessions)
+            report = _itinerary_from_dates(level, subjects, by_date)
+            penalty = sum(1 for c in choice if not c["is_primary"])
+            candidate_rank = (
+                1 if report.status == "SIMULTANEOUS" else 0,
+                1 if report.status == "LONG_IDLE" else 0,
+                report.max_idle_minutes,
+                penalty,
+            )
+            if best_rank is None or candidate_rank < best_rank:
+                best_report, best_choice, best_rank = report, choice, candidate_rank
+
+        return AssignmentResult(
+            level=level,
+            subjects=subjects,
+            cohort_by_subject={subject: chosen["cohort_id"] for subject, chosen in zip(subjects, best_choice)},
+            sessions_by_subject={subject: tuple(chosen["sessions"]) for subject, chosen in zip(subjects, best_choice)},
+            itinerary=best_report,
+        )
 
 
 def assign_itinerary(level: str, subjects: Sequence[str], all_sessions: Sequence[ScheduledSlot]) -> AssignmentResult:
@@ -161,58 +225,9 @@ def assign_itinerary(level: str, subjects: Sequence[str], all_sessions: Sequence
     minimizes (in order) simultaneity, long idle time, total idle time, then
     prefers primary cohorts. Never combines two cohorts of the same subject
     into one itinerary: the caller always gets exactly 5 sessions per subject.
+    Scoring many selections over one grid: build an ItineraryIndex once.
     """
-    subjects = tuple(subjects)
-    level_sessions = [s for s in all_sessions if s.level == level]
-    options_per_subject = [_cohort_groups(subject, level_sessions) for subject in subjects]
-
-    for i, options in enumerate(options_per_subject):
-        if not options:
-            raise ValueError(f"Missing campaign schedule for {level}/{subjects[i]}")
-
-    def rank(report: ItineraryReport, penalty: int) -> tuple:
-        return (
-            1 if report.status == "SIMULTANEOUS" else 0,
-            1 if report.status == "LONG_IDLE" else 0,
-            report.max_idle_minutes,
-            penalty,
-        )
-
-    best_report: Optional[ItineraryReport] = None
-    best_choice: Optional[list[dict]] = None
-    best_rank: Optional[tuple] = None
-
-    total_combinations = 1
-    for options in options_per_subject:
-        total_combinations *= len(options)
-
-    for combo in range(total_combinations):
-        remainder = combo
-        choice = []
-        for options in options_per_subject:
-            idx = remainder % len(options)
-            remainder //= len(options)
-            choice.append(options[idx])
-        chosen_sessions = [s for c in choice for s in c["sessions"]]
-        report = compute_itinerary(level, subjects, chosen_sessions)
-        penalty = sum(1 for c in choice if not c["is_primary"])
-        candidate_rank = rank(report, penalty)
-        if best_rank is None or candidate_rank < best_rank:
-            best_report, best_choice, best_rank = report, choice, candidate_rank
-
-    cohort_by_subject = {}
-    sessions_by_subject = {}
-    for subject, chosen in zip(subjects, best_choice):
-        cohort_by_subject[subject] = chosen["cohort_id"]
-        sessions_by_subject[subject] = tuple(chosen["sessions"])
-
-    return AssignmentResult(
-        level=level,
-        subjects=subjects,
-        cohort_by_subject=cohort_by_subject,
-        sessions_by_subject=sessions_by_subject,
-        itinerary=best_report,
-    )
+    return ItineraryIndex([s for s in all_sessions if s.level == level]).assign(level, subjects)
 
 
 def enumerate_selections(subjects: Sequence[str], max_size: int) -> list[tuple]:
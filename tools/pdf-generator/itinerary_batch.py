@@ -0,0 +1,121 @@
+"""Vectorized batch companion to itinerary.compute_itinerary().
+
+compute_itinerary() builds one report per call; what-if sweeps need the
+status and idle figures of tens of thousands of (level, subjects, cohort
+choice) tuples at once. BatchItineraryEvaluator gathers every query's
+sessions into one padded NumPy array keyed by (date, start minute), sorts
+each row with a stable argsort — the order compute_itinerary() gets from its
+per-date stable sort — and derives gaps with np.diff-style shifted
+differences. Status, max idle, total idle and days present follow exactly the
+same rules as the scalar engine; first_conflict and per-day details are left
+to compute_itinerary().
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from itinerary import MAX_STUDENT_IDLE_MINUTES
+from pre_rentree_data import ScheduledSlot
+
+STATUS_CODES = ("NO_SHARED_DAY", "COMPACT", "LONG_IDLE", "SIMULTANEOUS")
+
+_MINUTES_PER_DAY = 24 * 60
+_PADDING = np.iinfo(np.int64).max // 2
+
+
+@dataclass(frozen=True)
+class BatchItineraryReport:
+    """One row per query, in query order."""
+
+    status_codes: np.ndarray  # index into STATUS_CODES
+    max_idle_minutes: np.ndarray
+    total_idle_minutes: np.ndarray
+    days_present: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.status_codes)
+
+    @property
+    def statuses(self) -> list[str]:
+        return [STATUS_CODES[code] for code in self.status_codes]
+
+
+class BatchItineraryEvaluator:
+    """Scores (level, subjects, cohort choice) queries against one session grid.
+
+    A query's cohort choice names one cohort_id per subject (None for a
+    subject's sessions without cohort), like the choices assign_itinerary()
+    enumerates. Each cohort's sessions are packed once into a padded row of
+    (date, start) keys and end minutes; evaluate() only gathers those rows.
+    """
+
+    def __init__(self, all_sessions: Sequence[ScheduledSlot]):
+        dates = sorted({s.date for s in all_sessions})
+        date_rank = {date: rank for rank, date in enumerate(dates)}
+        cohorts: dict[tuple, list[ScheduledSlot]] = {}
+        for session in all_sessions:
+            cohorts.setdefault((session.level, session.subject, session.cohort_id), []).append(session)
+
+        # Row 0 is an all-padding cohort, used to pad queries to equal width.
+        width = max((len(sessions) for sessions in cohorts.values()), default=1)
+        self._row = {key: row for row, key in enumerate(cohorts, start=1)}
+        self._keys = np.full((len(cohorts) + 1, width), _PADDING, dtype=np.int64)
+        self._ends = np.zeros((len(cohorts) + 1, width), dtype=np.int64)
+        for key, sessions in cohorts.items():
+            row = self._row[key]
+            for column, session in enumerate(sessions):
+                self._keys[row, column] = date_rank[session.date] * _MINUTES_PER_DAY + session.start_minutes
+                self._ends[row, column] = session.end_minutes
+
+    def cohort_row(self, level: str, subject: str, cohort_id: Optional[str]) -> int:
+        try:
+            return self._row[(level, subject, cohort_id)]
+        except KeyError:
+            raise ValueError(f"Missing campaign schedule for {level}/{subject} (cohort {cohort_id})") from None
+
+    def evaluate(self, queries: Sequence[tuple]) -> BatchItineraryReport:
+        """queries: (level, subjects, cohort_ids) with one cohort_id per subject."""
+        width = max((len(subjects) for _, subjects, _ in queries), default=1)
+        rows = np.zeros((len(queries), width), dtype=np.int64)
+        for q, (level, subjects, cohort_ids) in enumerate(queries):
+            if len(cohort_ids) != len(subjects):
+                raise ValueError(f"Query {q}: {len(subjects)} subjects but {len(cohort_ids)} cohort choices")
+            for column, (subject, cohort_id) in enumerate(zip(subjects, cohort_ids)):
+                rows[q, column] = self.cohort_row(level, subject, cohort_id)
+        return self.evaluate_rows(rows)
+
+    def evaluate_rows(self, rows: np.ndarray) -> BatchItineraryReport:
+        """Same as evaluate() for an int array of cohort rows (0 = none)."""
+        count = rows.shape[0]
+        keys = self._keys[rows].reshape(count, -1)
+        ends = self._ends[rows].reshape(count, -1)
+
+        order = np.argsort(keys, axis=1, kind="stable")
+        keys = np.take_along_axis(keys, order, axis=1)
+        ends = np.take_along_axis(ends, order, axis=1)
+        valid = keys < _PADDING
+        dates = np.where(valid, keys // _MINUTES_PER_DAY, -1)
+        starts = keys % _MINUTES_PER_DAY
+
+        same_day = valid[:, 1:] & valid[:, :-1] & (np.diff(dates, axis=1) == 0)
+        gaps = starts[:, 1:] - ends[:, :-1]
+        simultaneous = same_day & (gaps < 0)
+        idle = np.where(same_day & (gaps >= 0), gaps, 0)
+
+        any_simultaneous = simultaneous.any(axis=1)
+        any_long_idle = (idle > MAX_STUDENT_IDLE_MINUTES).any(axis=1)
+        any_shared_day = same_day.any(axis=1)
+        status_codes = np.where(
+            any_simultaneous, 3, np.where(any_long_idle, 2, np.where(any_shared_day, 1, 0))
+        ).astype(np.int8)
+        new_day = valid[:, 1:] & (np.diff(dates, axis=1) != 0)
+        return BatchItineraryReport(
+            status_codes=status_codes,
+            max_idle_minutes=idle.max(axis=1, initial=0),
+            total_idle_minutes=idle.sum(axis=1),
+            days_present=valid[:, 0].astype(np.int64) + new_day.sum(axis=1),
+        )
@@ -0,0 +1,298 @@
+"""Shared page rasterization and contact sheets for the PDF review tools.
+
+render_final_pdf_review, the parent and priority-resource kits,
+build_dossier_qa and document_audit each rasterized their pages serially and
+built a contact sheet by reopening every full-size PNG. PageRasterizer
+renders pages on a process pool: each worker writes the page PNG itself and
+sends back only its record (hash, size, text) and, when asked, its
+thumbnail. Thumbnails live in one LRU cache keyed by the page PNG's SHA-256,
+so contact_sheet() composes a sheet tile by tile from thumbnails and decodes
+a full page only on a cache miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import math
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+import fitz
+from PIL import Image, ImageDraw, ImageFont
+
+THUMBNAIL_MODES = ("fit", "pad", "stretch")
+DEFAULT_PAGE_NAME = "page-{page:02d}.png"
+
+
+@dataclass(frozen=True)
+class Thumbnail:
+    """fit: keep the aspect ratio within size; pad: fit, then centre on a white
+    canvas of exactly size; stretch: resize to exactly size."""
+
+    size: tuple[int, int]
+    mode: str = "fit"
+
+    def __post_init__(self) -> None:
+        if self.mode not in THUMBNAIL_MODES:
+            raise ValueError(f"Unknown thumbnail mode: {self.mode}")
+
+
+@dataclass(frozen=True)
+class PageRaster:
+    pdf: Path
+    page: int  # 1-based
+    path: Path
+    width: int
+    height: int
+    bytes: int
+    sha256: str
+    text: str
+
+
+def make_thumbnail(image: Image.Image, spec: Thumbnail) -> Image.Image:
+    image = image.convert("RGB")
+    if spec.mode == "stretch":
+        return image.resize(spec.size, Image.Resampling.LANCZOS)
+    image.thumbnail(spec.size, Image.Resampling.LANCZOS)
+    if spec.mode == "fit":
+        return image
+    canvas = Image.new("RGB", spec.size, "white")
+    canvas.paste(image, ((spec.size[0] - image.width) // 2, (spec.size[1] - image.height) // 2))
+    return canvas
+
+
+class ThumbnailCache:
+    """Thread-safe LRU of thumbnails keyed by page PNG SHA-256 and Thumbnail."""
+
+    def __init__(self, capacity: int = 512):
+        self.capacity = capacity
+        self._items: OrderedDict[tuple[str, Thumbnail], Image.Image] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sha256: str, spec: Thumbnail) -> Optional[Image.Image]:
+        with self._lock:
+            thumbnail = self._items.get((sha256, spec))
+            if thumbnail is not None:
+                self._items.move_to_end((sha256, spec))
+            return thumbnail
+
+    def put(self, sha256: str, spec: Thumbnail, thumbnail: Image.Image) -> None:
+        with self._lock:
+            self._items[(sha256, spec)] = thumbnail
+            self._items.move_to_end((sha256, spec))
+            while len(self._items) > self.capacity:
+                self._items.popitem(last=False)
+
+    def thumbnail(self, path: Path, spec: Thumbnail, sha256: Optional[str] = None) -> Image.Image:
+        """The cached thumbnail of a page PNG, made from the file on a miss."""
+        data = None
+        if sha256 is None:
+            data = Path(path).read_bytes()
+            sha256 = hashlib.sha256(data).hexdigest()
+        cached = self.get(sha256, spec)
+        if cached is not None:
+            return cached
+        with Image.open(io.BytesIO(data) if data is not None else path) as source:
+            thumbnail = make_thumbnail(source, spec)
+        self.put(sha256, spec, thumbnail)
+        return thumbnail
+
+
+THUMBNAILS = ThumbnailCache()
+
+# Worker-side: the document the worker rendered last, reused while its pages keep coming.
+_OPEN_DOCUMENT: dict[tuple[str, int, int], fitz.Document] = {}
+
+
+def _document(pdf: str) -> fitz.Document:
+    stat = os.stat(pdf)
+    key = (pdf, stat.st_mtime_ns, stat.st_size)
+    document = _OPEN_DOCUMENT.get(key)
+    if document is None:
+        _close_documents()
+        document = _OPEN_DOCUMENT[key] = fitz.open(pdf)
+    return document
+
+
+def _close_documents() -> None:
+    for document in _OPEN_DOCUMENT.values():
+        document.close()
+    _OPEN_DOCUMENT.clear()
+
+
+def _render_page(
+    pdf: str,
+    index: int,
+    destination: str,
+    zoom: float,
+    size: Optional[tuple[int, int]],
+    optimize: bool,
+    thumbnail: Optional[Thumbnail],
+) -> tuple[PageRaster, Optional[Image.Image]]:
+    page = _document(pdf)[index]
+    # MuPDF's resource store carries decoded fonts and images from page to
+    # page and they change the raster slightly; emptying it makes every page
+    # render as if alone, whichever worker and whichever pages came before.
+    fitz.TOOLS.store_shrink(100)
+    pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+    if size is not None:
+        image = image.resize(size, Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=optimize)
+    data = buffer.getvalue()
+    Path(destination).write_bytes(data)
+    raster = PageRaster(
+        pdf=Path(pdf),
+        page=index + 1,
+        path=Path(destination),
+        width=image.width,
+        height=image.height,
+        bytes=len(data),
+        sha256=hashlib.sha256(data).hexdigest(),
+        text=page.get_text(),
+    )
+    return raster, make_thumbnail(image, thumbnail) if thumbnail is not None else None
+
+
+class PageRasterizer:
+    """Render PDF pages to PNG files on a process pool.
+
+    Use as a context manager so the pool is shared by every document of a run;
+    outside one, or with workers=1, pages render in this process. Page order,
+    file names and PNG bytes do not depend on the worker count.
+    """
+
+    def __init__(self, workers: Optional[int] = None, cache: ThumbnailCache = THUMBNAILS):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.cache = cache
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "PageRasterizer":
+        if self.workers > 1:
+            # Workers are spawned: callers may run on threads of a larger build.
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        _close_documents()
+
+    def render_many(
+        self,
+        documents: Iterable[tuple[Path, Path]],
+        *,
+        zoom: float,
+        size: Optional[tuple[int, int]] = None,
+        name: str = DEFAULT_PAGE_NAME,
+        thumbnail: Optional[Thumbnail] = None,
+        optimize: bool = True,
+    ) -> list[list[PageRaster]]:
+        """Pages of every (pdf, directory) pair, all queued at once; one list
+        of records per document, in page order.
+
+        name is formatted with page, stem and digits (the page count's width),
+        e.g. "{stem}-{page:0{digits}d}.png" for pdftoppm-style names. size
+        resizes each page after rendering; thumbnail keeps one per page in the
+        cache for contact_sheet().
+        """
+        tasks: list[tuple] = []
+        counts: list[int] = []
+        for pdf, directory in documents:
+            pdf = Path(pdf).resolve()
+            directory = Path(directory)
+            directory.mkdir(parents=True, exist_ok=True)
+            with fitz.open(pdf) as document:
+                page_count = document.page_count
+            counts.append(page_count)
+            digits = len(str(page_count))
+            tasks += [
+                (
+                    str(pdf),
+                    index,
+                    str(directory / name.format(page=index + 1, stem=pdf.stem, digits=digits)),
+                    zoom,
+                    size,
+                    optimize,
+                    thumbnail,
+                )
+                for index in range(page_count)
+            ]
+        if self._pool is None:
+            results = [_render_page(*task) for task in tasks]
+            _close_documents()
+        else:
+            results = list(self._pool.map(_render_page, *zip(*tasks))) if tasks else []
+        rasters = []
+        for raster, image in results:
+            if image is not None:
+                self.cache.put(raster.sha256, thumbnail, image)
+            rasters.append(raster)
+        grouped, start = [], 0
+        for count in counts:
+            grouped.append(rasters[start:start + count])
+            start += count
+        return grouped
+
+    def render(self, pdf: Path, directory: Path, **options) -> list[PageRaster]:
+        return self.render_many([(pdf, directory)], **options)[0]
+
+
+@dataclass(frozen=True)
+class SheetLayout:
+    """A contact-sheet grid. Each cell holds a thumbnail box at thumbnail_offset
+    (thumbnails narrower than the box are centred in it) and a label at
+    label_offset; margin pads the grid on every side."""
+
+    columns: int
+    cell: tuple[int, int]
+    thumbnail: Thumbnail
+    thumbnail_offset: tuple[int, int] = (0, 0)
+    label_offset: tuple[int, int] = (0, 0)
+    background: str = "white"
+    label_fill: str = "black"
+    margin: int = 0
+
+
+def contact_sheet(
+    entries: Iterable[tuple[str, Path, Optional[str]]],
+    layout: SheetLayout,
+    font: ImageFont.ImageFont | ImageFont.FreeTypeFont | None = None,
+    cache: ThumbnailCache = THUMBNAILS,
+) -> Image.Image:
+    """Compose (label, page PNG, its SHA-256 or None) entries in order. Only
+    the sheet and one thumbnail at a time are held; a known SHA-256 lets a
+    cached thumbnail stand in for the page file."""
+    entries = list(entries)
+    cell_width, cell_height = layout.cell
+    rows = max(1, math.ceil(len(entries) / layout.columns))
+    sheet = Image.new(
+        "RGB",
+        (layout.columns * cell_width + layout.margin, rows * cell_height + layout.margin),
+        layout.background,
+    )
+    draw = ImageDraw.Draw(sheet)
+    font = font or ImageFont.load_default()
+    box_width = layout.thumbnail.size[0]
+    for index, (label, path, sha256) in enumerate(entries):
+        row, column = divmod(index, layout.columns)
+        left = layout.margin + column * cell_width
+        top = layout.margin + row * cell_height
+        thumbnail = cache.thumbnail(path, layout.thumbnail, sha256)
+        sheet.paste(
+            thumbnail,
+            (left + layout.thumbnail_offset[0] + (box_width - thumbnail.width) // 2, top + layout.thumbnail_offset[1]),
+        )
+        draw.text(
+            (left + layout.label_offset[0], top + layout.label_offset[1]), label, fill=layout.label_fill, font=font,
+        )
+    return sheet
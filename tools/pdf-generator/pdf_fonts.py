@@ -0,0 +1,96 @@
+"""In-process font inventory of a parsed PDF, shared by every PDF audit.
+
+document_audit used to spawn pdffonts per file while build_dossier_qa and
+verify_public_pdfs walked fonts with PyMuPDF, each with its own notion of a
+font. font_inventory() reads the page resource dictionaries (and the Form
+XObjects they draw) of a pypdf reader instead: pypdf parses lazily, so this
+touches only the font objects, never the content streams or the font
+programs. Names follow pdffonts: the /BaseFont with its subset prefix, or
+"[none]" for a font without one; Type 3 fonts count as embedded.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Iterator, NamedTuple, Optional
+
+from pypdf import PdfReader
+from pypdf.generic import IndirectObject
+
+SUBSET_PREFIX = re.compile(r"^[A-Z]{6}\+")
+FONT_FILE_KEYS = ("/FontFile", "/FontFile2", "/FontFile3")
+
+
+class PdfFont(NamedTuple):
+    page: int  # 1-based
+    base_font: str
+    font_type: str  # /Subtype, with the descendant CIDFont subtype for Type0
+    embedded: bool
+    subset: bool
+    object_id: Optional[int]  # None for a direct font dictionary
+
+
+def _resolved(value: Any) -> Any:
+    return value.get_object() if value is not None else None
+
+
+def _descendant(font: Any) -> Any:
+    descendants = _resolved(font.get("/DescendantFonts")) or []
+    return _resolved(descendants[0]) if descendants else {}
+
+
+def _font_type(font: Any) -> str:
+    subtype = str(font.get("/Subtype", "")).lstrip("/")
+    if subtype == "Type0":
+        return f"Type0/{str(_descendant(font).get('/Subtype', '')).lstrip('/')}"
+    return subtype
+
+
+def _embedded(font: Any) -> bool:
+    if font.get("/Subtype") == "/Type3":
+        return True
+    if font.get("/Subtype") == "/Type0":
+        font = _descendant(font)
+    descriptor = _resolved(font.get("/FontDescriptor")) or {}
+    return any(key in descriptor for key in FONT_FILE_KEYS)
+
+
+def _resource_fonts(resources: Any, seen_forms: set) -> Iterator[Any]:
+    resources = _resolved(resources) or {}
+    yield from (_resolved(resources.get("/Font")) or {}).values()
+    for reference in (_resolved(resources.get("/XObject")) or {}).values():
+        xobject = reference.get_object()
+        key = reference.idnum if isinstance(reference, IndirectObject) else id(xobject)
+        if xobject.get("/Subtype") != "/Form" or key in seen_forms:
+            continue
+        seen_forms.add(key)
+        yield from _resource_fonts(xobject.get("/Resources"), seen_forms)
+
+
+def font_inventory(reader: PdfReader) -> list[PdfFont]:
+    """One record per distinct font object used by each page, in page order."""
+    records: list[PdfFont] = []
+    for number, page in enumerate(reader.pages, start=1):
+        seen_fonts: set = set()
+        for reference in _resource_fonts(page.get("/Resources"), set()):
+            font = reference.get_object()
+            object_id = reference.idnum if isinstance(reference, IndirectObject) else None
+            key = object_id if object_id is not None else id(font)
+            if key in seen_fonts:
+                continue
+            seen_fonts.add(key)
+            base_font = str(font.get("/BaseFont", "")).lstrip("/") or "[none]"
+            records.append(PdfFont(
+                page=number,
+                base_font=base_font,
+                font_type=_font_type(font),
+                embedded=_embedded(font),
+                subset=bool(SUBSET_PREFIX.match(base_font)),
+                object_id=object_id,
+            ))
+    return records
+
+
+def font_names(inventory: list[PdfFont]) -> list[str]:
+    """Sorted distinct font names, as pdffonts lists them."""
+    return sorted({font.base_font for font in inventory})
@@ -11,14 +11,28 @@ to report explicitly (see GapReport below), never a reason to invent text.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
+import sys
 from dataclasses import dataclass
 from datetime import date as _date
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional, Union
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 
+SOURCE_FILES = (
+    "data/campaigns/pre-rentree-2026.json",
+    "data/pricing.canonical.json",
+    "content/pre-rentree-2026/modules.json",
+    "content/pre-rentree-2026/publication-decisions.owner.json",
+)
+# Compiled PreRentreeData state, reused while neither the sources nor this
+# module change (clean_artifacts.py removes it with the rest of .artifacts).
+COMPILED_CACHE_DIR = ".artifacts/pre-rentree-2026/cache"
+
 # Contact constants mirror lib/legal.ts (TypeScript canonical source); duplicated
 # here only because the PDF pipeline is Python and cannot import a TS module.
 # Keep in sync manually if lib/legal.ts ever changes these values.
@@ -84,8 +98,7 @@ def format_tnd(amount) -> str:
     return f"{amount:,}".replace(",", "&#8239;")
 
 
-@dataclass(frozen=True)
-class SubjectSession:
+class SubjectSession(NamedTuple):
     number: int
     title: str
     objective: str
@@ -113,21 +126,55 @@ class SubjectModule:
         return self.publication_status == "VALIDATED"
 
 
-@dataclass(frozen=True)
-class ScheduledSlot:
+def time_to_minutes(time: Union[str, int]) -> int:
+    """"HH:MM" -> minutes since midnight (minutes pass through unchanged)."""
+    if isinstance(time, int):
+        return time
+    h, m = time.split(":")
+    return int(h) * 60 + int(m)
+
+
+class _ScheduledSlotRecord(NamedTuple):
     level: str
     subject: str
     block: str
     room: str
     window_id: str
     window_label: str
-    start_time: str
-    end_time: str
+    start_minutes: int
+    end_minutes: int
     date: Optional[str] = None
     cohort_id: Optional[str] = None
     is_primary: Optional[bool] = None
 
 
+class ScheduledSlot(_ScheduledSlotRecord):
+    """One scheduled session as a compact immutable tuple: level and subject
+    codes are interned and times are kept as minutes since midnight. It is
+    still built with start_time/end_time strings, and those "HH:MM" strings
+    stay available as properties for the templates."""
+
+    __slots__ = ()
+
+    def __new__(
+        cls, level: str, subject: str, block: str, room: str, window_id: str, window_label: str,
+        start_time: Union[str, int], end_time: Union[str, int], date: Optional[str] = None,
+        cohort_id: Optional[str] = None, is_primary: Optional[bool] = None,
+    ):
+        return _ScheduledSlotRecord.__new__(
+            cls, sys.intern(level), sys.intern(subject), block, room, window_id, window_label,
+            time_to_minutes(start_time), time_to_minutes(end_time), date, cohort_id, is_primary,
+        )
+
+    @property
+    def start_time(self) -> str:
+        return f"{self.start_minutes // 60:02d}:{self.start_minutes % 60:02d}"
+
+    @property
+    def end_time(self) -> str:
+        return f"{self.end_minutes // 60:02d}:{self.end_minutes % 60:02d}"
+
+
 @dataclass(frozen=True)
 class SubjectIncompatibility:
     level: str
@@ -161,13 +208,30 @@ class LevelDossierData:
 class PreRentreeData:
     """Loads every canonical source exactly once and derives per-level data."""
 
-    def __init__(self, repo_root: Path = REPO_ROOT):
+    def __init__(self, repo_root: Path = REPO_ROOT, cache_dir: Optional[Path] = None):
+        """With `cache_dir`, the parsed sources and expanded schedule are
+        read from (or written to) a pickle keyed by the SHA-256 of every
+        source file and of this module, so a stale cache is never used."""
         self.repo_root = repo_root
-        self.campaign = self._load_json("data/campaigns/pre-rentree-2026.json")
-        self.pricing = self._load_json("data/pricing.canonical.json")
-        modules_doc = self._load_json("content/pre-rentree-2026/modules.json")
+        if cache_dir is None:
+            self._compile()
+            return
+        key = self._cache_key()
+        cache_path = Path(cache_dir) / f"pre-rentree-data-{key[:16]}.pickle"
+        state = self._read_cache(cache_path, key)
+        if state is not None:
+            self.__dict__.update(state)
+            return
+        self._compile()
+        self._write_cache(cache_path, key)
+
+    def _compile(self):
+        campaign_file, pricing_file, modules_file, decisions_file = SOURCE_FILES
+        self.campaign = self._load_json(campaign_file)
+        self.pricing = self._load_json(pricing_file)
+        modules_doc = self._load_json(modules_file)
         self._modules_raw = modules_doc["modules"]
-        decisions_doc = self._load_json("content/pre-rentree-2026/publication-decisions.owner.json")
+        decisions_doc = self._load_json(decisions_file)
         self.decisions = decisions_doc["decisions"]
         self.release_status = decisions_doc.get("releaseStatus")
         self.room_assignments_public = self.campaign["operationalGates"]["roomAssignmentsValidated"]
@@ -187,6 +251,34 @@ class PreRentreeData:
         self._block_times = {b["id"]: (b["startTime"], b["endTime"]) for b in self.campaign["blocks"]}
         self._slots, self._dated_slots = self._expand_schedule()
         self._modules_by_key = self._index_modules()
+        self._index_slots()
+
+    # ── compiled cache ─────────────────────────────────────────────────
+
+    def _cache_key(self) -> str:
+        digest = hashlib.sha256()
+        for path in (*(self.repo_root / relative for relative in SOURCE_FILES), Path(__file__)):
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_cache(cache_path: Path, key: str) -> Optional[dict]:
+        try:
+            with cache_path.open("rb") as handle:
+                cached_key, state = pickle.load(handle)
+        except Exception:  # an unreadable cache is never fatal: parse afresh
+            return None
+        return state if cached_key == key and isinstance(state, dict) else None
+
+    def _write_cache(self, cache_path: Path, key: str) -> None:
+        state = {name: value for name, value in vars(self).items() if name != "repo_root"}
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_path.parent.glob("pre-rentree-data-*.pickle"):
+            stale.unlink(missing_ok=True)
+        temporary = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with temporary.open("wb") as handle:
+            pickle.dump((key, state), handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_path)
 
     # ── loading helpers ────────────────────────────────────────────────
 
@@ -230,6 +322,55 @@ class PreRentreeData:
                     )
         return tuple(slots), tuple(dated)
 
+    def _index_slots(self):
+        """Every per-level lookup below, built in one pass over the expanded
+        schedule so accessors return cached tuples instead of rescanning."""
+        block_rank = "ABCD".index
+        by_level, dated_by_level, subjects = {}, {}, {}
+        by_subject, by_cohort, by_date_block = {}, {}, {}
+        level_date_block = {}
+        for slot in self._slots:
+            by_level.setdefault(slot.level, []).append(slot)
+            subjects.setdefault(slot.level, {}).setdefault(slot.subject, None)
+        for slot in self._dated_slots:
+            dated_by_level.setdefault(slot.level, []).append(slot)
+            by_subject.setdefault((slot.level, slot.subject), []).append(slot)
+            by_cohort.setdefault((slot.level, slot.cohort_id), []).append(slot)
+            by_date_block.setdefault((slot.date, slot.block), []).append(slot)
+            level_date_block.setdefault((slot.level, slot.date, slot.block), set()).add(slot.subject)
+
+        def dated_order(slot):
+            return (slot.date, block_rank(slot.block))
+
+        self._slots_by_level = {
+            level: tuple(sorted(slots, key=lambda s: (s.window_id, block_rank(s.block))))
+            for level, slots in by_level.items()
+        }
+        self._dated_slots_by_level = {
+            level: tuple(sorted(slots, key=dated_order)) for level, slots in dated_by_level.items()
+        }
+        self._subjects_by_level = {level: tuple(seen) for level, seen in subjects.items()}
+        self._dated_slots_by_subject = {
+            key: tuple(sorted(slots, key=dated_order)) for key, slots in by_subject.items()
+        }
+        self._dated_slots_by_cohort = {
+            key: tuple(sorted(slots, key=dated_order)) for key, slots in by_cohort.items()
+        }
+        self._dated_slots_by_date_block = {key: tuple(slots) for key, slots in by_date_block.items()}
+
+        pairs_by_level = {}
+        for (level, _, _), block_subjects in level_date_block.items():
+            if len(block_subjects) < 2:
+                continue
+            pairs = pairs_by_level.setdefault(level, {})
+            ordered = sorted(block_subjects)
+            for i in range(len(ordered)):
+                for j in range(i + 1, len(ordered)):
+                    pairs[(ordered[i], ordered[j])] = SubjectIncompatibility(
+                        level=level, subject_a=ordered[i], subject_b=ordered[j],
+                    )
+        self._incompatibilities_by_level = {level: tuple(pairs.values()) for level, pairs in pairs_by_level.items()}
+
     def _index_modules(self):
         index = {}
         for raw in self._modules_raw:
@@ -264,43 +405,32 @@ class PreRentreeData:
 
     def subjects_for_level(self, level: str) -> tuple:
         """Canonical subject list for a level, in first-appearance schedule order."""
-        seen = []
-        for slot in self._slots:
-            if slot.level == level and slot.subject not in seen:
-                seen.append(slot.subject)
-        return tuple(seen)
+        return self._subjects_by_level.get(level, ())
 
     def slots_for_level(self, level: str) -> tuple:
-        result = [s for s in self._slots if s.level == level]
-        result.sort(key=lambda s: (s.window_id, "ABCD".index(s.block)))
-        return tuple(result)
+        return self._slots_by_level.get(level, ())
 
     def dated_slots_for_level(self, level: str) -> tuple:
-        result = [s for s in self._dated_slots if s.level == level]
-        result.sort(key=lambda s: (s.date, "ABCD".index(s.block)))
-        return tuple(result)
+        return self._dated_slots_by_level.get(level, ())
+
+    def dated_slots_for_subject(self, level: str, subject_id: str) -> tuple:
+        """Every dated session of one subject (all cohorts), chronological."""
+        return self._dated_slots_by_subject.get((level, subject_id), ())
+
+    def dated_slots_for_cohort(self, level: str, cohort_id: Optional[str]) -> tuple:
+        """Dated sessions of one cohort; cohort_id None gathers every
+        single-cohort subject of the level."""
+        return self._dated_slots_by_cohort.get((level, cohort_id), ())
+
+    def dated_slots_at(self, date: str, block: str) -> tuple:
+        """All levels' sessions held on one date and block, in schedule order."""
+        return self._dated_slots_by_date_block.get((date, block), ())
 
     def incompatibilities_for_level(self, level: str) -> tuple:
         """Port of lib/campaigns/pre-rentree-2026/incompatibilities.ts:
         two subjects of the same level sharing a calendar date + time block
         cannot both be attended by the same student."""
-        by_date_block = {}
-        for slot in self._dated_slots:
-            if slot.level != level:
-                continue
-            key = (slot.date, slot.block)
-            by_date_block.setdefault(key, set()).add(slot.subject)
-        pairs = {}
-        for subjects in by_date_block.values():
-            if len(subjects) < 2:
-                continue
-            ordered = sorted(subjects)
-            for i in range(len(ordered)):
-                for j in range(i + 1, len(ordered)):
-                    pairs[(ordered[i], ordered[j])] = SubjectIncompatibility(
-                        level=level, subject_a=ordered[i], subject_b=ordered[j],
-                    )
-        return tuple(pairs.values())
+        return self._incompatibilities_by_level.get(level, ())
 
     def module_for(self, level: str, subject_id: str) -> Optional[SubjectModule]:
         return self._modules_by_key.get((level, subject_id))
@@ -365,3 +495,18 @@ class PreRentreeData:
             offer = next(o for o in self.foundations if o["level"] == level)
             return offer["group_min_open"], offer["group_max"]
         return self.premium_group_min, self.premium_group_max
+
+
+_SHARED_DATA: dict = {}
+
+
+def shared_data(repo_root: Path = REPO_ROOT) -> PreRentreeData:
+    """Process-wide PreRentreeData for `repo_root`, backed by the compiled
+    cache under COMPILED_CACHE_DIR. Every caller gets the same instance, so
+    it must be treated as read-only; sources edited mid-process are only
+    picked up by a fresh PreRentreeData()."""
+    root = Path(repo_root).resolve()
+    if root not in _SHARED_DATA:
+        _SHARED_DATA[root] = PreRentreeData(root, cache_dir=root / COMPILED_CACHE_DIR)
+    return _SHARED_DATA[root]
+
@@ -0,0 +1,114 @@
+"""Content-addressed cache of rendered PDFs, shared by both PDF pipelines.
+
+A render is keyed by the SHA-256 of everything that decides its bytes: the
+stabilized HTML with its inlined CSS, the bytes of every asset it references
+through the renderer's asset scheme, the WeasyPrint (and, for the review
+pipeline, qpdf) versions, the PDF identifier, the metadata and
+SOURCE_DATE_EPOCH. A hit copies the stored PDF instead of rendering. The store
+is bounded in bytes and evicts least-recently-used entries first (a hit
+refreshes the entry's mtime). It lives under .artifacts, so clean_artifacts.py
+empties it, and every CLI that uses it offers --no-cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CACHE_DIR = REPO_ROOT / ".artifacts/pre-rentree-2026/render-cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def weasyprint_version() -> str:
+    import weasyprint
+
+    return weasyprint.__version__
+
+
+@lru_cache(maxsize=None)
+def qpdf_version() -> str:
+    completed = subprocess.run(["qpdf", "--version"], check=True, capture_output=True, text=True)
+    return completed.stdout.splitlines()[0]
+
+
+@lru_cache(maxsize=None)
+def source_digest(path: Path) -> str:
+    """Digest of the module that renders: editing its options invalidates its entries."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def render_key(*parts: Union[bytes, str]) -> str:
+    """SHA-256 over length-prefixed parts, so no two part lists collide."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def referenced_asset_parts(html: str, scheme: str, resolve: Callable[[str], Optional[Path]]) -> list[bytes]:
+    """(name, sha256) of every `scheme`NAME asset the HTML references, sorted.
+    An unresolvable name is keyed as missing: the render itself will reject it."""
+    parts = []
+    for name in sorted(set(re.findall(re.escape(scheme) + r"([^\"')\s]+)", html))):
+        path = resolve(name)
+        digest = hashlib.sha256(path.read_bytes()).hexdigest() if path is not None and path.is_file() else "missing"
+        parts.append(f"{name}:{digest}".encode("utf-8"))
+    return parts
+
+
+class RenderCache:
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pdf"
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        """Copy the cached PDF to `destination` atomically; False on a miss."""
+        cached = self.path_for(key)
+        destination = Path(destination)
+        temporary = destination.with_name(f".{destination.name}.cache-{os.getpid()}")
+        try:
+            shutil.copyfile(cached, temporary)
+        except FileNotFoundError:
+            return False
+        os.replace(temporary, destination)
+        try:
+            os.utime(cached)
+        except FileNotFoundError:
+            pass  # evicted by a concurrent build after the copy
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        cached = self.path_for(key)
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        temporary = cached.with_name(f".{cached.name}.tmp-{os.getpid()}")
+        shutil.copyfile(source, temporary)
+        os.replace(temporary, cached)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.root.glob("*/*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, path.name, stat.st_size, path))
+        total = sum(size for _, _, size, _ in entries)
+        for _, _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
@@ -24,11 +24,15 @@ def public_pdf_asset_url(name: str) -> str:
     return f"{PUBLIC_PDF_ASSET_SCHEME}{name}"
 
 
+def public_pdf_asset_path(name: str) -> Path | None:
+    return _ASSETS.get(name)
+
+
 def fetch_public_pdf_asset(url: str) -> URLFetcherResponse:
     if not url.startswith(PUBLIC_PDF_ASSET_SCHEME):
         raise ValueError(f"Network or unknown public PDF asset URL rejected: {url}")
     name = url.removeprefix(PUBLIC_PDF_ASSET_SCHEME)
-    path = _ASSETS.get(name)
+    path = public_pdf_asset_path(name)
     if path is None or not path.is_file():
         raise ValueError(f"Unknown public PDF asset: {name}")
     mime_type = mimetypes.guess_type(name)[0] or "application/octet-stream"